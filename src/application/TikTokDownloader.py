@@ -23,7 +23,7 @@ from src.custom import (
     VERSION_MINOR,
 )
 from src.manager import Database, DownloadRecorder
-from src.module import Cookie, Register
+from src.module import Cookie, LiveRecorder, Register
 from src.record import BaseLogger, LoggerManager
 from src.tools import (
     Browser,
@@ -36,6 +36,7 @@ from src.tools import (
 )
 from src.translation import _, switch_language
 
+from .main_monitor import LiveMonitor
 from .main_server import APIServer
 from .main_terminal import TikTok
 from .main_scheduler import ScheduledDownloader
@@ -61,6 +62,7 @@ class TikTokDownloader:
         self.console = ColorfulConsole()
         self.logger = None
         self.recorder = None
+        self.live_recorder = LiveRecorder()
         self.settings = Settings(PROJECT_ROOT, self.console)
         self.event = Event()
         self.cookie = Cookie(self.settings, self.console)
@@ -97,6 +99,9 @@ class TikTokDownloader:
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
+        if self.recorder:
+            await self.recorder.close()
+        await self.live_recorder.close()
         await self.database.__aexit__(exc_type, exc_val, exc_tb)
         if self.parameter:
             await self.parameter.close_client()
@@ -114,7 +119,7 @@ class TikTokDownloader:
             (_("从剪贴板读取 Cookie (TikTok)"), self.write_cookie_tiktok),
             (_("从浏览器读取 Cookie (TikTok)"), self.browser_cookie_tiktok),
             (_("终端交互模式"), self.complete),
-            (_("后台监测模式"), self.disable_function),
+            (_("后台监测模式"), self.monitor),
             (_("Web API 模式"), self.server),
             (_("Web UI 模式"), self.disable_function),
             # (_("Web API 模式"), self.__api_object),
@@ -142,6 +147,16 @@ class TikTokDownloader:
             "该功能正在重构，未来开发完成重新开放！",
         )
 
+    async def monitor(self):
+        """监听直播间并自动录制直播"""
+        try:
+            await LiveMonitor(
+                self.parameter,
+                self.database,
+            ).run()
+        except KeyboardInterrupt:
+            self.running = False
+
     async def server(self):
         try:
             self.console.print(
@@ -381,6 +396,7 @@ class TikTokDownloader:
             console=self.console,
             **self.settings.read(),
             recorder=self.recorder,
+            live_recorder=self.live_recorder,
         )
         self.parameter.set_headers_cookie()
         # self.restart_cycle_task(
@@ -1,12 +1,26 @@
+from asyncio import CancelledError, Semaphore, create_task, gather, sleep, to_thread
+from contextlib import suppress
+from random import uniform
+from time import monotonic
+from types import SimpleNamespace
 from typing import TYPE_CHECKING
 
+from ..custom import (
+    LIVE_MONITOR_BACKOFF,
+    LIVE_MONITOR_MAX_INTERVAL,
+    LIVE_MONITOR_MIN_INTERVAL,
+    LIVE_MONITOR_USER_INTERVAL,
+    LIVE_MONITOR_WORKERS,
+)
+from ..interface.user import User
+from ..translation import _
 from .main_terminal import TikTok
 
 if TYPE_CHECKING:
     from ..config import Parameter
     from ..manager import Database
 
-__all__ = ["ClipboardMonitor", "PostMonitor"]
+__all__ = ["ClipboardMonitor", "PostMonitor", "LiveMonitor"]
 
 
 class ClipboardMonitor(TikTok):
@@ -31,3 +45,179 @@ class PostMonitor(TikTok):
             parameter,
             database,
         )
+
+
+class LiveMonitor(TikTok):
+    """监听 live_urls 参数的抖音直播间，开播后自动录制直播
+
+    直播间链接通过直播间接口检测状态，未开播时检测间隔逐渐延长，直播结束后恢复最短检测间隔；
+    账号链接通过账号接口检测开播状态，开播后才请求直播间接口，检测间隔固定为较短的间隔
+    """
+
+    def __init__(
+        self,
+        parameter: "Parameter",
+        database: "Database",
+    ):
+        super().__init__(
+            parameter,
+            database,
+        )
+        self.rooms: dict[str, SimpleNamespace] = {}
+        self.semaphore = Semaphore(LIVE_MONITOR_WORKERS)
+
+    async def run(self, *args):
+        if not self.ffmpeg:
+            self.logger.warning(_("程序未检测到有效的 ffmpeg，不支持直播下载功能！"))
+            return
+        if not self.parameter.download:
+            self.logger.warning(_("download 参数已设置为 false，无法录制直播"))
+            return
+        if not self.parameter.live_urls:
+            self.logger.warning(_("未设置 live_urls 参数，无法监听直播间"))
+            return
+        await self.generate_rooms()
+        if not self.rooms:
+            self.logger.warning(_("提取 web_rid 或者 sec_user_id 失败！"))
+            return
+        task = create_task(self.monitor())
+        # 在线程中等待用户输入，监听与录制任务在等待期间继续运行
+        await to_thread(
+            self.console.input,
+            _("正在监听 {count} 个直播间，直接回车停止监听: ").format(
+                count=len(self.rooms)
+            ),
+        )
+        task.cancel()
+        with suppress(CancelledError):
+            await task
+        self.logger.info(_("已停止监听直播间，正在进行的录制任务不受影响"))
+
+    async def generate_rooms(self) -> None:
+        for item in self.parameter.live_urls:
+            text = await self.links.run(item.url, type_="")
+            rid, ids = self.links.live(text)
+            if rid:
+                for i in ids:
+                    self.__add_room(f"web_rid:{i}", item.mark, web_rid=i)
+                continue
+            # 直播分享链接的 room_id 仅对本场直播有效，改为监听主播账号
+            for i in [j for __, j in ids if j] or self.links.user(text):
+                self.__add_room(f"sec_user_id:{i}", item.mark, sec_user_id=i)
+        total = len(self.rooms)
+        now = monotonic()
+        for index, room in enumerate(self.rooms.values()):
+            # 首次检测在最短检测间隔内均匀错开，避免同时发送请求
+            room.due = now + room.min_interval * index / total
+
+    def __add_room(
+        self,
+        id_: str,
+        mark: str,
+        web_rid: str = None,
+        sec_user_id: str = None,
+    ) -> None:
+        # 账号接口请求开销较小，使用固定的检测间隔以便及时录制
+        min_interval, max_interval = (
+            (LIVE_MONITOR_USER_INTERVAL, LIVE_MONITOR_USER_INTERVAL)
+            if sec_user_id
+            else (LIVE_MONITOR_MIN_INTERVAL, LIVE_MONITOR_MAX_INTERVAL)
+        )
+        self.rooms[id_] = SimpleNamespace(
+            id=id_,
+            mark=mark or id_,
+            web_rid=web_rid,
+            sec_user_id=sec_user_id,
+            min_interval=min_interval,
+            max_interval=max_interval,
+            interval=min_interval,
+            due=0,
+            live=False,
+            recording=None,
+        )
+
+    async def monitor(self) -> None:
+        while True:
+            now = monotonic()
+            if due := [i for i in self.rooms.values() if i.due <= now]:
+                await gather(*(self.check_room(i) for i in due))
+            await sleep(max(min(i.due for i in self.rooms.values()) - monotonic(), 0))
+
+    async def check_room(self, room: SimpleNamespace) -> None:
+        if room.recording and not room.recording.task.done():
+            # 录制期间由录制任务处理连接中断，无需请求直播间数据
+            room.interval = room.min_interval
+        else:
+            try:
+                async with self.semaphore:
+                    live, item = await self.get_room_data(room)
+            except Exception as e:
+                self.logger.error(
+                    _("检测直播间 {mark} 状态失败: {error}").format(
+                        mark=room.mark, error=repr(e)
+                    )
+                )
+                live, item = None, None
+            if live:
+                # 手动停止的录制任务在本场直播结束前不再重新录制
+                if not (room.recording and room.recording.status == "stopped"):
+                    await self.record_room(room, item)
+                room.interval = room.min_interval
+            elif live is None or not room.live:
+                room.interval = min(
+                    room.interval * LIVE_MONITOR_BACKOFF,
+                    room.max_interval,
+                )
+            else:
+                self.logger.info(_("直播间 {mark} 直播已结束").format(mark=room.mark))
+                room.recording = None
+                room.interval = room.min_interval
+            if live is not None:
+                room.live = live
+        room.due = monotonic() + room.interval * uniform(0.9, 1.1)
+
+    async def get_room_data(self, room: SimpleNamespace) -> tuple[bool | None, dict]:
+        """返回开播状态与直播数据，获取数据失败时开播状态为 None"""
+        if room.web_rid:
+            data = await self.get_live_data(web_rid=room.web_rid)
+        else:
+            if not (
+                user := await User(self.parameter, sec_user_id=room.sec_user_id).run()
+            ):
+                return None, {}
+            if user.get("live_status") != 1 or not user.get("room_id"):
+                return False, {}
+            data = await self.get_live_data(
+                room_id=str(user["room_id"]),
+                sec_user_id=room.sec_user_id,
+            )
+        if not data:
+            return None, {}
+        item = (await self.extractor.run([data], None, "live"))[0]
+        return item["status"] == 2, item
+
+    async def record_room(self, room: SimpleNamespace, item: dict) -> None:
+        if not (urls := self.choice_live_quality(item)):
+            self.logger.warning(
+                _("直播间 {mark} 未找到直播推流地址").format(mark=room.mark)
+            )
+            return
+        self.logger.info(
+            _("直播间 {mark} 已开播，开始录制直播 {title}").format(
+                mark=room.mark, title=item["title"]
+            )
+        )
+        if recordings := await self.downloader.run_live([(item, *urls)]):
+            room.recording = recordings[0]
+
+    def choice_live_quality(self, item: dict) -> tuple[str, str] | None:
+        """按照 live_qualities 参数选择清晰度，未设置或者无效时选择最高清晰度"""
+        flv_items, m3u8_items = item["flv_pull_url"], item["hls_pull_url_map"]
+        if not flv_items:
+            return None
+        keys = list(flv_items)
+        key = quality if (quality := self.parameter.live_qualities) in keys else None
+        if not key and quality.isdigit() and 0 < int(quality) <= len(keys):
+            key = keys[int(quality) - 1]
+        key = key or keys[0]
+        return flv_items[key], m3u8_items.get(key) or flv_items[key]
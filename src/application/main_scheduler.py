@@ -1,8 +1,12 @@
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
+from apscheduler.triggers.combining import OrTrigger
 from apscheduler.triggers.cron import CronTrigger
 import asyncio
-from datetime import datetime
+from datetime import datetime, timedelta
+from time import time
+from types import SimpleNamespace
 from typing import TYPE_CHECKING, List, Tuple
+from ..custom import SCHEDULE_MISFIRE, SCHEDULE_SPREAD, SCHEDULE_WORKERS
 from ..translation import _
 
 if TYPE_CHECKING:
@@ -14,15 +18,29 @@ __all__ = ["ScheduledDownloader"]
 
 
 class ScheduledDownloader:
-    """定时下载器类，用于管理定时下载任务"""
+    """定时下载器类，用于管理定时下载任务
+    
+    每个账号、合集与收藏作品均为独立的定时任务，任务之间互不影响
+    """
     
     def __init__(self, parameter: "Parameter", database: "Database"):
         self.parameter = parameter
         self.database = database
         self.console = parameter.console
         self.logger = parameter.logger
-        self.scheduler = AsyncIOScheduler()
+        self.scheduler = AsyncIOScheduler(
+            job_defaults={
+                "max_instances": 1,  # 上次执行未结束时跳过本次执行，避免重复下载
+                "coalesce": True,  # 错过多次执行时仅补充执行一次
+                "misfire_grace_time": SCHEDULE_MISFIRE,
+            }
+        )
         self.running = False
+        self.app: "TikTok | None" = None  # 所有定时任务共用的 TikTok 对象
+        self.semaphore = asyncio.Semaphore(SCHEDULE_WORKERS)
+        self.sources: dict[str, SimpleNamespace] = {}
+        self.metrics: dict[str, SimpleNamespace] = {}
+        self.restore_task: asyncio.Task | None = None
         
         # 尝试从配置文件读取时间设置
         self.schedule_times = self._load_schedule_config()
@@ -37,23 +55,33 @@ class ScheduledDownloader:
             # 清除所有现有任务
             self.scheduler.remove_all_jobs()
             
-            # 为每个时间点添加定时任务
-            for i, (hour, minute) in enumerate(self.schedule_times):
-                trigger = CronTrigger(hour=hour, minute=minute)
+            # 为每个下载对象添加定时任务，执行时间在 SCHEDULE_SPREAD 秒内均匀错开
+            self.sources = self._generate_sources()
+            total = len(self.sources)
+            for index, (id_, source) in enumerate(self.sources.items()):
                 self.scheduler.add_job(
-                    self._execute_download_tasks,
-                    trigger=trigger,
-                    id=f"download_task_{i}",
-                    name=f"定时下载任务 {hour:02d}:{minute:02d}"
+                    self._run_job,
+                    trigger=OrTrigger(
+                        [
+                            CronTrigger(hour=h, minute=m, second=s)
+                            for h, m, s in self._generate_slots(index, total)
+                        ]
+                    ),
+                    args=(id_,),
+                    id=id_,
+                    name=source.name,
                 )
             
             # 启动调度器
             self.scheduler.start()
             self.running = True
+            self.restore_task = asyncio.create_task(self._restore_metrics())
             
             time_str = ", ".join([f"{h:02d}:{m:02d}" for h, m in self.schedule_times])
             self.console.print(
-                _("定时下载器已启动，将在每天 {times} 执行下载任务").format(times=time_str),
+                _("定时下载器已启动，将在每天 {times} 执行 {count} 个下载任务").format(
+                    times=time_str, count=total
+                ),
                 style="green"
             )
             
@@ -69,60 +97,169 @@ class ScheduledDownloader:
             
         try:
             self.scheduler.shutdown(wait=False)
+            if self.restore_task:
+                self.restore_task.cancel()
             self.running = False
             self.console.print(_("定时下载器已停止"), style="yellow")
         except Exception as e:
             self.logger.error(_("停止定时下载器失败: {error}").format(error=str(e)))
             
-    async def _execute_download_tasks(self):
-        """执行异步下载任务"""
-        try:
+    def _generate_sources(self) -> dict[str, SimpleNamespace]:
+        """将配置文件中的账号、合集与收藏作品拆分为独立的定时任务"""
+        sources = {}
+        for data in self.parameter.accounts_urls:
+            sources[f"account:{data.url}"] = SimpleNamespace(
+                type="account",
+                name=_("账号 {mark}").format(mark=data.mark or data.url),
+                data=data,
+            )
+        for data in self.parameter.mix_urls:
+            sources[f"mix:{data.url}"] = SimpleNamespace(
+                type="mix",
+                name=_("合集 {mark}").format(mark=data.mark or data.url),
+                data=data,
+            )
+        if self.parameter.owner_url.url:
+            sources["collection"] = SimpleNamespace(
+                type="collection",
+                name=_("收藏作品"),
+                data=self.parameter.owner_url,
+            )
+        return sources
+        
+    def _generate_slots(self, index: int, total: int) -> list[tuple[int, int, int]]:
+        """计算第 index 个任务的每日执行时间，返回 (时, 分, 秒)"""
+        offset = SCHEDULE_SPREAD * index // max(total, 1)
+        slots = []
+        for hour, minute in self.schedule_times:
+            seconds = (hour * 3600 + minute * 60 + offset) % 86400
+            slots.append((seconds // 3600, seconds % 3600 // 60, seconds % 60))
+        return slots
+        
+    def _previous_run_time(self, index: int, total: int) -> float:
+        """计算第 index 个任务最近一次应当执行的时间戳"""
+        now = datetime.now()
+        today = now.replace(hour=0, minute=0, second=0, microsecond=0)
+        result = 0.0
+        for hour, minute, second in self._generate_slots(index, total):
+            slot = today + timedelta(hours=hour, minutes=minute, seconds=second)
+            if slot > now:
+                slot -= timedelta(days=1)
+            result = max(result, slot.timestamp())
+        return result
+        
+    async def _restore_metrics(self):
+        """读取已保存的任务运行状态，补充执行停止期间错过的任务"""
+        for row in await self.database.read_schedule_data():
+            self.metrics[row["ID"]] = SimpleNamespace(
+                last_run=row["LAST_RUN"],
+                duration=row["DURATION"],
+                runs=row["RUNS"],
+                failures=row["FAILURES"],
+                status=row["STATUS"],
+            )
+        total = len(self.sources)
+        for index, id_ in enumerate(self.sources):
+            if (
+                metric := self.metrics.get(id_)
+            ) and metric.last_run < self._previous_run_time(index, total):
+                self.logger.info(
+                    _("定时任务 {name} 错过了上次执行，即将补充执行").format(
+                        name=self.sources[id_].name
+                    )
+                )
+                self.scheduler.modify_job(id_, next_run_time=datetime.now())
+                
+    async def _run_job(self, id_: str):
+        """执行单个定时任务，单个任务失败不影响其他任务"""
+        if not (source := self.sources.get(id_)):
+            return
+        async with self.semaphore:
+            metric = self.metrics.setdefault(
+                id_,
+                SimpleNamespace(
+                    last_run=0.0, duration=0.0, runs=0, failures=0, status=""
+                ),
+            )
+            metric.status = "running"
+            start = time()
             self.console.print(
-                _("开始执行定时下载任务 - {time}").format(
-                    time=datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                _("开始执行定时下载任务：{name} - {time}").format(
+                    name=source.name,
+                    time=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
                 ),
                 style="blue"
             )
+            try:
+                success = await self._execute_source(source)
+            except Exception as e:
+                self.logger.error(
+                    _("定时下载任务 {name} 执行失败: {error}").format(
+                        name=source.name, error=str(e)
+                    )
+                )
+                success = False
+            metric.last_run = start
+            metric.duration = time() - start
+            metric.runs += 1
+            metric.failures += not success
+            metric.status = "success" if success else "failed"
+            await self.database.update_schedule_data(
+                id_,
+                source.name,
+                metric.last_run,
+                metric.duration,
+                metric.runs,
+                metric.failures,
+                metric.status,
+            )
             
+    async def _execute_source(self, source: SimpleNamespace) -> bool:
+        """下载单个账号、合集或收藏作品"""
+        if not self.app:
             from .main_terminal import TikTok
             
-            # 创建TikTok实例
-            tiktok = TikTok(self.parameter, self.database)
-            
-            # 1. 批量下载账号作品
-            if self.parameter.accounts_urls:
-                self.console.print(_("正在执行：批量下载账号作品"), style="cyan")
-                await tiktok.account_detail_batch()
-                
-            # 2. 批量下载合集作品
-            if self.parameter.mix_urls:
-                self.console.print(_("正在执行：批量下载合集作品"), style="cyan")
-                await tiktok.mix_batch()
-                
-            # 3. 批量下载收藏作品
-            if self.parameter.owner_url:
-                self.console.print(_("正在执行：批量下载收藏作品"), style="cyan")
-                await tiktok.collection_interactive()
-                
-            self.console.print(_("定时下载任务执行完成"), style="green")
-            
-        except Exception as e:
-            self.logger.error(_("定时下载任务执行失败: {error}").format(error=str(e)))
-            self.console.warning(_("定时下载任务执行失败: {error}").format(error=str(e)))
+            self.app = TikTok(self.parameter, self.database)
+        match source.type:
+            case "account":
+                return await self.app.account_detail_single(source.data)
+            case "mix":
+                return await self.app.mix_detail_single(source.data)
+            case "collection":
+                await self.app.collection_interactive()
+                return True
+        return False
             
     def get_status(self) -> str:
         """获取定时器状态"""
         if self.running:
             time_str = ", ".join([f"{h:02d}:{m:02d}" for h, m in self.schedule_times])
             jobs_info = []
-            for job in self.scheduler.get_jobs():
+            for job in sorted(
+                self.scheduler.get_jobs(),
+                key=lambda x: x.next_run_time.timestamp() if x.next_run_time else float("inf"),
+            ):
                 next_run = job.next_run_time
-                if next_run:
-                    jobs_info.append(f"  - {job.name}: {next_run.strftime('%Y-%m-%d %H:%M:%S')}")
+                next_run = next_run.strftime('%Y-%m-%d %H:%M:%S') if next_run else "-"
+                if metric := self.metrics.get(job.id):
+                    jobs_info.append(
+                        _(
+                            "  - {name}: 下次执行 {next_run}，已执行 {runs} 次，失败 {failures} 次，上次耗时 {duration:.1f} 秒，状态 {status}"
+                        ).format(
+                            name=job.name,
+                            next_run=next_run,
+                            runs=metric.runs,
+                            failures=metric.failures,
+                            duration=metric.duration,
+                            status=metric.status,
+                        )
+                    )
+                else:
+                    jobs_info.append(f"  - {job.name}: {next_run}")
             
             status = _("定时下载器正在运行\n执行时间: 每天 {times}").format(times=time_str)
             if jobs_info:
-                status += "\n" + _("下次执行:") + "\n" + "\n".join(jobs_info)
+                status += "\n" + _("下载任务:") + "\n" + "\n".join(jobs_info)
             return status
         else:
             return _("定时下载器未运行")
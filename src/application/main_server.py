@@ -1,12 +1,15 @@
+from datetime import datetime
+from json import dumps, loads
 from typing import TYPE_CHECKING
 
-from fastapi import Depends, FastAPI, Header, HTTPException
-from fastapi.responses import RedirectResponse
+from fastapi import Depends, FastAPI, Header, HTTPException, Query
+from fastapi.responses import RedirectResponse, Response, StreamingResponse
 from uvicorn import Config, Server
 from textwrap import dedent
 
 from ..custom import (
     __VERSION__,
+    API_JOB_PAGE_SIZE,
     REPOSITORY,
     SERVER_HOST,
     SERVER_PORT,
@@ -17,12 +20,15 @@ from ..models import (
     GeneralSearch,
     LiveSearch,
     DataResponse,
+    JobResponse,
     UserSearch,
     VideoSearch,
     Settings,
     ShortUrl,
     UrlResponse,
     Detail,
+    DetailBatch,
+    DetailBatchTikTok,
     Account,
     AccountTiktok,
     DetailTikTok,
@@ -33,6 +39,8 @@ from ..models import (
     Live,
     LiveTikTok,
 )
+from ..interface import API
+from ..manager import JobQueue, ResponseCache
 from ..translation import _
 from .main_terminal import TikTok
 
@@ -62,6 +70,8 @@ class APIServer(TikTok):
             database,
         )
         self.server = None
+        self.jobs = JobQueue(database, self.logger)
+        self.response_cache = ResponseCache(database)
 
     async def handle_redirect(self, text: str, proxy: str = None) -> str:
         return await self.links.run(
@@ -96,7 +106,12 @@ class APIServer(TikTok):
             log_level=log_level,
         )
         server = Server(config)
-        await server.serve()
+        await self.jobs.start()
+        await self.response_cache.clear_expired()
+        try:
+            await server.serve()
+        finally:
+            await self.jobs.close()
 
     def setup_routes(self):
         @self.server.get(
@@ -159,6 +174,84 @@ class APIServer(TikTok):
         async def get_settings(token: str = Depends(token_dependency)):
             return Settings(**self.parameter.get_settings_data())
 
+        @self.server.get(
+            "/cache",
+            summary=_("获取响应缓存统计数据"),
+            description=_(
+                dedent("""
+                作品、账号与搜索接口的响应头 `X-Cache` 为缓存状态：
+                
+                - `HIT`：命中缓存
+                - `MISS`：请求数据
+                - `SHARED`：与同时到达的相同请求共用数据
+                - `BYPASS`：未启用缓存
+                """)
+            ),
+            tags=[_("项目")],
+            response_model=DataResponse,
+        )
+        async def get_cache(token: str = Depends(token_dependency)):
+            return DataResponse(
+                message=_("获取数据成功！"),
+                data=self.response_cache.metrics(),
+                params=None,
+            )
+
+        @self.server.delete(
+            "/cache",
+            summary=_("清空响应缓存"),
+            tags=[_("项目")],
+            response_model=DataResponse,
+        )
+        async def delete_cache(token: str = Depends(token_dependency)):
+            await self.response_cache.clear()
+            return DataResponse(
+                message=_("缓存已清空"),
+                data=self.response_cache.metrics(),
+                params=None,
+            )
+
+        @self.server.get(
+            "/live/recordings",
+            summary=_("获取直播录制任务状态"),
+            description=_(
+                dedent("""
+                录制任务状态：`waiting`、`recording`、`reconnecting`、`finished`、`failed`、`stopped`
+                
+                `size` 为已录制的文件大小，单位：字节；`segments` 为已完成的分段文件路径
+                """)
+            ),
+            tags=[_("项目")],
+            response_model=DataResponse,
+        )
+        async def get_live_recordings(token: str = Depends(token_dependency)):
+            return DataResponse(
+                message=_("获取数据成功！"),
+                data=self.parameter.live_recorder.status(),
+                params=None,
+            )
+
+        @self.server.delete(
+            "/live/recordings/{recording_id}",
+            summary=_("停止直播录制任务"),
+            tags=[_("项目")],
+            response_model=DataResponse,
+        )
+        async def delete_live_recording(
+            recording_id: str, token: str = Depends(token_dependency)
+        ):
+            if await self.parameter.live_recorder.stop(recording_id):
+                return DataResponse(
+                    message=_("已停止录制任务 {id}").format(id=recording_id),
+                    data=self.parameter.live_recorder.status(),
+                    params=None,
+                )
+            return DataResponse(
+                message=_("录制任务 {id} 不存在或已结束").format(id=recording_id),
+                data=None,
+                params=None,
+            )
+
         @self.server.post(
             "/douyin/share",
             summary=_("获取分享链接重定向的完整链接"),
@@ -205,9 +298,34 @@ class APIServer(TikTok):
             response_model=DataResponse,
         )
         async def handle_detail(
-            extract: Detail, token: str = Depends(token_dependency)
+            extract: Detail,
+            response: Response,
+            token: str = Depends(token_dependency),
         ):
-            return await self.handle_detail(extract, False)
+            return await self.handle_detail(extract, response, False)
+
+        @self.server.post(
+            "/douyin/detail/batch",
+            summary=_("批量获取作品数据"),
+            description=_(
+                dedent("""
+                **参数**:
+                
+                - **cookie**: 抖音 Cookie；可选参数
+                - **proxy**: 代理；可选参数
+                - **source**: 是否返回原始响应数据；可选参数，默认值：False
+                - **detail_ids**: 抖音作品 ID 列表；必需参数
+                
+                并发获取作品数据，以 NDJSON 格式按获取完成的顺序逐行返回，每行包含 `detail_id` 与 `data`，获取失败时 `data` 为 `null`
+                """)
+            ),
+            tags=[_("抖音")],
+            response_class=StreamingResponse,
+        )
+        async def handle_detail_batch(
+            extract: DetailBatch, token: str = Depends(token_dependency)
+        ):
+            return self.stream_detail(extract, False)
 
         @self.server.post(
             "/douyin/account",
@@ -232,9 +350,11 @@ class APIServer(TikTok):
             response_model=DataResponse,
         )
         async def handle_account(
-            extract: Account, token: str = Depends(token_dependency)
+            extract: Account,
+            response: Response,
+            token: str = Depends(token_dependency),
         ):
-            return await self.handle_account(extract, False)
+            return await self.handle_account(extract, response, False)
 
         @self.server.post(
             "/douyin/mix",
@@ -258,29 +378,63 @@ class APIServer(TikTok):
             response_model=DataResponse,
         )
         async def handle_mix(extract: Mix, token: str = Depends(token_dependency)):
-            is_mix, id_ = self.generate_mix_params(
-                extract.mix_id,
-                extract.detail_id,
-            )
-            if not isinstance(is_mix, bool):
+            if not self.check_mix_params(extract):
                 return DataResponse(
                     message=_("参数错误！"),
                     data=None,
                     params=extract.model_dump(),
                 )
-            if data := await self.deal_mix_detail(
-                is_mix,
-                id_,
-                api=True,
-                source=extract.source,
-                cookie=extract.cookie,
-                proxy=extract.proxy,
-                cursor=extract.cursor,
-                count=extract.count,
-            ):
+            if data := await self.deal_mix_api(extract):
                 return self.success_response(extract, data)
             return self.failed_response(extract)
 
+        @self.server.post(
+            "/douyin/account/job",
+            summary=_("提交获取账号作品数据的后台任务"),
+            description=_(
+                dedent("""
+                参数与 `/douyin/account` 接口相同
+                
+                立即返回任务 ID，通过 `/job/{job_id}` 接口查询任务状态，通过 `/job/{job_id}/result` 接口分页获取数据
+                """)
+            ),
+            tags=[_("抖音")],
+            response_model=JobResponse,
+        )
+        async def handle_account_job(
+            extract: Account, token: str = Depends(token_dependency)
+        ):
+            return await self.submit_job(
+                "account",
+                extract,
+                lambda: self.deal_account_api(extract, False),
+            )
+
+        @self.server.post(
+            "/douyin/mix/job",
+            summary=_("提交获取合集作品数据的后台任务"),
+            description=_(
+                dedent("""
+                参数与 `/douyin/mix` 接口相同
+                
+                立即返回任务 ID，通过 `/job/{job_id}` 接口查询任务状态，通过 `/job/{job_id}/result` 接口分页获取数据
+                """)
+            ),
+            tags=[_("抖音")],
+            response_model=JobResponse,
+        )
+        async def handle_mix_job(extract: Mix, token: str = Depends(token_dependency)):
+            if not self.check_mix_params(extract):
+                return JobResponse(
+                    message=_("参数错误！"),
+                    params=extract.model_dump(),
+                )
+            return await self.submit_job(
+                "mix",
+                extract,
+                lambda: self.deal_mix_api(extract),
+            )
+
         @self.server.post(
             "/douyin/live",
             summary=_("获取直播数据"),
@@ -417,9 +571,11 @@ class APIServer(TikTok):
             response_model=DataResponse,
         )
         async def handle_search_general(
-            extract: GeneralSearch, token: str = Depends(token_dependency)
+            extract: GeneralSearch,
+            response: Response,
+            token: str = Depends(token_dependency),
         ):
-            return await self.handle_search(extract)
+            return await self.handle_search(extract, response)
 
         @self.server.post(
             "/douyin/search/video",
@@ -445,9 +601,11 @@ class APIServer(TikTok):
             response_model=DataResponse,
         )
         async def handle_search_video(
-            extract: VideoSearch, token: str = Depends(token_dependency)
+            extract: VideoSearch,
+            response: Response,
+            token: str = Depends(token_dependency),
         ):
-            return await self.handle_search(extract)
+            return await self.handle_search(extract, response)
 
         @self.server.post(
             "/douyin/search/user",
@@ -471,9 +629,11 @@ class APIServer(TikTok):
             response_model=DataResponse,
         )
         async def handle_search_user(
-            extract: UserSearch, token: str = Depends(token_dependency)
+            extract: UserSearch,
+            response: Response,
+            token: str = Depends(token_dependency),
         ):
-            return await self.handle_search(extract)
+            return await self.handle_search(extract, response)
 
         @self.server.post(
             "/douyin/search/live",
@@ -493,9 +653,11 @@ class APIServer(TikTok):
             response_model=DataResponse,
         )
         async def handle_search_live(
-            extract: LiveSearch, token: str = Depends(token_dependency)
+            extract: LiveSearch,
+            response: Response,
+            token: str = Depends(token_dependency),
         ):
-            return await self.handle_search(extract)
+            return await self.handle_search(extract, response)
 
         @self.server.post(
             "/tiktok/share",
@@ -543,9 +705,34 @@ class APIServer(TikTok):
             response_model=DataResponse,
         )
         async def handle_detail_tiktok(
-            extract: DetailTikTok, token: str = Depends(token_dependency)
+            extract: DetailTikTok,
+            response: Response,
+            token: str = Depends(token_dependency),
         ):
-            return await self.handle_detail(extract, True)
+            return await self.handle_detail(extract, response, True)
+
+        @self.server.post(
+            "/tiktok/detail/batch",
+            summary=_("批量获取作品数据"),
+            description=_(
+                dedent("""
+                **参数**:
+
+                - **cookie**: TikTok Cookie；可选参数
+                - **proxy**: 代理；可选参数
+                - **source**: 是否返回原始响应数据；可选参数，默认值：False
+                - **detail_ids**: TikTok 作品 ID 列表；必需参数
+
+                并发获取作品数据，以 NDJSON 格式按获取完成的顺序逐行返回，每行包含 `detail_id` 与 `data`，获取失败时 `data` 为 `null`
+                """)
+            ),
+            tags=["TikTok"],
+            response_class=StreamingResponse,
+        )
+        async def handle_detail_batch_tiktok(
+            extract: DetailBatchTikTok, token: str = Depends(token_dependency)
+        ):
+            return self.stream_detail(extract, True)
 
         @self.server.post(
             "/tiktok/account",
@@ -570,9 +757,11 @@ class APIServer(TikTok):
             response_model=DataResponse,
         )
         async def handle_account_tiktok(
-            extract: AccountTiktok, token: str = Depends(token_dependency)
+            extract: AccountTiktok,
+            response: Response,
+            token: str = Depends(token_dependency),
         ):
-            return await self.handle_account(extract, True)
+            return await self.handle_account(extract, response, True)
 
         @self.server.post(
             "/tiktok/mix",
@@ -595,19 +784,144 @@ class APIServer(TikTok):
         async def handle_mix_tiktok(
             extract: MixTikTok, token: str = Depends(token_dependency)
         ):
-            if data := await self.deal_mix_detail(
-                True,
-                extract.mix_id,
-                api=True,
-                source=extract.source,
-                cookie=extract.cookie,
-                proxy=extract.proxy,
-                cursor=extract.cursor,
-                count=extract.count,
-            ):
+            if data := await self.deal_mix_api(extract, True):
                 return self.success_response(extract, data)
             return self.failed_response(extract)
 
+        @self.server.post(
+            "/tiktok/account/job",
+            summary=_("提交获取账号作品数据的后台任务"),
+            description=_(
+                dedent("""
+                参数与 `/tiktok/account` 接口相同
+
+                立即返回任务 ID，通过 `/job/{job_id}` 接口查询任务状态，通过 `/job/{job_id}/result` 接口分页获取数据
+                """)
+            ),
+            tags=["TikTok"],
+            response_model=JobResponse,
+        )
+        async def handle_account_tiktok_job(
+            extract: AccountTiktok, token: str = Depends(token_dependency)
+        ):
+            return await self.submit_job(
+                "account_tiktok",
+                extract,
+                lambda: self.deal_account_api(extract, True),
+            )
+
+        @self.server.post(
+            "/tiktok/mix/job",
+            summary=_("提交获取合辑作品数据的后台任务"),
+            description=_(
+                dedent("""
+                参数与 `/tiktok/mix` 接口相同
+
+                立即返回任务 ID，通过 `/job/{job_id}` 接口查询任务状态，通过 `/job/{job_id}/result` 接口分页获取数据
+                """)
+            ),
+            tags=["TikTok"],
+            response_model=JobResponse,
+        )
+        async def handle_mix_tiktok_job(
+            extract: MixTikTok, token: str = Depends(token_dependency)
+        ):
+            return await self.submit_job(
+                "mix_tiktok",
+                extract,
+                lambda: self.deal_mix_api(extract, True),
+            )
+
+        @self.server.get(
+            "/job/{job_id}",
+            summary=_("查询后台任务状态"),
+            description=_(
+                dedent("""
+                任务状态：`queued` 等待中、`running` 运行中、`completed` 已完成、`failed` 失败、`cancelled` 已取消
+                
+                任务运行期间，**pages** 为已获取的页数，**items** 为已获取的数据数量
+                
+                任务完成后，**total** 为可获取的数据数量
+                """)
+            ),
+            tags=[_("任务")],
+            response_model=JobResponse,
+        )
+        async def handle_job_status(
+            job_id: str, token: str = Depends(token_dependency)
+        ):
+            return await self.job_response(job_id)
+
+        @self.server.delete(
+            "/job/{job_id}",
+            summary=_("取消或删除后台任务"),
+            description=_(
+                dedent("""
+                取消等待中或运行中的任务；任务已结束时，删除任务及其数据
+                """)
+            ),
+            tags=[_("任务")],
+            response_model=JobResponse,
+        )
+        async def handle_job_delete(
+            job_id: str, token: str = Depends(token_dependency)
+        ):
+            if await self.jobs.cancel(job_id):
+                return await self.job_response(job_id)
+            if await self.database.read_job_data(job_id):
+                await self.database.delete_job_data(job_id)
+                return JobResponse(
+                    message=_("任务已删除"),
+                    job_id=job_id,
+                    params=None,
+                )
+            return await self.job_response(job_id)
+
+        @self.server.get(
+            "/job/{job_id}/result",
+            summary=_("分页获取后台任务数据"),
+            description=_(
+                dedent("""
+                **参数**:
+                
+                - **page**: 页码，从 1 开始；可选参数，默认值：1
+                - **size**: 每页数据数量；可选参数，默认值：100
+                """)
+            ),
+            tags=[_("任务")],
+            response_model=DataResponse,
+        )
+        async def handle_job_result(
+            job_id: str,
+            page: int = Query(1, ge=1),
+            size: int = Query(100, ge=1, le=API_JOB_PAGE_SIZE),
+            token: str = Depends(token_dependency),
+        ):
+            params = {"job_id": job_id, "page": page, "size": size}
+            if not (row := await self.database.read_job_data(job_id)):
+                return DataResponse(
+                    message=_("任务不存在！"),
+                    data=None,
+                    params=params,
+                )
+            params["total"] = row["TOTAL"]
+            if row["STATUS"] != "completed":
+                return DataResponse(
+                    message=_("任务未完成！"),
+                    data=None,
+                    params=params,
+                )
+            data = await self.database.read_job_result(
+                job_id,
+                (page - 1) * size,
+                size,
+            )
+            return DataResponse(
+                message=_("获取数据成功！"),
+                data=[loads(i) for i in data],
+                params=params,
+            )
+
         @self.server.post(
             "/tiktok/live",
             summary=_("获取直播数据"),
@@ -634,11 +948,30 @@ class APIServer(TikTok):
                 return self.success_response(extract, data[0])
             return self.failed_response(extract)
 
-    async def handle_search(self, extract):
+    async def cached(
+        self,
+        response: Response,
+        extract,
+        function,
+    ):
+        """通过响应缓存获取数据，响应头 X-Cache 为缓存状态"""
+        data, status = await self.response_cache.get(
+            type(extract).__name__,
+            extract.model_dump(),
+            function,
+        )
+        response.headers["X-Cache"] = status
+        return data
+
+    async def handle_search(self, extract, response: Response):
         if isinstance(
-            data := await self.deal_search_data(
+            data := await self.cached(
+                response,
                 extract,
-                extract.source,
+                lambda: self.deal_search_data(
+                    extract,
+                    extract.source,
+                ),
             ),
             list,
         ):
@@ -648,13 +981,27 @@ class APIServer(TikTok):
         return self.failed_response(extract)
 
     async def handle_detail(
+        self,
+        extract: Detail | DetailTikTok,
+        response: Response,
+        tiktok=False,
+    ):
+        if data := await self.cached(
+            response,
+            extract,
+            lambda: self.deal_detail_api(extract, tiktok),
+        ):
+            return self.success_response(extract, data[0])
+        return self.failed_response(extract)
+
+    async def deal_detail_api(
         self,
         extract: Detail | DetailTikTok,
         tiktok=False,
     ):
         root, params, logger = self.record.run(self.parameter)
         async with logger(root, console=self.console, **params) as record:
-            if data := await self._handle_detail(
+            return await self._handle_detail(
                 [extract.detail_id],
                 tiktok,
                 record,
@@ -662,16 +1009,54 @@ class APIServer(TikTok):
                 extract.source,
                 extract.cookie,
                 extract.proxy,
-            ):
-                return self.success_response(extract, data[0])
-            return self.failed_response(extract)
+            )
+
+    def stream_detail(
+        self,
+        extract: DetailBatch | DetailBatchTikTok,
+        tiktok=False,
+    ) -> StreamingResponse:
+        async def generate():
+            root, params, logger = self.record.run(self.parameter)
+            async with logger(root, console=self.console, **params) as record:
+                async for detail_id, data in self.iter_detail(
+                    list(dict.fromkeys(extract.detail_ids)),
+                    tiktok,
+                    record,
+                    extract.source,
+                    extract.cookie,
+                    extract.proxy,
+                ):
+                    yield (
+                        dumps(
+                            {"detail_id": detail_id, "data": data},
+                            ensure_ascii=False,
+                        )
+                        + "\n"
+                    )
+
+        return StreamingResponse(generate(), media_type="application/x-ndjson")
 
     async def handle_account(
         self,
         extract: Account | AccountTiktok,
+        response: Response,
         tiktok=False,
     ):
-        if data := await self.deal_account_detail(
+        if data := await self.cached(
+            response,
+            extract,
+            lambda: self.deal_account_api(extract, tiktok),
+        ):
+            return self.success_response(extract, data)
+        return self.failed_response(extract)
+
+    async def deal_account_api(
+        self,
+        extract: Account | AccountTiktok,
+        tiktok=False,
+    ):
+        return await self.deal_account_detail(
             0,
             extract.sec_user_id,
             tab=extract.tab,
@@ -685,9 +1070,82 @@ class APIServer(TikTok):
             tiktok=tiktok,
             cursor=extract.cursor,
             count=extract.count,
-        ):
-            return self.success_response(extract, data)
-        return self.failed_response(extract)
+        )
+
+    def check_mix_params(self, extract: Mix) -> bool:
+        is_mix, id_ = self.generate_mix_params(
+            extract.mix_id,
+            extract.detail_id,
+        )
+        return isinstance(is_mix, bool)
+
+    async def deal_mix_api(
+        self,
+        extract: Mix | MixTikTok,
+        tiktok=False,
+    ):
+        if tiktok:
+            is_mix, id_ = True, extract.mix_id
+        else:
+            is_mix, id_ = self.generate_mix_params(
+                extract.mix_id,
+                extract.detail_id,
+            )
+        return await self.deal_mix_detail(
+            is_mix,
+            id_,
+            api=True,
+            source=extract.source,
+            cookie=extract.cookie,
+            proxy=extract.proxy,
+            cursor=extract.cursor,
+            count=extract.count,
+        )
+
+    async def submit_job(
+        self,
+        type_: str,
+        extract,
+        function,
+    ) -> JobResponse:
+        async def job(progress):
+            # 任务在独立的上下文中运行，进度回调仅对当前任务的请求生效
+            API.PROGRESS.set(progress)
+            return await function()
+
+        # Cookie 不保存至数据库
+        id_ = await self.jobs.submit(
+            type_,
+            extract.model_dump(exclude={"cookie"}),
+            job,
+        )
+        return await self.job_response(id_)
+
+    async def job_response(self, job_id: str) -> JobResponse:
+        if not (row := await self.database.read_job_data(job_id)):
+            return JobResponse(
+                message=_("任务不存在！"),
+                job_id=job_id,
+                params=None,
+            )
+        return JobResponse(
+            message=row["MESSAGE"] or _("任务已提交"),
+            job_id=job_id,
+            status=row["STATUS"],
+            total=row["TOTAL"],
+            pages=row["PAGES"],
+            items=row["ITEMS"],
+            created=self.format_timestamp(row["CREATED"]),
+            started=self.format_timestamp(row["STARTED"]),
+            finished=self.format_timestamp(row["FINISHED"]),
+            params=loads(row["PARAMS"]),
+        )
+
+    @staticmethod
+    def format_timestamp(timestamp: float | None) -> str | None:
+        if timestamp is None:
+            return None
+        return datetime.fromtimestamp(timestamp).strftime("%Y-%m-%d %H:%M:%S")
 
     @staticmethod
     def success_response(
@@ -1,14 +1,23 @@
+from asyncio import (
+    CancelledError,
+    Queue,
+    Semaphore,
+    as_completed,
+    create_task,
+    gather,
+)
+from contextlib import suppress
 from datetime import date, datetime
 from pathlib import Path
 from platform import system
 from time import time
 from types import SimpleNamespace
-from typing import TYPE_CHECKING, Callable, Union, Any
+from typing import TYPE_CHECKING, Any, AsyncIterator, Callable, Union
 
 from pydantic import ValidationError
 
 # from ..custom import failure_handling
-from ..custom import suspend
+from ..custom import DETAIL_WORKERS, PREFETCH_PAGES, suspend
 from ..downloader import Downloader
 from ..extract import Extractor
 from ..interface import (
@@ -47,7 +56,7 @@ from ..models import (
 )
 from ..module import DetailTikTokExtractor, DetailTikTokUnofficial
 from ..storage import RecordManager
-from ..tools import DownloaderError, choose, safe_pop
+from ..tools import DownloaderError, choose, format_size, safe_pop
 from ..translation import _
 from .main_scheduler import ScheduledDownloader
 
@@ -110,8 +119,8 @@ class TikTok:
         self.database = database
         self.console = parameter.console
         self.logger = parameter.logger
-        self.links = LinkExtractor(parameter)
-        self.links_tiktok = ExtractorTikTok(parameter)
+        self.links = LinkExtractor(parameter, database=database)
+        self.links_tiktok = ExtractorTikTok(parameter, database)
         self.downloader = Downloader(parameter)
         self.extractor = Extractor(parameter)
         self.storage = bool(parameter.storage_format)
@@ -205,6 +214,10 @@ class TikTok:
                 _("批量下载视频原画(TikTok)"),
                 self.detail_interactive_tiktok_unofficial,
             ),
+            (
+                _("查看直播录制状态"),
+                self.live_recording_interactive,
+            ),
         )
         self.__function_account = (
             (_("使用 accounts_urls 参数的账号链接(推荐)"), self.account_detail_batch),
@@ -482,38 +495,58 @@ class TikTok:
         self.logger.info(
             _("共有 {count} 个账号的作品等待下载").format(count=len(accounts))
         )
-        for index, data in enumerate(accounts, start=1):
-            if not (
-                sec_user_id := await self.check_sec_user_id(
-                    data.url,
+        semaphore = Semaphore(self.parameter.account_concurrency)
+
+        async def worker(index: int, data: SimpleNamespace) -> None:
+            async with semaphore:
+                if await self.account_detail_single(
+                    data,
+                    params_name,
                     tiktok,
+                    index,
+                ):
+                    count.success += 1
+                else:
+                    count.failed += 1
+
+        await gather(
+            *(worker(index, data) for index, data in enumerate(accounts, start=1))
+        )
+        self.__summarize_results(
+            count,
+            _("账号"),
+        )
+
+    async def account_detail_single(
+        self,
+        data: SimpleNamespace,
+        params_name: str = "accounts_urls",
+        tiktok: bool = False,
+        index: int = 0,
+    ) -> bool:
+        """处理配置文件中的单个账号"""
+        if not (
+            sec_user_id := await self.check_sec_user_id(
+                data.url,
+                tiktok,
+            )
+        ):
+            self.logger.warning(
+                _(
+                    "配置文件 {name} 参数的 url {url} 提取 sec_user_id 失败，错误配置：{data}"
+                ).format(
+                    name=params_name,
+                    url=data.url,
+                    data=vars(data),
                 )
-            ):
-                self.logger.warning(
-                    _(
-                        "配置文件 {name} 参数的 url {url} 提取 sec_user_id 失败，错误配置：{data}"
-                    ).format(
-                        name=params_name,
-                        url=data.url,
-                        data=vars(data),
-                    )
-                )
-                count.failed += 1
-                continue
-            if not await self.deal_account_detail(
+            )
+            return False
+        return bool(
+            await self.deal_account_detail(
                 index,
                 **vars(data) | {"sec_user_id": sec_user_id},
                 tiktok=tiktok,
-            ):
-                count.failed += 1
-                continue
-            # break  # 调试代码
-            count.success += 1
-            if index != len(accounts):
-                await suspend(index, self.console)
-        self.__summarize_results(
-            count,
-            _("账号"),
+            )
         )
 
     async def check_sec_user_id(
@@ -618,19 +651,22 @@ class TikTok:
         **kwargs,
     ):
         count = SimpleNamespace(time=time(), success=0, failed=0)
-        for index, sec in enumerate(links, start=1):
-            if not await self.deal_account_detail(
-                index,
-                sec_user_id=sec,
-                tiktok=tiktok,
-                *args,
-                **kwargs,
-            ):
-                count.failed += 1
-                continue
-            count.success += 1
-            if index != len(links):
-                await suspend(index, self.console)
+        semaphore = Semaphore(self.parameter.account_concurrency)
+
+        async def worker(index: int, sec: str) -> None:
+            async with semaphore:
+                if await self.deal_account_detail(
+                    index,
+                    sec_user_id=sec,
+                    tiktok=tiktok,
+                    *args,
+                    **kwargs,
+                ):
+                    count.success += 1
+                else:
+                    count.failed += 1
+
+        await gather(*(worker(index, sec) for index, sec in enumerate(links, start=1)))
         self.__summarize_results(
             count,
             _("账号"),
@@ -683,6 +719,32 @@ class TikTok:
                     "如果账号发布作品均为共创作品且该账号均不是作品作者时，请配置已登录的 Cookie 后重新运行程序，其余情况请无视该提示！"
                 )
             )
+        if not api and not source:
+            account = (AccountTikTok if tiktok else Account)(
+                self.parameter,
+                cookie,
+                proxy,
+                sec_user_id,
+                tab,
+                earliest,
+                latest,
+                pages,
+            )
+            sync = await self.__read_sync_data(account, sec_user_id)
+            result = await self._batch_process_detail_stream(
+                account.stream(),
+                user_id=sec_user_id,
+                earliest=account.earliest,
+                latest=account.latest,
+                tiktok=tiktok,
+                mode=tab,
+                mark=mark,
+                info=info,
+                sync=sync,
+            )
+            if result and sync and account.complete:
+                await self.__update_sync_data(account, sec_user_id, sync)
+            return result
         acquirer = self._get_account_data_tiktok if tiktok else self._get_account_data
         account_data, earliest, latest = await acquirer(
             cookie=cookie,
@@ -715,6 +777,36 @@ class TikTok:
             info=info,
         )
 
+    async def __read_sync_data(
+        self,
+        account: Account | AccountTikTok,
+        sec_user_id: str,
+    ) -> SimpleNamespace | None:
+        """增量同步账号发布作品，仅在启用下载记录且未设置最晚发布日期时生效"""
+        if not (
+            self.parameter.incremental_sync
+            and self.parameter.recorder.switch
+            and not account.favorite
+            and account.latest >= date.today()
+        ):
+            return None
+        account.synced = await self.database.read_sync_data(sec_user_id, "post")
+        # newest 为本次获取的最新作品发布时间，failed 为下载失败的作品发布时间
+        return SimpleNamespace(newest=0, failed=[])
+
+    async def __update_sync_data(
+        self,
+        account: Account | AccountTikTok,
+        sec_user_id: str,
+        sync: SimpleNamespace,
+    ) -> None:
+        synced = max(sync.newest, account.synced)
+        if sync.failed:
+            # 存在下载失败的作品时，下次同步需要重新获取该作品
+            synced = min(synced, min(sync.failed) - 1)
+        if synced > 0:
+            await self.database.update_sync_data(sec_user_id, "post", synced)
+
     async def _get_account_data(
         self,
         cookie: str = None,
@@ -903,6 +995,128 @@ class TikTok:
         )
         return True
 
+    async def _batch_process_detail_stream(
+        self,
+        pages: AsyncIterator[list[dict]],
+        earliest: date = None,
+        latest: date = None,
+        tiktok: bool = False,
+        info: dict = None,
+        mode: str = "",
+        mark: str = "",
+        user_id: str = "",
+        sync: SimpleNamespace = None,
+    ):
+        """逐页提取并下载作品，处理当前页面时后台继续获取后续页面数据"""
+        try:
+            if not (page := await anext(pages, None)):
+                return None
+            self.logger.info(_("开始提取作品数据"))
+            id_, name, mark = self.extractor.preprocessing_data(
+                info or page,
+                tiktok,
+                mode,
+                mark,
+                user_id,
+            )
+            if not all((id_, name, mark)):
+                self.logger.error(_("提取账号或合集信息发生错误！"))
+                return False
+            self.__display_extracted_information(
+                id_,
+                name,
+                mark,
+            )
+            prefix = self._generate_prefix(mode)
+            suffix = self._generate_suffix(mode)
+            old_mark = (
+                f"{m['MARK']}_{suffix}"
+                if (m := await self.cache.has_cache(id_))
+                else None
+            )
+            root, params, logger = self.record.run(
+                self.parameter,
+            )
+            async with logger(
+                root,
+                name=f"{prefix}{id_}_{mark}_{suffix}",
+                old=old_mark,
+                console=self.console,
+                **params,
+            ) as recorder:
+                await self.cache.update_cache(
+                    self.parameter.folder_mode,
+                    prefix,
+                    suffix,
+                    id_,
+                    name,
+                    mark,
+                )
+                queue: Queue[list[dict] | None] = Queue(PREFETCH_PAGES)
+                key = "createTime" if tiktok else "create_time"
+
+                async def extract(item: list[dict]):
+                    while item:
+                        if sync:
+                            sync.newest = max(
+                                sync.newest,
+                                *(int(i.get(key) or 0) for i in item),
+                            )
+                        await queue.put(
+                            await self.extractor.run(
+                                item,
+                                recorder,
+                                type_="batch",
+                                tiktok=tiktok,
+                                name=name,
+                                mark=mark,
+                                earliest=earliest or date(2016, 9, 20),
+                                latest=latest or date.today(),
+                                same=mode
+                                in {
+                                    "post",
+                                    "mix",
+                                },
+                            )
+                        )
+                        item = await anext(pages, None)
+
+                async def produce():
+                    try:
+                        await extract(page)
+                    except Exception:
+                        await queue.put(None)
+                        raise
+                    await queue.put(None)
+
+                # 获取、提取与下载分别运行，各阶段之间仅缓存有限页数的数据
+                producer = create_task(produce())
+                try:
+                    while (data := await queue.get()) is not None:
+                        failed = await self.download_detail_batch(
+                            data,
+                            tiktok=tiktok,
+                            mode=mode,
+                            mark=mark,
+                            user_id=id_,
+                            user_name=name,
+                        )
+                        if sync and failed:
+                            sync.failed.extend(
+                                int(i["create_timestamp"])
+                                for i in data
+                                if i["id"] in failed
+                            )
+                    await producer
+                finally:
+                    if not producer.done():
+                        producer.cancel()
+                    with suppress(CancelledError):
+                        await producer
+            return True
+        finally:
+            await pages.aclose()
+
     @staticmethod
     def _generate_prefix(
         mode: str,
@@ -960,8 +1174,8 @@ class TikTok:
         mix_title: str = "",
         collect_id: str = "",
         collect_name: str = "",
-    ):
-        await self.downloader.run(
+    ) -> set[str] | None:
+        return await self.downloader.run(
             data,
             type_,
             tiktok,
@@ -1153,6 +1367,63 @@ class TikTok:
             detail_id,
         ).run()
 
+    async def __handle_detail_limited(
+        self,
+        semaphore: Semaphore,
+        processor: Callable,
+        cookie: str,
+        proxy: str,
+        detail_id: str,
+    ):
+        async with semaphore:
+            return await self.handle_detail_single(
+                processor,
+                cookie,
+                proxy,
+                detail_id,
+            )
+
+    async def iter_detail(
+        self,
+        ids: list[str],
+        tiktok: bool,
+        record,
+        source=False,
+        cookie: str = None,
+        proxy: str = None,
+    ) -> AsyncIterator[tuple[str, dict | None]]:
+        """并发获取多个作品数据，按获取完成的顺序逐个返回作品 ID 与作品数据"""
+        processor = DetailTikTok if tiktok else Detail
+        semaphore = Semaphore(DETAIL_WORKERS)
+
+        async def fetch(detail_id: str):
+            return detail_id, await self.__handle_detail_limited(
+                semaphore,
+                processor,
+                cookie,
+                proxy,
+                detail_id,
+            )
+
+        tasks = [create_task(fetch(i)) for i in ids]
+        try:
+            for task in as_completed(tasks):
+                detail_id, data = await task
+                if data and not source:
+                    data = (
+                        await self.extractor.run(
+                            [data],
+                            record,
+                            tiktok=tiktok,
+                        )
+                        or [None]
+                    )[0]
+                yield detail_id, data or None
+        finally:
+            for task in tasks:
+                task.cancel()
+            await gather(*tasks, return_exceptions=True)
+
     async def __handle_detail(
         self,
         tiktok: bool,
@@ -1164,15 +1435,19 @@ class TikTok:
         cookie: str = None,
         proxy: str = None,
     ):
-        detail_data = [
-            await self.handle_detail_single(
-                processor,
-                cookie,
-                proxy,
-                i,
+        semaphore = Semaphore(DETAIL_WORKERS)
+        detail_data = await gather(
+            *(
+                self.__handle_detail_limited(
+                    semaphore,
+                    processor,
+                    cookie,
+                    proxy,
+                    i,
+                )
+                for i in ids
             )
-            for i in ids
-        ]
+        )
         if not any(detail_data):
             return None
         if source:
@@ -1284,6 +1559,39 @@ class TikTok:
             await self.downloader.run(download_tasks, type_="live", tiktok=True)
         self.logger.info(_("已退出获取直播推流地址(TikTok)模式"))
 
+    async def live_recording_interactive(
+        self,
+        *args,
+    ):
+        while self.show_live_recordings() and (
+            id_ := self._inquire_input(
+                problem=_("请输入需要停止录制的任务 ID，直接回车代表返回上级菜单: "),
+            )
+        ):
+            if await self.parameter.live_recorder.stop(id_):
+                self.logger.info(_("已停止录制任务 {id}").format(id=id_))
+            else:
+                self.logger.warning(_("录制任务 {id} 不存在或已结束").format(id=id_))
+
+    def show_live_recordings(self) -> bool:
+        if not (recordings := self.parameter.live_recorder.status()):
+            self.console.info(_("当前没有直播录制任务"))
+            return False
+        for i in recordings:
+            self.console.print(
+                i["id"],
+                i["status"],
+                i["title"],
+                format_size(i["size"]),
+                i["bitrate"],
+                i["out_time"],
+                _("分段 {segments} 重连 {reconnects}").format(
+                    segments=len(i["segments"]),
+                    reconnects=i["reconnects"],
+                ),
+            )
+        return True
+
     def _generate_live_params(self, rid: bool, ids: list[list]) -> list[dict]:
         if not ids:
             self.console.warning(
@@ -1717,30 +2025,7 @@ class TikTok:
     ):
         count = SimpleNamespace(time=time(), success=0, failed=0)
         for index, data in enumerate(mix, start=1):
-            mix_id, id_, title = await self._check_mix_id(
-                data.url,
-                tiktok,
-            )
-            if not id_:
-                self.logger.warning(
-                    _(
-                        "配置文件 {name} 参数的 url {url} 获取作品 ID 或合集 ID 失败，错误配置：{data}"
-                    ).format(
-                        name=params_name,
-                        url=data.url,
-                        data=vars(data),
-                    )
-                )
-                count.failed += 1
-                continue
-            if not await self.deal_mix_detail(
-                mix_id,
-                id_,
-                data.mark,
-                index,
-                tiktok=tiktok,
-                mix_title=title,
-            ):
+            if not await self.mix_detail_single(data, params_name, tiktok, index):
                 count.failed += 1
                 continue
             count.success += 1
@@ -1751,6 +2036,40 @@ class TikTok:
             _("合集"),
         )
 
+    async def mix_detail_single(
+        self,
+        data: SimpleNamespace,
+        params_name: str = "mix_urls",
+        tiktok: bool = False,
+        index: int = 0,
+    ) -> bool:
+        """处理配置文件中的单个合集"""
+        mix_id, id_, title = await self._check_mix_id(
+            data.url,
+            tiktok,
+        )
+        if not id_:
+            self.logger.warning(
+                _(
+                    "配置文件 {name} 参数的 url {url} 获取作品 ID 或合集 ID 失败，错误配置：{data}"
+                ).format(
+                    name=params_name,
+                    url=data.url,
+                    data=vars(data),
+                )
+            )
+            return False
+        return bool(
+            await self.deal_mix_detail(
+                mix_id,
+                id_,
+                data.mark,
+                index,
+                tiktok=tiktok,
+                mix_title=title,
+            )
+        )
+
     async def deal_mix_detail(
         self,
         mix_id: bool = None,
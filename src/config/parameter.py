@@ -1,3 +1,4 @@
+from asyncio import gather
 from pathlib import Path
 from time import localtime, strftime
 from types import SimpleNamespace
@@ -11,6 +12,7 @@ from ..custom import (
     DATA_HEADERS_TIKTOK,
     DOWNLOAD_HEADERS,
     DOWNLOAD_HEADERS_TIKTOK,
+    MAX_WORKERS,
     PARAMS_HEADERS,
     PARAMS_HEADERS_TIKTOK,
     PROJECT_ROOT,
@@ -18,13 +20,32 @@ from ..custom import (
     TIMEOUT,
     USERAGENT,
 )
-from ..encrypt import ABogus, MsToken, MsTokenTikTok, TtWid, TtWidTikTok, XBogus
+from ..encrypt import (
+    ABogus,
+    MsToken,
+    MsTokenTikTok,
+    Signer,
+    TtWid,
+    TtWidTikTok,
+    XBogus,
+)
 from ..extract import Extractor
 from ..interface import API, APITikTok
-from ..module import FFMPEG
+from ..module import FFMPEG, LiveRecorder
 from ..record import BaseLogger, LoggerManager
 from ..storage import RecordManager
-from ..tools import Cleaner, cookie_dict_to_str, create_client, DownloaderError
+from ..tools import (
+    Cleaner,
+    ClientPool,
+    close_params_clients,
+    cookie_dict_to_str,
+    create_client,
+    DownloaderError,
+    MirrorSelector,
+    RateLimiter,
+    WORKER_TYPES,
+    WorkerPools,
+)
 from ..translation import _
 
 if TYPE_CHECKING:
@@ -95,6 +116,13 @@ class Parameter:
         timeout=10,
         douyin_platform=True,
         tiktok_platform=True,
+        account_concurrency: int = 2,
+        incremental_sync=True,
+        rate_limit: dict = None,
+        download_workers: dict = None,
+        download_workers_tiktok: dict = None,
+        live_recorder: LiveRecorder = None,
+        live_urls: list[dict] = None,
         **kwargs,
     ):
         self.settings = settings
@@ -105,8 +133,10 @@ class Parameter:
         self.logger.run()
         self.ab = ABogus()
         self.xb = XBogus()
+        self.signer = Signer(self.ab, self.xb)
         self.console = console
         self.recorder = recorder
+        self.live_recorder = live_recorder or LiveRecorder()
         self.preview = BLANK_PREVIEW
         self.ms_token = ""
         self.ms_token_tiktok = ""
@@ -129,6 +159,7 @@ class Parameter:
         self.mix_urls_tiktok: list[SimpleNamespace] = self.check_urls_params(
             mix_urls_tiktok
         )
+        self.live_urls: list[SimpleNamespace] = self.check_urls_params(live_urls or [])
         self.owner_url: SimpleNamespace = self.check_url_params(owner_url)
         self.owner_url_tiktok: SimpleNamespace | None = None
 
@@ -168,6 +199,20 @@ class Parameter:
         self.tiktok_platform = self.check_bool_true(
             tiktok_platform,
         )
+        self.account_concurrency = self.__check_account_concurrency(
+            account_concurrency,
+        )
+        self.incremental_sync = self.check_bool_true(incremental_sync)
+        self.rate_limit = self.__check_rate_limit(rate_limit)
+        self.limiters = RateLimiter(self.rate_limit)
+        self.download_workers = self.__check_download_workers(download_workers)
+        self.download_workers_tiktok = self.__check_download_workers(
+            download_workers_tiktok,
+            "download_workers_tiktok",
+        )
+        self.download_pools = WorkerPools(self.download_workers)
+        self.download_pools_tiktok = WorkerPools(self.download_workers_tiktok)
+        self.mirrors = MirrorSelector()
 
         self.browser_info = self.merge_browser_info(
             browser_info,
@@ -194,6 +239,9 @@ class Parameter:
             timeout=self.timeout,
             proxy=self.proxy_tiktok,
         )
+        self.proxy_clients = ClientPool(
+            timeout=self.timeout,
+        )
 
         self.__generate_folders()
 
@@ -229,6 +277,9 @@ class Parameter:
             "live_qualities": self.__check_live_qualities,
             "douyin_platform": self.check_bool_true,
             "tiktok_platform": self.check_bool_true,
+            "account_concurrency": self.__check_account_concurrency,
+            "incremental_sync": self.check_bool_true,
+            "rate_limit": self.__check_rate_limit,
         }
         # self.__BROWSER_INFO = {
         #     "browser_info": None,
@@ -543,6 +594,67 @@ class Parameter:
             )
         return ""
 
+    def __check_account_concurrency(self, account_concurrency: int) -> int:
+        if isinstance(account_concurrency, int) and account_concurrency > 0:
+            self.logger.info(
+                f"account_concurrency 参数已设置为 {account_concurrency}", False
+            )
+            return account_concurrency
+        self.logger.warning(
+            _(
+                "account_concurrency 参数 {account_concurrency} 设置错误，程序将使用默认值：2"
+            ).format(account_concurrency=account_concurrency),
+        )
+        return 2
+
+    def __check_rate_limit(self, rate_limit: dict) -> dict[str, int | float]:
+        default = {"douyin": 1, "tiktok": 1, "cdn": 0}
+        if not isinstance(rate_limit, dict):
+            self.logger.warning(
+                _("rate_limit 参数 {rate_limit} 设置错误，程序将使用默认值").format(
+                    rate_limit=rate_limit
+                ),
+            )
+            return default
+        for key, value in rate_limit.items():
+            if isinstance(value, (int, float)) and value >= 0:
+                default[key] = value
+            else:
+                self.logger.warning(
+                    _("rate_limit 参数 {key} 的值 {value} 设置错误").format(
+                        key=key, value=value
+                    ),
+                )
+        self.logger.info(f"rate_limit 参数已设置为 {default}", False)
+        return default
+
+    def __check_download_workers(
+        self,
+        download_workers: dict,
+        name="download_workers",
+    ) -> dict[str, int]:
+        workers = dict.fromkeys(WORKER_TYPES, MAX_WORKERS)
+        if not isinstance(download_workers, dict):
+            self.logger.warning(
+                _("{name} 参数 {value} 设置错误，程序将使用默认值：{default}").format(
+                    name=name,
+                    value=download_workers,
+                    default=MAX_WORKERS,
+                ),
+            )
+            return workers
+        for key, value in download_workers.items():
+            if key in workers and isinstance(value, int) and value > 0:
+                workers[key] = value
+            else:
+                self.logger.warning(
+                    _("{name} 参数 {key} 的值 {value} 设置错误").format(
+                        name=name, key=key, value=value
+                    ),
+                )
+        self.logger.info(f"{name} 参数已设置为 {workers}", False)
+        return workers
+
     @staticmethod
     def __check_run_command(run_command: str) -> list:
         return run_command.split()[::-1] if run_command else []
@@ -558,8 +670,10 @@ class Parameter:
                 self.console.info(
                     _("正在更新抖音参数，请稍等..."),
                 )
-                ms_token = await self.__get_token_params()
-                tt_wid = await self.__get_tt_wid_params()
+                ms_token, tt_wid = await gather(
+                    self.__get_token_params(),
+                    self.__get_tt_wid_params(),
+                )
                 API.params["msToken"] = ms_token.get(MsToken.NAME, "")
                 await self.__update_cookie(
                     (
@@ -590,8 +704,10 @@ class Parameter:
                 self.console.info(
                     _("正在更新 TikTok 参数，请稍等..."),
                 )
-                ms_token = await self.__get_token_params_tiktok()
-                tt_wid = await self.__get_tt_wid_params_tiktok()
+                ms_token, tt_wid = await gather(
+                    self.__get_token_params_tiktok(),
+                    self.__get_tt_wid_params_tiktok(),
+                )
                 APITikTok.params["msToken"] = ms_token.get(MsTokenTikTok.NAME, "")
                 await self.__update_cookie(
                     (
@@ -812,6 +928,7 @@ class Parameter:
             "accounts_urls_tiktok": [vars(i) for i in self.accounts_urls_tiktok],
             "mix_urls": [vars(i) for i in self.mix_urls],
             "mix_urls_tiktok": [vars(i) for i in self.mix_urls_tiktok],
+            "live_urls": [vars(i) for i in self.live_urls],
             "owner_url": vars(self.owner_url),
             "owner_url_tiktok": self.owner_url_tiktok,
             "root": str(self.root.resolve()),
@@ -837,6 +954,11 @@ class Parameter:
             "max_pages": self.max_pages,
             "run_command": " ".join(self.run_command[::-1]),
             "ffmpeg": self.ffmpeg.path or "",
+            "account_concurrency": self.account_concurrency,
+            "incremental_sync": self.incremental_sync,
+            "rate_limit": self.rate_limit,
+            "download_workers": self.download_workers,
+            "download_workers_tiktok": self.download_workers_tiktok,
         }
 
     async def set_settings_data(
@@ -850,6 +972,7 @@ class Parameter:
             data.pop("accounts_urls_tiktok"),
             data.pop("mix_urls_tiktok"),
             data.pop("owner_url_tiktok"),
+            data.pop("live_urls"),
         )
         self.set_cookie(
             data.pop(
@@ -875,6 +998,14 @@ class Parameter:
                 "proxy_tiktok",
             ),
         )
+        await self.set_download_workers(
+            data.pop(
+                "download_workers",
+            ),
+            data.pop(
+                "download_workers_tiktok",
+            ),
+        )
         self.set_general_params(data)
 
     async def __update_cookie_data(self, data: dict) -> None:
@@ -915,6 +1046,7 @@ class Parameter:
         accounts_urls_tiktok: list[dict],
         mix_urls_tiktok: list[dict],
         owner_url_tiktok: dict,
+        live_urls: list[dict] = None,
     ):
         if accounts_urls:
             self.accounts_urls = self.check_urls_params(accounts_urls)
@@ -924,6 +1056,8 @@ class Parameter:
             self.mix_urls = self.check_urls_params(mix_urls)
         if mix_urls_tiktok:
             self.mix_urls_tiktok = self.check_urls_params(mix_urls_tiktok)
+        if live_urls:
+            self.live_urls = self.check_urls_params(live_urls)
         if owner_url:
             self.owner_url = self.check_url_params(owner_url)
         # if owner_url_tiktok:
@@ -950,6 +1084,22 @@ class Parameter:
             if j is not None:
                 self.__CHECK[i](j)
 
+    async def set_download_workers(
+        self,
+        download_workers: dict | None,
+        download_workers_tiktok: dict | None,
+    ):
+        """调整下载并发池上限，正在下载的任务不受影响"""
+        if isinstance(download_workers, dict):
+            self.download_workers = self.__check_download_workers(download_workers)
+            await self.download_pools.resize(self.download_workers)
+        if isinstance(download_workers_tiktok, dict):
+            self.download_workers_tiktok = self.__check_download_workers(
+                download_workers_tiktok,
+                "download_workers_tiktok",
+            )
+            await self.download_pools_tiktok.resize(self.download_workers_tiktok)
+
     async def set_proxy(self, proxy: str | None, proxy_tiktok: str | None):
         if isinstance(proxy, str):
             self.proxy: str | None = self.__check_proxy(
@@ -995,6 +1145,9 @@ class Parameter:
     async def close_client(self) -> None:
         await self.client.aclose()
         await self.client_tiktok.aclose()
+        await self.proxy_clients.close()
+        await close_params_clients()
+        self.signer.close()
 
     def __generate_folders(self):
         self.cache.mkdir(exist_ok=True)
@@ -51,6 +51,13 @@ class Settings:
                 "enable": True,
             },
         ],
+        "live_urls": [
+            {
+                "mark": "",
+                "url": "",
+                "enable": True,
+            },
+        ],
         "owner_url": {
             "mark": "",
             "url": "",
@@ -86,6 +93,27 @@ class Settings:
         "live_qualities": "",
         "douyin_platform": True,
         "tiktok_platform": True,
+        "account_concurrency": 2,  # 批量下载账号作品时同时处理的账号数量
+        "incremental_sync": True,  # 批量下载账号发布作品时仅获取上次同步后发布的作品
+        "rate_limit": {
+            "douyin": 1,
+            "tiktok": 1,
+            "cdn": 0,
+        },  # 每秒请求次数上限，cdn 对应下载文件请求，设置为 0 代表不限制
+        "download_workers": {
+            "image": 8,
+            "video": 4,
+            "music": 4,
+            "cover": 8,
+            "live": 4,
+        },  # 每种文件类型同时下载的最大任务数
+        "download_workers_tiktok": {
+            "image": 8,
+            "video": 4,
+            "music": 4,
+            "cover": 8,
+            "live": 4,
+        },
         "browser_info": {
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/136.0.0.0 Safari/537.36",
             "pc_libra_divert": "Windows",
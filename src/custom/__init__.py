@@ -54,7 +54,43 @@ from .internal import (
     BLANK_HEADERS,
 )
 from .static import (
+    API_CACHE_DATABASE,
+    API_CACHE_SIZE,
+    API_CACHE_TTL,
+    API_JOB_PAGE_SIZE,
+    API_JOB_WORKERS,
+    DETAIL_WORKERS,
+    LINK_WORKERS,
+    LIVE_MONITOR_BACKOFF,
+    LIVE_MONITOR_MAX_INTERVAL,
+    LIVE_MONITOR_MIN_INTERVAL,
+    LIVE_MONITOR_USER_INTERVAL,
+    LIVE_MONITOR_WORKERS,
+    LIVE_RECONNECT,
+    LIVE_RECONNECT_DELAY,
+    LIVE_SEGMENT_TIME,
+    LIVE_WORKERS,
     MAX_WORKERS,
+    MIRROR_FAILURE_PENALTY,
+    MIRROR_MIN_SPEED,
+    MIRROR_PROBE_TIME,
+    PREFETCH_PAGES,
+    RATE_LIMIT_BACKOFF,
+    RATE_LIMIT_BACKOFF_MAX,
+    RATE_LIMIT_CAPACITY,
+    RATE_LIMIT_FLOOR,
+    RECORD_FLUSH_INTERVAL,
+    RECORD_FLUSH_SIZE,
+    REPLY_WORKERS,
+    SCHEDULE_MISFIRE,
+    SCHEDULE_SPREAD,
+    SCHEDULE_WORKERS,
+    SIGNER_BATCH,
+    SIGNER_MODE,
+    SIGNER_WORKERS,
+    SEGMENT_COUNT,
+    SEGMENT_SAVE_INTERVAL,
+    SEGMENT_THRESHOLD,
     DESCRIPTION_LENGTH,
     TEXT_REPLACEMENT,
     SERVER_HOST,
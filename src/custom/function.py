@@ -9,7 +9,7 @@ if TYPE_CHECKING:
 
 async def wait() -> None:
     """
-    设置网络请求间隔时间，仅对获取数据生效，不影响下载文件
+    设置网络请求间隔时间，仅对获取请求参数的重试生效，获取数据的请求频率由配置文件 rate_limit 参数控制
     """
     # 随机延时
     await sleep(randint(5, 20) * 0.1)
@@ -44,7 +44,7 @@ async def suspend(count: int, console: "ColorfulConsole") -> None:
     如需采集大量数据，请启用该函数，可以在处理指定数量的数据后，暂停一段时间，然后继续运行
     batches: 每次处理的数据数量上限，比如：每次处理 10 个数据，就会暂停程序
     rest_time: 程序暂停的时间，单位：秒；比如：每处理 10 个数据，就暂停 5 分钟
-    仅对 批量下载账号作品模式 和 批量下载合集作品模式 生效
+    仅对 批量下载合集作品模式 生效，批量下载账号作品模式 请使用 rate_limit 参数控制请求频率
     说明: 此处的一个数据代表一个账号或者一个合集，并非代表一个数据包
     """
     # 启用该函数
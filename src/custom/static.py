@@ -1,6 +1,116 @@
-# 同时下载作品文件的最大任务数，对直播无效
+# 同时下载作品文件的默认最大任务数，配置文件 download_workers 参数未设置的文件类型使用该值，对直播无效
 MAX_WORKERS = 4
 
+# 请求数据限速器允许的突发请求数量
+RATE_LIMIT_CAPACITY = 3
+
+# 服务器返回风控响应时暂停请求的初始时间，单位：秒；连续触发时按指数增长
+RATE_LIMIT_BACKOFF = 2
+
+# 服务器返回风控响应时暂停请求的最长时间，单位：秒
+RATE_LIMIT_BACKOFF_MAX = 60
+
+# 触发风控后请求速率最低降至设置值的比例，同时也是请求成功后每次恢复的比例
+RATE_LIMIT_FLOOR = 0.125
+
+# 逐页处理数据时预先请求的最大页数，同时也是提取与下载之间缓存的最大页数
+PREFETCH_PAGES = 2
+
+# 同时获取评论回复的最大任务数
+REPLY_WORKERS = 4
+
+# 批量获取作品数据时同时请求的最大作品数量
+DETAIL_WORKERS = 8
+
+# 解析链接时同时请求的最大链接数量
+LINK_WORKERS = 8
+
+# 请求参数签名的计算方式，"process" 使用进程池，"thread" 使用线程池，其他值在事件循环中直接计算
+# 线程池仅在 Python 解释器未启用 GIL 时有效
+SIGNER_MODE = ""
+
+# 签名进程池或线程池的最大工作数量
+SIGNER_WORKERS = 2
+
+# 单次发送至进程池或线程池的最大签名数量
+SIGNER_BATCH = 32
+
+# 作品下载记录缓存达到该数量时批量写入数据库
+RECORD_FLUSH_SIZE = 100
+
+# 作品下载记录写入数据库的最长间隔时间，单位：秒
+RECORD_FLUSH_INTERVAL = 5
+
+# 单个文件分段下载的最大分段数，设置为 1 代表禁用分段下载
+SEGMENT_COUNT = 4
+
+# 启用分段下载的文件大小阈值，单位：字节；仅对服务器支持 Range 请求的文件生效
+SEGMENT_THRESHOLD = 32 * 1024 * 1024
+
+# 分段下载进度写入缓存文件的最短间隔时间，单位：秒
+SEGMENT_SAVE_INTERVAL = 1
+
+# 下载速度低于该值时切换镜像地址，单位：字节/秒；仅对存在多个镜像地址的文件生效，设置为 0 代表禁用
+MIRROR_MIN_SPEED = 128 * 1024
+
+# 开始检测下载速度前等待的时间，单位：秒
+MIRROR_PROBE_TIME = 5
+
+# 镜像地址请求失败或下载速度过低时，记录的该主机最低响应耗时，单位：秒
+MIRROR_FAILURE_PENALTY = 10
+
+# 定时下载时同时运行的最大任务数，每个账号、合集或收藏作品为一个任务
+SCHEDULE_WORKERS = 2
+
+# 同一执行时间的定时任务均匀分散到该时长内启动，单位：秒
+SCHEDULE_SPREAD = 3600
+
+# 定时任务错过执行时间后仍允许补充执行的最长时间，单位：秒
+SCHEDULE_MISFIRE = 3600
+
+# Web API 后台任务同时运行的最大数量
+API_JOB_WORKERS = 4
+
+# Web API 分页获取后台任务结果时，每页数据的最大数量
+API_JOB_PAGE_SIZE = 500
+
+# Web API 响应缓存有效期，单位：秒，设置为 0 时关闭缓存
+API_CACHE_TTL = 60
+
+# Web API 内存缓存的最大响应数量
+API_CACHE_SIZE = 1024
+
+# Web API 响应缓存是否同时保存至数据库，程序重启后缓存仍然有效
+API_CACHE_DATABASE = False
+
+# 同时录制的最大直播数量，超出数量的录制任务等待其他直播录制结束
+LIVE_WORKERS = 4
+
+# 直播录制单个分段的最大时长，单位：秒，设置为 0 代表不按时长分段
+LIVE_SEGMENT_TIME = 60 * 60
+
+# 直播录制连接中断后的最大重连次数
+LIVE_RECONNECT = 5
+
+# 直播录制重连前等待的时间，单位：秒
+LIVE_RECONNECT_DELAY = 10
+
+# 监听直播间时同时请求的最大直播间数量
+LIVE_MONITOR_WORKERS = 4
+
+# 监听直播间的最短检测间隔，直播结束或者检测开始时使用该间隔，单位：秒
+LIVE_MONITOR_MIN_INTERVAL = 10
+
+# 监听直播间的最长检测间隔，未开播的直播间检测间隔逐渐延长至该值，单位：秒
+# 仅对直播间链接生效，开播后最长需要等待该间隔才会开始录制
+LIVE_MONITOR_MAX_INTERVAL = 60
+
+# 监听账号主页链接的检测间隔，账号接口请求开销较小，固定使用该间隔以便开播后数秒内开始录制，单位：秒
+LIVE_MONITOR_USER_INTERVAL = 5
+
+# 未开播的直播间每次检测后检测间隔的增长倍数
+LIVE_MONITOR_BACKOFF = 1.5
+
 # 作品描述最大长度限制，仅对作品文件名称生效，不影响数据储存，设置时需要考虑系统文件名称最大长度限制
 DESCRIPTION_LENGTH = 64
 
@@ -1,9 +1,13 @@
+from asyncio import Lock
 from asyncio import Semaphore
 from asyncio import gather
 from datetime import datetime
+from json import JSONDecodeError
+from json import dumps
+from json import loads
 from pathlib import Path
 from shutil import move
-from time import time
+from time import monotonic, time
 from types import SimpleNamespace
 from typing import TYPE_CHECKING
 from typing import Union
@@ -15,23 +19,27 @@ from httpx import StreamError
 from rich.progress import (
     SpinnerColumn,
     BarColumn,
-    DownloadColumn,
     Progress,
     TextColumn,
     TimeElapsedColumn,
-    TimeRemainingColumn,
     TransferSpeedColumn,
 )
 
 from ..custom import DESCRIPTION_LENGTH
 from ..custom import MAX_FILENAME_LENGTH
-from ..custom import MAX_WORKERS
+from ..custom import MIRROR_MIN_SPEED
+from ..custom import MIRROR_PROBE_TIME
+from ..custom import SEGMENT_COUNT
+from ..custom import SEGMENT_SAVE_INTERVAL
+from ..custom import SEGMENT_THRESHOLD
 from ..custom import (
     PROGRESS,
 )
 from ..tools import CacheError
 from ..tools import Retry
+from ..tools import SharedProgress
 from ..tools import DownloaderError
+from ..tools import MirrorError
 from ..tools import beautify_string
 from ..tools import format_size
 from ..translation import _
@@ -39,12 +47,12 @@ from ..translation import _
 if TYPE_CHECKING:
     from ..config import Parameter
     from httpx import AsyncClient
+    from ..module import LiveRecording
 
 __all__ = ["Downloader"]
 
 
 class Downloader:
-    semaphore = Semaphore(MAX_WORKERS)
     CONTENT_TYPE_MAP = {
         "image/png": "png",
         "image/jpeg": "jpeg",
@@ -83,28 +91,18 @@ class Downloader:
         self.recorder = params.recorder
         self.timeout = params.timeout
         self.ffmpeg = params.ffmpeg
+        self.live_recorder = params.live_recorder
         self.cache = params.cache
         self.truncate = params.truncate
+        self.limiter = params.limiters["cdn"]
+        self.pools = params.download_pools
+        self.pools_tiktok = params.download_pools_tiktok
+        self.mirrors = params.mirrors
+        self.streaming = 0  # 正在接收数据的文件数量
 
     def __general_progress_object(self):
         """文件下载进度条"""
-        return Progress(
-            TextColumn(
-                "[progress.description]{task.description}",
-                style=PROGRESS,
-                justify="left",
-            ),
-            SpinnerColumn(),
-            BarColumn(bar_width=20),
-            "[progress.percentage]{task.percentage:>3.1f}%",
-            "•",
-            DownloadColumn(binary_units=True),
-            "•",
-            TimeRemainingColumn(),
-            console=self.console,
-            transient=True,
-            expand=True,
-        )
+        return SharedProgress.get(self.console)
 
     def __live_progress_object(self):
         """直播下载进度条"""
@@ -131,13 +129,14 @@ class Downloader:
         type_: str,
         tiktok=False,
         **kwargs,
-    ) -> None:
+    ) -> set[str] | None:
+        """批量下载作品时返回下载失败的作品 ID"""
         if not self.download or not data:
             return
         self.log.info(_("开始下载作品文件"))
         match type_:
             case "batch":
-                await self.run_batch(data, tiktok, **kwargs)
+                return await self.run_batch(data, tiktok, **kwargs)
             case "detail":
                 await self.run_general(data, tiktok, **kwargs)
             case "music":
@@ -159,7 +158,7 @@ class Downloader:
         mix_title: str = "",
         collect_id: str = "",
         collect_name: str = "",
-    ):
+    ) -> set[str]:
         root = self.storage_folder(
             mode,
             *self.data_classification(
@@ -173,7 +172,7 @@ class Downloader:
                 collect_name,
             ),
         )
-        await self.batch_processing(
+        return await self.batch_processing(
             data,
             root,
             tiktok=tiktok,
@@ -221,18 +220,18 @@ class Downloader:
         data: list[tuple],
         tiktok=False,
         **kwargs,
-    ):
+    ) -> list["LiveRecording"]:
         if not data or not self.download:
-            return
+            return []
         download_command = []
         self.generate_live_commands(
             data,
             download_command,
         )
         self.console.info(
-            _("程序将会调用 ffmpeg 下载直播，关闭 DouK-Downloader 不会中断下载！"),
+            _("程序将会在后台调用 ffmpeg 录制直播，关闭 DouK-Downloader 会结束录制！"),
         )
-        self.__download_live(download_command, tiktok)
+        return self.__download_live(download_command, tiktok)
 
     def generate_live_commands(
         self,
@@ -251,7 +250,8 @@ class Downloader:
             commands.append(
                 (
                     m,
-                    str(path.resolve()),
+                    path.resolve(),
+                    i["title"],
                 )
             )
 
@@ -259,14 +259,25 @@ class Downloader:
         self,
         commands: list,
         tiktok: bool,
-    ):
-        self.ffmpeg.download(
-            commands,
-            self.proxy_tiktok if tiktok else self.proxy,
-            self.headers["User-Agent"],
-        )
+    ) -> list["LiveRecording"]:
+        return [
+            self.live_recorder.record(
+                self.ffmpeg.path,
+                u,
+                p,
+                t,
+                self.proxy_tiktok if tiktok else self.proxy,
+                self.headers["User-Agent"],
+                self.cache,
+                self.log,
+            )
+            for u, p, t in commands
+        ]
 
-    async def batch_processing(self, data: list[dict], root: Path, **kwargs):
+    async def batch_processing(
+        self, data: list[dict], root: Path, **kwargs
+    ) -> set[str]:
+        """返回存在文件下载失败的作品 ID"""
         count = SimpleNamespace(
             downloaded_image=set(),
             skipped_image=set(),
@@ -276,6 +287,7 @@ class Downloader:
             skipped_live=set(),
         )
         tasks = []
+        downloaded = await self.recorder.has_ids([item["id"] for item in data])
         for item in data:
             item["desc"] = beautify_string(item["desc"], DESCRIPTION_LENGTH)
             name = self.generate_detail_name(item)
@@ -291,6 +303,7 @@ class Downloader:
                 "item": item,
                 "temp_root": temp_root,
                 "actual_root": actual_root,
+                "downloaded": downloaded,
             }
             if (t := item["type"]) == _("图集"):
                 await self.download_image(
@@ -308,6 +321,7 @@ class Downloader:
                 await self.download_image(
                     suffix="mp4",
                     type_=_("实况"),
+                    pool="live",
                     **params,
                     skipped=count.skipped_live,
                 )
@@ -318,16 +332,17 @@ class Downloader:
                 type=_("音乐"),
             )
             self.download_cover(**params)
-        await self.downloader_chart(
+        results = await self.downloader_chart(
             tasks, count, self.__general_progress_object(), **kwargs
         )
         self.statistics_count(count)
+        return {task[4] for task, result in zip(tasks, results) if result is False}
 
     async def downloader_chart(
         self,
         tasks: list[tuple],
         count: SimpleNamespace,
-        progress: Progress,
+        progress: SharedProgress,
         semaphore: Semaphore = None,
         **kwargs,
     ):
@@ -342,7 +357,7 @@ class Downloader:
                 )
                 for task in tasks
             ]
-            await gather(*tasks)
+            return await gather(*tasks)
 
     def deal_folder_path(
         self,
@@ -378,6 +393,8 @@ class Downloader:
         actual_root: Path,
         suffix: str = "jpeg",
         type_: str = _("图集"),
+        pool: str = "image",
+        downloaded: set[str] = None,
     ) -> None:
         if not item["downloads"]:
             self.log.error(
@@ -386,11 +403,16 @@ class Downloader:
                 )
             )
             return
+        mirrors = item.get("mirrors") or []
         for index, img in enumerate(
             item["downloads"],
             start=1,
         ):
-            if await self.is_downloaded(id_):
+            if (
+                id_ in downloaded
+                if downloaded is not None
+                else await self.is_downloaded(id_)
+            ):
                 skipped.add(id_)
                 self.log.info(
                     _("【{type}】{name} 存在下载记录，跳过下载").format(
@@ -409,12 +431,15 @@ class Downloader:
                 continue
             tasks.append(
                 (
-                    img,
+                    mirrors[index - 1]
+                    if index <= len(mirrors) and mirrors[index - 1]
+                    else img,
                     temp_root.with_name(f"{name}_{index}.{suffix}"),
                     p,
                     f"【{type_}】{name}_{index}",
                     id_,
                     suffix,
+                    pool,
                 )
             )
 
@@ -429,6 +454,7 @@ class Downloader:
         actual_root: Path,
         suffix: str = "mp4",
         type_: str = _("视频"),
+        downloaded: set[str] = None,
     ) -> None:
         if not item["downloads"]:
             self.log.error(
@@ -437,11 +463,13 @@ class Downloader:
                 )
             )
             return
-        if await self.is_skip(
-            id_,
-            p := actual_root.with_name(
-                f"{name}.{suffix}",
-            ),
+        p = actual_root.with_name(
+            f"{name}.{suffix}",
+        )
+        if (
+            id_ in downloaded or self.is_exists(p)
+            if downloaded is not None
+            else await self.is_skip(id_, p)
         ):
             self.log.info(
                 _("【{type}】{name} 存在下载记录或文件已存在，跳过下载").format(
@@ -453,12 +481,13 @@ class Downloader:
             return
         tasks.append(
             (
-                item["downloads"],
+                item.get("mirrors") or item["downloads"],
                 temp_root.with_name(f"{name}.{suffix}"),
                 p,
                 f"【{type_}】{name}",
                 id_,
                 suffix,
+                "video",
             )
         )
 
@@ -492,6 +521,7 @@ class Downloader:
                     ),
                     id_,
                     suffix,
+                    "music",
                 )
             )
 
@@ -524,6 +554,7 @@ class Downloader:
                     f"【封面】{name}",
                     id_,
                     static_suffix,
+                    "cover",
                 )
             )
         if all(
@@ -543,6 +574,7 @@ class Downloader:
                     f"【动图】{name}",
                     id_,
                     dynamic_suffix,
+                    "cover",
                 )
             )
 
@@ -558,12 +590,13 @@ class Downloader:
     @Retry.retry
     async def request_file(
         self,
-        url: str,
+        url: str | list[str],
         temp: Path,
         actual: Path,
         show: str,
         id_: str,
         suffix: str,
+        pool: str,
         count: SimpleNamespace,
         progress: Progress,
         headers: dict = None,
@@ -571,7 +604,10 @@ class Downloader:
         unknown_size=False,
         semaphore: Semaphore = None,
     ) -> bool | None:
-        async with semaphore or self.semaphore:
+        async with semaphore or (self.pools_tiktok if tiktok else self.pools)[pool]:
+            # 存在多个镜像地址时，优先使用响应最快的主机，失败或速度过低时切换镜像地址
+            urls = self.mirrors.sort(url) if isinstance(url, list) else [url]
+            url = urls[0]
             client = self.client_tiktok if tiktok else self.client
             headers = self.__adapter_headers(
                 headers,
@@ -588,14 +624,21 @@ class Downloader:
                     headers,
                     temp,
                 )
+                await self.limiter.acquire()
+                start = monotonic()
                 async with client.stream(
                     "GET",
                     url,
                     headers=headers,
                 ) as response:
+                    self.mirrors.record(url, monotonic() - start)
                     if response.status_code == 416:
                         raise CacheError(_("文件缓存异常，尝试重新下载"))
+                    # CDN 返回 403 通常是链接过期，仅在 429 时降低下载请求速率
+                    if response.status_code == 429:
+                        self.limiter.penalize()
                     response.raise_for_status()
+                    self.limiter.recover()
                     length, suffix = self._extract_content(
                         response.headers,
                         suffix,
@@ -611,7 +654,24 @@ class Downloader:
                         unknown_size,
                         show,
                     ):
+                        case 1 if self.__segmentable(response, length, position):
+                            await response.aclose()
+                            return await self.download_file_segmented(
+                                client,
+                                url,
+                                headers,
+                                temp,
+                                actual.with_suffix(
+                                    f".{suffix}",
+                                ),
+                                show,
+                                id_,
+                                length,
+                                count,
+                                progress,
+                            )
                         case 1:
+                            self.__reset_segments_cache(temp)
                             return await self.download_file(
                                 temp,
                                 actual.with_suffix(
@@ -624,6 +684,7 @@ class Downloader:
                                 position,
                                 count,
                                 progress,
+                                urls if len(urls) > 1 else None,
                             )
                         case 0:
                             return True
@@ -632,9 +693,11 @@ class Downloader:
                         case _:
                             raise DownloaderError
             except RequestError as e:
+                self.mirrors.fail(url)
                 self.log.warning(_("网络异常: {error_repr}").format(error_repr=repr(e)))
                 return False
             except HTTPStatusError as e:
+                self.mirrors.fail(url)
                 self.log.warning(
                     _("响应码异常: {error_repr}").format(error_repr=repr(e))
                 )
@@ -646,6 +709,7 @@ class Downloader:
                 return False
             except CacheError as e:
                 self.delete(temp)
+                self.delete(self.__segments_file(temp))
                 self.log.error(str(e))
                 return False
             except Exception as e:
@@ -669,21 +733,29 @@ class Downloader:
         position: int,
         count: SimpleNamespace,
         progress: Progress,
+        mirrors: list[str] = None,
     ) -> bool:
+        """mirrors 参数不为空时检测下载速度，速度过低则中断下载以切换镜像地址，mirrors[0] 为当前地址"""
         task_id = progress.add_task(
             beautify_string(show, self.truncate),
             total=content or None,
             completed=position,
         )
+        start, received = monotonic(), 0
+        self.streaming += 1
         try:
             async with open(cache, "ab") as f:
                 async for chunk in response.aiter_bytes(self.chunk):
                     await f.write(chunk)
                     progress.update(task_id, advance=len(chunk))
+                    received += len(chunk)
+                    if mirrors:
+                        self.__check_speed(mirrors, start, received)
                 progress.remove_task(task_id)
         except (
             RequestError,
             StreamError,
+            MirrorError,
         ) as e:
             progress.remove_task(task_id)
             self.log.warning(
@@ -692,6 +764,8 @@ class Downloader:
             # self.delete_file(cache)
             await self.recorder.delete_id(id_)
             return False
+        finally:
+            self.streaming -= 1
         self.save_file(cache, actual)
         self.log.info(_("{show} 文件下载成功").format(show=show))
         self.log.info(f"文件路径 {actual.resolve()}", False)
@@ -699,6 +773,178 @@ class Downloader:
         self.add_count(show, id_, count)
         return True
 
+    def __check_speed(self, mirrors: list[str], start: float, received: int) -> None:
+        """同时下载的文件共享带宽，速度阈值按正在下载的文件数量平分；
+        最后一次重试或者没有更快的镜像地址时不中断下载"""
+        if (
+            not MIRROR_MIN_SPEED
+            or (elapsed := monotonic() - start) <= MIRROR_PROBE_TIME
+        ):
+            return
+        speed = MIRROR_MIN_SPEED / max(self.streaming, 1)
+        if (
+            received / elapsed < speed
+            and not Retry.final_attempt()
+            and self.mirrors.has_faster(mirrors[0], mirrors)
+        ):
+            self.mirrors.fail(mirrors[0])
+            raise MirrorError(
+                _("下载速度低于 {speed}/s，尝试切换镜像地址").format(
+                    speed=format_size(speed)
+                )
+            )
+
+    async def download_file_segmented(
+        self,
+        client: "AsyncClient",
+        url: str,
+        headers: dict,
+        cache: Path,
+        actual: Path,
+        show: str,
+        id_: str,
+        length: int,
+        count: SimpleNamespace,
+        progress: Progress,
+    ) -> bool:
+        """分段并发下载文件，各分段按偏移量写入同一个缓存文件"""
+        segments = self.__read_segments(cache, length)
+        state = SimpleNamespace(saved=0, lock=Lock())
+        await self.__save_segments(cache, length, segments, state, True)
+        task_id = progress.add_task(
+            beautify_string(show, self.truncate),
+            total=length,
+            completed=sum(i[2] for i in segments),
+        )
+        results = await gather(
+            *[
+                self.__download_segment(
+                    client,
+                    url,
+                    headers,
+                    cache,
+                    segment,
+                    segments,
+                    length,
+                    state,
+                    progress,
+                    task_id,
+                )
+                for segment in segments
+            ],
+            return_exceptions=True,
+        )
+        progress.remove_task(task_id)
+        if errors := [i for i in results if isinstance(i, BaseException)]:
+            # 保存最终进度，以便下次继续下载
+            await self.__save_segments(cache, length, segments, state, True)
+            self.log.warning(
+                _("{show} 下载中断，错误信息：{error}").format(
+                    show=show, error=errors[0]
+                )
+            )
+            await self.recorder.delete_id(id_)
+            return False
+        self.delete(self.__segments_file(cache))
+        self.save_file(cache, actual)
+        self.log.info(_("{show} 文件下载成功").format(show=show))
+        self.log.info(f"文件路径 {actual.resolve()}", False)
+        await self.recorder.update_id(id_)
+        self.add_count(show, id_, count)
+        return True
+
+    async def __download_segment(
+        self,
+        client: "AsyncClient",
+        url: str,
+        headers: dict,
+        cache: Path,
+        segment: list[int],
+        segments: list[list[int]],
+        length: int,
+        state: SimpleNamespace,
+        progress: Progress,
+        task_id,
+    ) -> None:
+        start, end, done = segment
+        if start + done > end:
+            return
+        headers = headers | {"Range": f"bytes={start + done}-{end}"}
+        async with client.stream(
+            "GET",
+            url,
+            headers=headers,
+        ) as response:
+            if response.status_code != 206:
+                raise CacheError(_("服务器未返回分段数据，尝试重新下载"))
+            async with open(cache, "r+b") as f:
+                await f.seek(start + done)
+                async for chunk in response.aiter_bytes(self.chunk):
+                    chunk = chunk[: end - start + 1 - segment[2]]
+                    await f.write(chunk)
+                    segment[2] += len(chunk)
+                    progress.update(task_id, advance=len(chunk))
+                    await self.__save_segments(cache, length, segments, state)
+        if start + segment[2] <= end:
+            raise StreamError(_("分段数据不完整"))
+
+    @staticmethod
+    def __segments_file(cache: Path) -> Path:
+        return cache.with_name(f"{cache.name}.segments")
+
+    def __segmentable(
+        self,
+        response,
+        length: int,
+        position: int,
+    ) -> bool:
+        """服务器支持 Range 请求且文件大小超过阈值时启用分段下载"""
+        return all(
+            (
+                SEGMENT_COUNT > 1,
+                response.status_code == 206,
+                not position,
+                length >= SEGMENT_THRESHOLD,
+            )
+        )
+
+    def __read_segments(self, cache: Path, length: int) -> list[list[int]]:
+        """读取分段下载进度，缓存无效时重新划分分段并预分配缓存文件"""
+        file = self.__segments_file(cache)
+        try:
+            data = loads(file.read_text(encoding="UTF-8"))
+            if data["length"] == length and cache.is_file():
+                return data["segments"]
+        except (FileNotFoundError, JSONDecodeError, KeyError, TypeError):
+            pass
+        size = -(-length // SEGMENT_COUNT)
+        segments = [[i, min(i + size, length) - 1, 0] for i in range(0, length, size)]
+        with cache.open("wb") as f:
+            f.truncate(length)
+        return segments
+
+    async def __save_segments(
+        self,
+        cache: Path,
+        length: int,
+        segments: list[list[int]],
+        state: SimpleNamespace,
+        force: bool = False,
+    ) -> None:
+        """按间隔时间保存分段下载进度，各分段共用同一个状态，避免每个数据块都写入文件"""
+        if not force and monotonic() - state.saved < SEGMENT_SAVE_INTERVAL:
+            return
+        state.saved = monotonic()
+        async with state.lock:
+            async with open(self.__segments_file(cache), "w", encoding="UTF-8") as f:
+                await f.write(dumps({"length": length, "segments": segments}))
+
+    def __reset_segments_cache(self, cache: Path) -> None:
+        """分段缓存不能用于整体续传，需要删除后重新下载"""
+        if (file := self.__segments_file(cache)).is_file():
+            self.delete(cache)
+            self.delete(file)
+
     def __record_request_messages(
         self,
         show: str,
@@ -906,8 +1152,10 @@ class Downloader:
         )
         return int(length), suffix
 
-    @staticmethod
-    def __get_resume_byte_position(file: Path) -> int:
+    def __get_resume_byte_position(self, file: Path) -> int:
+        # 分段下载的缓存文件已预分配空间，由分段进度记录负责断点续传
+        if self.__segments_file(file).is_file():
+            return 0
         return file.stat().st_size if file.is_file() else 0
 
     def __update_headers_range(
@@ -1,6 +1,7 @@
 from .aBogus import ABogus
 from .device_id import DeviceId
 from .msToken import MsToken, MsTokenTikTok
+from .signer import Signer
 from .ttWid import TtWid, TtWidTikTok
 from .verifyFp import VerifyFp
 from .webID import WebId
@@ -1,3 +1,5 @@
+from functools import lru_cache
+from hashlib import new
 from random import choice, randint, random
 from re import compile
 from time import time
@@ -7,6 +9,12 @@ from gmssl import func, sm3
 
 from src.custom import USERAGENT
 
+try:
+    new("sm3")
+    HASHLIB_SM3 = True
+except ValueError:
+    HASHLIB_SM3 = False  # OpenSSL 未提供 SM3 时使用 gmssl 计算
+
 __all__ = [
     "ABogus",
 ]
@@ -497,14 +505,23 @@ class ABogus:
             a.append(cls.__arguments[2] >> j)
         return [int(i) & 255 for i in a]
 
-    def generate_method_code(self, method: str = "GET") -> list[int]:
-        return self.sm3_to_array(self.sm3_to_array(method + self.__end_string))
+    @classmethod
+    @lru_cache(maxsize=None)
+    def generate_method_code(cls, method: str = "GET") -> list[int]:
+        """请求方法的哈希值固定不变，仅计算一次"""
+        return cls.sm3_to_array(cls.sm3_to_array(method + cls.__end_string))
         # return self.sum(self.sum(method + self.__end_string))
 
     def generate_params_code(self, params: str) -> list[int]:
         return self.sm3_to_array(self.sm3_to_array(params + self.__end_string))
         # return self.sum(self.sum(params + self.__end_string))
 
+    @staticmethod
+    def sm3_digest(data: bytes) -> bytes:
+        if HASHLIB_SM3:
+            return new("sm3", data).digest()
+        return bytes.fromhex(sm3.sm3_hash(func.bytes_to_list(data)))
+
     @classmethod
     def sm3_to_array(cls, data: str | list) -> list[int]:
         """
@@ -525,11 +542,7 @@ class ABogus:
         else:
             b = bytes(data)  # 将 List[int] 转换为字节数组
 
-        # 将字节数组转换为适合 sm3.sm3_hash 函数处理的列表格式
-        h = sm3.sm3_hash(func.bytes_to_list(b))
-
-        # 将十六进制字符串结果转换为十进制整数列表
-        return [int(h[i : i + 2], 16) for i in range(0, len(h), 2)]
+        return list(cls.sm3_digest(b))
 
     @classmethod
     def generate_browser_info(cls, platform: str = "Win32") -> str:
@@ -582,6 +595,78 @@ class ABogus:
 
         return "".join(cipher)
 
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def rc4_key_schedule(key: bytes) -> tuple[int, ...]:
+        s = list(range(256))
+        j = 0
+        for i in range(256):
+            j = (j + s[i] + key[i % len(key)]) & 255
+            s[i], s[j] = s[j], s[i]
+        return tuple(s)
+
+    @classmethod
+    def rc4_encrypt_codes(cls, data: list[int], key: bytes) -> list[int]:
+        """与 rc4_encrypt 结果相同，直接处理字符编码，编码可能大于 255"""
+        s = list(cls.rc4_key_schedule(key))
+        i = j = 0
+        cipher = []
+        for c in data:
+            i = (i + 1) & 255
+            j = (j + s[i]) & 255
+            s[i], s[j] = s[j], s[i]
+            cipher.append(s[(s[i] + s[j]) & 255] ^ c)
+        return cipher
+
+    def generate_string_2_codes(
+        self,
+        url_params: str,
+        method="GET",
+        start_time=0,
+        end_time=0,
+    ) -> list[int]:
+        a = self.generate_string_2_list(
+            url_params,
+            method,
+            start_time,
+            end_time,
+        )
+        e = self.end_check_num(a)
+        a.extend(self.browser_code)
+        a.append(e)
+        return self.rc4_encrypt_codes(a, b"y")
+
+    @classmethod
+    def generate_result_codes(cls, codes: list[int], e="s4") -> str:
+        """与 generate_result 结果相同，直接处理字符编码"""
+        table = cls.__str[e]
+        r = []
+        length = len(codes)
+        end = length - length % 3
+        for i in range(0, end, 3):
+            n = (codes[i] << 16) | (codes[i + 1] << 8) | codes[i + 2]
+            r.append(
+                table[(n & 0xFC0000) >> 18]
+                + table[(n & 0x03F000) >> 12]
+                + table[(n & 0x0FC0) >> 6]
+                + table[n & 0x3F]
+            )
+        match length - end:
+            case 1:
+                n = codes[end] << 16
+                r.append(
+                    table[(n & 0xFC0000) >> 18] + table[(n & 0x03F000) >> 12] + "=="
+                )
+            case 2:
+                n = (codes[end] << 16) | (codes[end + 1] << 8)
+                r.append(
+                    table[(n & 0xFC0000) >> 18]
+                    + table[(n & 0x03F000) >> 12]
+                    + table[(n & 0x0FC0) >> 6]
+                    + "="
+                )
+        return "".join(r)
+
     def get_value(
         self,
         url_params: dict | str,
@@ -592,12 +677,12 @@ class ABogus:
         random_num_2=None,
         random_num_3=None,
     ) -> str:
-        string_1 = self.generate_string_1(
-            random_num_1,
-            random_num_2,
-            random_num_3,
+        string_1 = (
+            self.list_1(random_num_1)
+            + self.list_2(random_num_2)
+            + self.list_3(random_num_3)
         )
-        string_2 = self.generate_string_2(
+        string_2 = self.generate_string_2_codes(
             urlencode(
                 url_params,
                 quote_via=quote,
@@ -608,7 +693,4 @@ class ABogus:
             start_time,
             end_time,
         )
-        string = string_1 + string_2
-        # return self.generate_result(
-        #     string, "s4") + self.generate_result_end(string, "s4")
-        return self.generate_result(string, "s4")
+        return self.generate_result_codes(string_1 + string_2, "s4")
@@ -0,0 +1,113 @@
+from asyncio import Future, get_running_loop
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+
+from ..custom import SIGNER_BATCH, SIGNER_MODE, SIGNER_WORKERS, USERAGENT
+from .aBogus import ABogus
+from .xBogus import XBogus
+
+__all__ = ["Signer"]
+
+
+def sign_item(
+    ab: ABogus,
+    xb: XBogus,
+    item: tuple[str, str, str | int, str],
+) -> str:
+    kind, query, argument, user_agent = item
+    if kind == "x_bogus":
+        return xb.get_x_bogus(query, argument, user_agent)
+    return ab.get_value(query, argument)
+
+
+def sign_batch(
+    ab: ABogus,
+    xb: XBogus,
+    items: list[tuple[str, str, str | int, str]],
+) -> list[str]:
+    """在工作进程或线程中批量计算签名"""
+    return [sign_item(ab, xb, i) for i in items]
+
+
+class Signer:
+    """请求参数签名服务，可将 a_bogus 与 X-Bogus 的计算转移至进程池或线程池
+
+    同一轮事件循环中提交的签名请求合并为一批发送，减少调度开销
+    """
+
+    def __init__(
+        self,
+        ab: ABogus,
+        xb: XBogus,
+        mode: str = SIGNER_MODE,
+        workers: int = SIGNER_WORKERS,
+        batch: int = SIGNER_BATCH,
+    ):
+        self.ab = ab
+        self.xb = xb
+        self.mode = mode
+        self.workers = workers
+        self.batch = batch
+        self.executor: Executor | None = None
+        self.pending: list[tuple[tuple, Future]] = []
+        self.scheduled = False
+
+    async def sign(
+        self,
+        query: str,
+        kind: str = "a_bogus",
+        argument: str | int = "GET",
+        user_agent: str = USERAGENT,
+    ) -> str:
+        """计算签名；kind 为 a_bogus 时 argument 为请求方法，为 x_bogus 时 argument 为参数版本"""
+        item = (kind, query, argument, user_agent)
+        if self.mode not in {"process", "thread"}:
+            return sign_item(self.ab, self.xb, item)
+        loop = get_running_loop()
+        future = loop.create_future()
+        self.pending.append((item, future))
+        if not self.scheduled:
+            self.scheduled = True
+            loop.call_soon(self.__dispatch)
+        return await future
+
+    def __dispatch(self):
+        self.scheduled = False
+        loop = get_running_loop()
+        if not self.executor:
+            self.executor = self.__create_executor()
+        while self.pending:
+            batch, self.pending = self.pending[: self.batch], self.pending[self.batch :]
+            task = loop.run_in_executor(
+                self.executor,
+                sign_batch,
+                self.ab,
+                self.xb,
+                [i for i, _ in batch],
+            )
+            task.add_done_callback(partial(self.__resolve, [f for _, f in batch]))
+
+    def __create_executor(self) -> Executor:
+        if self.mode == "process":
+            return ProcessPoolExecutor(self.workers)
+        return ThreadPoolExecutor(self.workers, thread_name_prefix="signer")
+
+    @staticmethod
+    def __resolve(futures: list[Future], task: Future):
+        if task.cancelled():
+            for future in futures:
+                future.cancel()
+            return
+        if error := task.exception():
+            for future in futures:
+                if not future.done():
+                    future.set_exception(error)
+            return
+        for future, result in zip(futures, task.result()):
+            if not future.done():
+                future.set_result(result)
+
+    def close(self):
+        if self.executor:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+            self.executor = None
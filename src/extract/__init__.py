@@ -1,3 +1,4 @@
 from .extractor import Extractor
+from .schema import ACCOUNT_SCHEMA, COMMENT_SCHEMA
 
-__all__ = ["Extractor"]
+__all__ = ["Extractor", "ACCOUNT_SCHEMA", "COMMENT_SCHEMA"]
@@ -0,0 +1,51 @@
+from functools import lru_cache
+from types import SimpleNamespace
+from typing import Any
+
+__all__ = ["Accessor", "compile_chain"]
+
+
+class Accessor:
+    """预编译的属性链取值器，可直接读取原始 dict / list 数据，也兼容 SimpleNamespace"""
+
+    __slots__ = ("chain", "steps", "valid")
+
+    def __init__(self, chain: str):
+        self.chain = chain
+        self.valid = True
+        steps = []
+        for attribute in chain.split("."):
+            if "[" in attribute:
+                key, index = attribute.split("[", 1)
+                try:
+                    steps.append((key, int(index.split("]", 1)[0])))
+                except ValueError:
+                    self.valid = False
+            else:
+                steps.append((attribute, None))
+        self.steps = tuple(steps)
+
+    def __call__(
+        self,
+        data: dict | list | SimpleNamespace,
+        default: Any = "",
+    ) -> Any:
+        if not self.valid:
+            return default
+        for key, index in self.steps:
+            data = data.get(key) if type(data) is dict else getattr(data, key, None)
+            if index is None:
+                if not data:
+                    return default
+            else:
+                try:
+                    data = data[index]
+                except (IndexError, KeyError, TypeError):
+                    return default
+        return data or default
+
+
+@lru_cache(maxsize=None)
+def compile_chain(chain: str) -> Accessor:
+    """编译并缓存属性链，相同属性链只解析一次"""
+    return Accessor(chain)
@@ -30,6 +30,7 @@ from ..custom import (
     condition_filter,
 )
 from ..tools import DownloaderError
+from .accessor import compile_chain
 from ..translation import _
 
 if TYPE_CHECKING:
@@ -128,26 +129,12 @@ class Extractor:
 
     @staticmethod
     def safe_extract(
-        data: SimpleNamespace | list[SimpleNamespace],
+        data: dict | SimpleNamespace | list[SimpleNamespace],
         attribute_chain: str,
         default: str | int | list | dict | SimpleNamespace = "",
     ):
-        attributes = attribute_chain.split(".")
-        for attribute in attributes:
-            if "[" in attribute:
-                parts = attribute.split("[", 1)
-                attribute = parts[0]
-                index = parts[1].split("]", 1)[0]
-                try:
-                    index = int(index)
-                    data = getattr(data, attribute, None)[index]
-                except (IndexError, TypeError, ValueError):
-                    return default
-            else:
-                data = getattr(data, attribute, None)
-                if not data:
-                    return default
-        return data or default
+        """按属性链取值，属性链编译后缓存，作品数据无需转换为 SimpleNamespace"""
+        return compile_chain(attribute_chain)(data, default)
 
     async def run(
         self,
@@ -219,7 +206,7 @@ class Extractor:
     def __extract_batch(
         self,
         container: SimpleNamespace,
-        data: SimpleNamespace,
+        data: dict,
     ) -> None:
         """批量提取作品信息"""
         container.cache = container.template.copy()
@@ -235,7 +222,7 @@ class Extractor:
     def __extract_batch_tiktok(
         self,
         container: SimpleNamespace,
-        data: SimpleNamespace,
+        data: dict,
     ) -> None:
         """批量提取作品信息"""
         container.cache = container.template.copy()
@@ -251,7 +238,7 @@ class Extractor:
     def __extract_extra_info(
         self,
         item: dict,
-        data: SimpleNamespace,
+        data: dict,
     ):
         if e := self.safe_extract(data, "anchor_info"):
             extra = dumps(e, ensure_ascii=False, indent=2, default=lambda x: vars(x))
@@ -262,7 +249,7 @@ class Extractor:
     def __extract_extra_info_tiktok(
         self,
         item: dict,
-        data: SimpleNamespace,
+        data: dict,
     ):
         # TODO: 尚未适配 TikTok 额外信息
         item["extra"] = ""
@@ -270,18 +257,18 @@ class Extractor:
     def __extract_commodity_data(
         self,
         item: dict,
-        data: SimpleNamespace,
+        data: dict,
     ):
         pass
 
     def __extract_game_data(
         self,
         item: dict,
-        data: SimpleNamespace,
+        data: dict,
     ):
         pass
 
-    def __extract_description(self, data: SimpleNamespace) -> str:
+    def __extract_description(self, data: dict) -> str:
         # 2023/11/11: 抖音不再折叠过长的作品描述
         return self.safe_extract(data, "desc")
         # if len(desc := self.safe_extract(data, "desc")) < 107:
@@ -305,7 +292,7 @@ class Extractor:
     def __extract_detail_info(
         self,
         item: dict,
-        data: SimpleNamespace,
+        data: dict,
     ) -> None:
         item["id"] = self.safe_extract(data, "aweme_id")
         item["desc"] = (
@@ -322,7 +309,7 @@ class Extractor:
     def __extract_detail_info_tiktok(
         self,
         item: dict,
-        data: SimpleNamespace,
+        data: dict,
     ) -> None:
         item["id"] = self.safe_extract(data, "id")
         item["desc"] = (
@@ -339,7 +326,7 @@ class Extractor:
     def __classifying_detail(
         self,
         item: dict,
-        data: SimpleNamespace,
+        data: dict,
     ) -> None:
         # 作品分类
         if images := self.safe_extract(data, "images"):
@@ -354,7 +341,7 @@ class Extractor:
     def __classifying_detail_tiktok(
         self,
         item: dict,
-        data: SimpleNamespace,
+        data: dict,
     ) -> None:
         if images := self.safe_extract(data, "imagePost.images"):
             self.__extract_image_info_tiktok(item, data, images)
@@ -368,7 +355,7 @@ class Extractor:
     def __extract_additional_info(
         self,
         item: dict,
-        data: SimpleNamespace,
+        data: dict,
         tiktok=False,
     ):
         # item["ratio"] = self.safe_extract(data, "video.ratio")
@@ -406,8 +393,8 @@ class Extractor:
     def __extract_image_info(
         self,
         item: dict,
-        data: SimpleNamespace,
-        images: list[SimpleNamespace],
+        data: dict,
+        images: list[dict],
     ) -> None:
         if any(
             self.safe_extract(
@@ -421,12 +408,14 @@ class Extractor:
                 data,
                 _("实况"),
             )
-            item["downloads"] = [
+            slides = [
                 self.__classify_slides_item(
                     i,
                 )
                 for i in images
             ]
+            item["downloads"] = [i[0] for i in slides]
+            item["mirrors"] = [i[1] for i in slides]
         else:
             self.__set_blank_data(
                 item,
@@ -440,11 +429,18 @@ class Extractor:
                 )
                 for i in images
             ]
+            item["mirrors"] = [
+                self.__sort_mirrors(
+                    self.safe_extract(i, "url_list", []),
+                    IMAGE_INDEX,
+                )
+                for i in images
+            ]
 
     def __extract_image_info_tiktok(
         self,
         item: dict,
-        data: SimpleNamespace,
+        data: dict,
         images: list,
     ) -> None:
         self.__set_blank_data(
@@ -459,11 +455,18 @@ class Extractor:
             )
             for i in images
         ]
+        item["mirrors"] = [
+            self.__sort_mirrors(
+                self.safe_extract(i, "imageURL.urlList", []),
+                IMAGE_TIKTOK_INDEX,
+            )
+            for i in images
+        ]
 
     def __set_blank_data(
         self,
         item: dict,
-        data: SimpleNamespace,
+        data: dict,
         type_=_("图集"),
     ):
         item["type"] = type_
@@ -476,11 +479,11 @@ class Extractor:
     def __extract_video_info(
         self,
         item: dict,
-        data: SimpleNamespace,
+        data: dict,
         type_=_("视频"),
     ) -> None:
         item["type"] = type_
-        item["height"], item["width"], item["downloads"] = (
+        item["height"], item["width"], item["downloads"], item["mirrors"] = (
             self.__extract_video_download(
                 data,
             )
@@ -493,19 +496,30 @@ class Extractor:
 
     def __classify_slides_item(
         self,
-        item: SimpleNamespace,
-    ) -> str:
+        item: dict,
+    ) -> tuple[str, list[str]]:
         if self.safe_extract(item, "video"):
             return self.__extract_video_download(
                 item,
-            )[-1]
-        return self.safe_extract(item, f"url_list[{IMAGE_INDEX}]")
+            )[-2:]
+        return self.safe_extract(item, f"url_list[{IMAGE_INDEX}]"), self.__sort_mirrors(
+            self.safe_extract(item, "url_list", []),
+            IMAGE_INDEX,
+        )
+
+    @staticmethod
+    def __sort_mirrors(urls: list[str], index: int) -> list[str]:
+        """返回全部镜像下载地址，默认索引的地址排在首位"""
+        if not urls:
+            return []
+        first = urls[index]
+        return [first, *(i for i in urls if i != first)]
 
     def __extract_video_download(
         self,
-        data: SimpleNamespace,
-    ) -> tuple[int, int, str]:
-        bit_rate: list[SimpleNamespace] = self.safe_extract(
+        data: dict,
+    ) -> tuple[int, int, str, list[str]]:
+        bit_rate: list[dict] = self.safe_extract(
             data,
             "video.bit_rate",
             [],
@@ -513,12 +527,12 @@ class Extractor:
         try:
             bit_rate: list[tuple[int, int, int, int, int, list[str]]] = [
                 (
-                    i.FPS,
-                    i.bit_rate,
-                    i.play_addr.data_size,
-                    i.play_addr.height,
-                    i.play_addr.width,
-                    i.play_addr.url_list,
+                    i["FPS"],
+                    i["bit_rate"],
+                    i["play_addr"]["data_size"],
+                    i["play_addr"]["height"],
+                    i["play_addr"]["width"],
+                    i["play_addr"]["url_list"],
                 )
                 for i in bit_rate
             ]
@@ -538,11 +552,12 @@ class Extractor:
                     bit_rate[-1][-3],
                     bit_rate[-1][-2],
                     bit_rate[-1][-1][VIDEO_INDEX],
+                    self.__sort_mirrors(bit_rate[-1][-1], VIDEO_INDEX),
                 )
                 if bit_rate
-                else (-1, -1, "")
+                else (-1, -1, "", [])
             )
-        except AttributeError:
+        except (KeyError, TypeError):
             self.log.error(
                 f"视频下载地址解析失败: {data}",
                 False,
@@ -561,12 +576,12 @@ class Extractor:
                 bit_rate[0],
                 f"play_addr.url_list[{VIDEO_INDEX}]",
             )
-            return height, width, url
+            return height, width, url, [url] if url else []
 
     def __extract_video_info_tiktok(
         self,
         item: dict,
-        data: SimpleNamespace,
+        data: dict,
         type_=_("视频"),
     ) -> None:
         item["type"] = type_
@@ -574,7 +589,7 @@ class Extractor:
         #     data,
         #     "video.playAddr",
         # )  # 视频文件大小优先
-        item["height"], item["width"], item["downloads"] = (
+        item["height"], item["width"], item["downloads"], item["mirrors"] = (
             self.__extract_video_download_tiktok(
                 data,
             )
@@ -594,9 +609,9 @@ class Extractor:
 
     def __extract_video_download_tiktok(
         self,
-        data: SimpleNamespace,
-    ) -> tuple[int, int, str]:
-        bitrate_info: list[SimpleNamespace] = self.safe_extract(
+        data: dict,
+    ) -> tuple[int, int, str, list[str]]:
+        bitrate_info: list[dict] = self.safe_extract(
             data,
             "video.bitrateInfo",
             [],
@@ -604,11 +619,11 @@ class Extractor:
         try:
             bitrate_info: list[tuple[int, str, int, int, list[str]]] = [
                 (
-                    i.Bitrate,
-                    i.PlayAddr.DataSize,
-                    i.PlayAddr.Height,
-                    i.PlayAddr.Width,
-                    i.PlayAddr.UrlList,
+                    i["Bitrate"],
+                    i["PlayAddr"]["DataSize"],
+                    i["PlayAddr"]["Height"],
+                    i["PlayAddr"]["Width"],
+                    i["PlayAddr"]["UrlList"],
                 )
                 for i in bitrate_info
             ]
@@ -627,11 +642,12 @@ class Extractor:
                     bitrate_info[-1][-3],
                     bitrate_info[-1][-2],
                     bitrate_info[-1][-1][VIDEO_TIKTOK_INDEX],
+                    self.__sort_mirrors(bitrate_info[-1][-1], VIDEO_TIKTOK_INDEX),
                 )
                 if bitrate_info
-                else (-1, -1, "")
+                else (-1, -1, "", [])
             )
-        except AttributeError:
+        except (KeyError, TypeError):
             self.log.error(
                 f"视频下载地址解析失败: {data}",
                 False,
@@ -650,7 +666,7 @@ class Extractor:
                 bitrate_info[0],
                 f"PlayAddr.UrlList[{VIDEO_TIKTOK_INDEX}]",
             )
-            return height, width, url
+            return height, width, url, [url] if url else []
 
     @staticmethod
     def time_conversion(time_: int) -> str:
@@ -666,7 +682,7 @@ class Extractor:
     def __extract_text_extra(
         self,
         item: dict,
-        data: SimpleNamespace,
+        data: dict,
     ):
         """作品标签"""
         text = [
@@ -678,7 +694,7 @@ class Extractor:
     def __extract_text_extra_tiktok(
         self,
         item: dict,
-        data: SimpleNamespace,
+        data: dict,
     ):
         """作品标签"""
         text = [
@@ -690,7 +706,7 @@ class Extractor:
     def __extract_cover(
         self,
         item: dict,
-        data: SimpleNamespace,
+        data: dict,
         has=False,
     ) -> None:
         if has:
@@ -708,7 +724,7 @@ class Extractor:
     def __extract_cover_tiktok(
         self,
         item: dict,
-        data: SimpleNamespace,
+        data: dict,
         has=False,
     ) -> None:
         if has:
@@ -722,7 +738,7 @@ class Extractor:
     def __extract_music(
         self,
         item: dict,
-        data: SimpleNamespace,
+        data: dict,
         tiktok=False,
     ) -> None:
         if music_data := self.safe_extract(data, "music"):
@@ -744,7 +760,7 @@ class Extractor:
         item["music_title"] = title
         item["music_url"] = url
 
-    def __extract_statistics(self, item: dict, data: SimpleNamespace) -> None:
+    def __extract_statistics(self, item: dict, data: dict) -> None:
         data = self.safe_extract(data, "statistics")
         for i in self.statistics_keys:
             item[i] = self.safe_extract(
@@ -756,7 +772,7 @@ class Extractor:
     def __extract_statistics_tiktok(
         self,
         item: dict,
-        data: SimpleNamespace,
+        data: dict,
     ) -> None:
         data = self.safe_extract(data, "stats")
         for i, j in enumerate(self.statistics_keys_tiktok):
@@ -769,7 +785,7 @@ class Extractor:
     def __extract_tags(
         self,
         item: dict,
-        data: SimpleNamespace,
+        data: dict,
     ) -> None:
         if not (t := self.safe_extract(data, "video_tag")):
             item["tag"] = []
@@ -779,7 +795,7 @@ class Extractor:
     def __extract_tags_tiktok(
         self,
         item: dict,
-        data: SimpleNamespace,
+        data: dict,
     ) -> None:
         if not (t := self.safe_extract(data, "textExtra")):
             item["tag"] = []
@@ -789,7 +805,7 @@ class Extractor:
     def __extract_account_info(
         self,
         container: SimpleNamespace,
-        data: SimpleNamespace,
+        data: dict,
         key="author",
     ) -> None:
         data = self.safe_extract(data, key)
@@ -807,7 +823,7 @@ class Extractor:
     def __extract_account_info_tiktok(
         self,
         container: SimpleNamespace,
-        data: SimpleNamespace,
+        data: dict,
         key="author",
     ) -> None:
         data = self.safe_extract(data, key)
@@ -821,7 +837,7 @@ class Extractor:
     def __extract_nickname_info(
         self,
         container: SimpleNamespace,
-        data: SimpleNamespace,
+        data: dict,
     ) -> None:
         if container.same:
             container.cache["nickname"] = container.name
@@ -934,14 +950,13 @@ class Extractor:
     ):
         """从多个数据返回对象"""
         for item in data:
-            item = self.generate_data_object(item)
             if id_ == self.safe_extract(item, key):
                 return item
         raise DownloaderError(_("提取账号信息或合集信息失败，请向作者反馈！"))
 
     def __extract_pretreatment_data(
         self,
-        item: SimpleNamespace,
+        item: dict,
         id_: str,
         name: str,
         mark: str,
@@ -972,7 +987,7 @@ class Extractor:
             [
                 self.__extract_batch_tiktok(
                     container,
-                    self.generate_data_object(item),
+                    item,
                 )
                 for item in data
             ]
@@ -980,7 +995,7 @@ class Extractor:
             [
                 self.__extract_batch(
                     container,
-                    self.generate_data_object(item),
+                    item,
                 )
                 for item in data
             ]
@@ -1032,10 +1047,7 @@ class Extractor:
         if source:
             container.all_data = data
         else:
-            [
-                self.__extract_comments_data(container, self.generate_data_object(i))
-                for i in data
-            ]
+            [self.__extract_comments_data(container, i) for i in data]
             container.all_data = self.__clean_extract_data(
                 container.all_data, self.comment_necessary_keys
             )
@@ -1045,7 +1057,7 @@ class Extractor:
     def __extract_comments_data(
         self,
         container: SimpleNamespace,
-        data: SimpleNamespace,
+        data: dict,
     ):
         container.cache = container.template.copy()
         container.cache["create_timestamp"] = self.safe_extract(data, "create_time")
@@ -1080,7 +1092,6 @@ class Extractor:
             cache=None,
         )
         for item in data:
-            item = cls.generate_data_object(item)
             container.cache = {
                 "reply_comment_total": cls.safe_extract(
                     item,
@@ -1275,17 +1286,14 @@ class Extractor:
             },
             same=False,
         )
-        [
-            self.__search_result_classify(container, self.generate_data_object(i))
-            for i in data
-        ]
+        [self.__search_result_classify(container, i) for i in data]
         await self.__record_data(recorder, container.all_data)
         return container.all_data
 
     def __search_result_classify(
         self,
         container: SimpleNamespace,
-        data: SimpleNamespace,
+        data: dict,
     ):
         if d := self.safe_extract(data, "aweme_info"):
             self.__extract_batch(container, d)
@@ -1414,8 +1422,7 @@ class Extractor:
 
     async def __record_data(self, record, data: list[dict]):
         # 记录数据
-        for i in data:
-            await record.save(self.__extract_values(record, i))
+        await record.save_many([self.__extract_values(record, i) for i in data])
 
     @staticmethod
     def __extract_values(record, data: dict) -> list:
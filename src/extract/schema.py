@@ -0,0 +1,104 @@
+from typing import Any
+
+try:
+    from msgspec import UNSET, Struct, UnsetType
+except ImportError:
+    Struct = None
+
+__all__ = ["ACCOUNT_SCHEMA", "COMMENT_SCHEMA"]
+
+# 仅声明提取作品与评论数据时读取的字段，未声明的字段在解析时直接跳过
+# 字段类型不符时 decode_json 会回退为完整解析，因此叶子字段统一使用 Any
+# 字段默认值为 UNSET，转换为 dict 时缺少的字段不会输出，值为 null 的字段保留为 None，与标准库解析结果一致
+if Struct:
+
+    class URLList(Struct):
+        url_list: Any = UNSET
+
+    class PlayAddr(Struct):
+        uri: Any = UNSET
+        url_list: Any = UNSET
+        data_size: Any = UNSET
+        height: Any = UNSET
+        width: Any = UNSET
+
+    class BitRate(Struct):
+        FPS: Any = UNSET
+        bit_rate: Any = UNSET
+        play_addr: PlayAddr | None | UnsetType = UNSET
+
+    class Video(Struct):
+        duration: Any = UNSET
+        play_addr: PlayAddr | None | UnsetType = UNSET
+        bit_rate: list[BitRate] | None | UnsetType = UNSET
+        dynamic_cover: URLList | None | UnsetType = UNSET
+        cover: URLList | None | UnsetType = UNSET
+
+    class Image(Struct):
+        url_list: Any = UNSET
+        video: Video | None | UnsetType = UNSET
+
+    class Music(Struct):
+        author: Any = UNSET
+        title: Any = UNSET
+        play_url: URLList | None | UnsetType = UNSET
+
+    class Author(Struct):
+        uid: Any = UNSET
+        sec_uid: Any = UNSET
+        unique_id: Any = UNSET
+        signature: Any = UNSET
+        user_age: Any = UNSET
+        nickname: Any = UNSET
+
+    class Work(Struct):
+        aweme_id: Any = UNSET
+        desc: Any = UNSET
+        create_time: Any = UNSET
+        text_extra: Any = UNSET
+        images: list[Image] | None | UnsetType = UNSET
+        video: Video | None | UnsetType = UNSET
+        music: Music | None | UnsetType = UNSET
+        statistics: Any = UNSET
+        video_tag: Any = UNSET
+        author: Author | None | UnsetType = UNSET
+        anchor_info: Any = UNSET
+        mix_info: Any = UNSET
+
+    class AccountPage(Struct):
+        status_code: Any = UNSET
+        filter_list: Any = UNSET
+        aweme_list: list[Work] | None | UnsetType = UNSET
+        max_cursor: Any = UNSET
+        has_more: Any = UNSET
+
+    class CommentImage(Struct):
+        origin_url: URLList | None | UnsetType = UNSET
+
+    class Sticker(Struct):
+        static_url: URLList | None | UnsetType = UNSET
+
+    class CommentItem(Struct):
+        cid: Any = UNSET
+        create_time: Any = UNSET
+        ip_label: Any = UNSET
+        text: Any = UNSET
+        image_list: list[CommentImage] | None | UnsetType = UNSET
+        sticker: Sticker | None | UnsetType = UNSET
+        digg_count: Any = UNSET
+        reply_to_reply_id: Any = UNSET
+        reply_comment_total: Any = UNSET
+        reply_id: Any = UNSET
+        user: Author | None | UnsetType = UNSET
+
+    class CommentPage(Struct):
+        status_code: Any = UNSET
+        filter_list: Any = UNSET
+        comments: list[CommentItem] | None | UnsetType = UNSET
+        cursor: Any = UNSET
+        has_more: Any = UNSET
+
+    ACCOUNT_SCHEMA = AccountPage
+    COMMENT_SCHEMA = CommentPage
+else:
+    ACCOUNT_SCHEMA = COMMENT_SCHEMA = None
@@ -1,6 +1,7 @@
 from datetime import date, datetime, timedelta
-from typing import TYPE_CHECKING, Callable, Coroutine, Type, Union
+from typing import TYPE_CHECKING, AsyncIterator, Callable, Coroutine, Type, Union
 
+from src.extract import ACCOUNT_SCHEMA
 from src.interface.template import API
 from src.translation import _
 
@@ -39,6 +40,13 @@ class Account(API):
         self.cursor = cursor
         self.count = count
         self.text = _("账号喜欢作品") if self.favorite else _("账号发布作品")
+        self.synced = 0  # 上次完整同步的最新作品发布时间，获取到更早的作品时提前结束
+        self.truncated = False  # 是否因日期限制或数据异常提前结束
+
+    @property
+    def complete(self) -> bool:
+        """是否已获取上次同步后发布的全部作品"""
+        return self.finished and not self.truncated
 
     async def run(
         self,
@@ -96,6 +104,47 @@ class Account(API):
                 return self.response, self.earliest, self.latest
         raise ValueError
 
+    async def stream(
+        self,
+        referer: str = None,
+        data_key: str = "aweme_list",
+        error_text="",
+        cursor="max_cursor",
+        has_more="has_more",
+        params: Callable = lambda: {},
+        data: Callable = lambda: {},
+        method="GET",
+        headers: dict = None,
+        keep: bool = False,
+        *args,
+        **kwargs,
+    ) -> AsyncIterator[list[dict]]:
+        """逐页返回账号作品数据，默认不保留已返回的数据"""
+        self.schema = ACCOUNT_SCHEMA
+        if self.favorite:
+            self.set_referer(f"{self.domain}user/{self.sec_user_id}?showTab=like")
+        else:
+            self.set_referer(f"{self.domain}user/{self.sec_user_id}")
+        async for page in self.iter_pages(
+            data_key,
+            error_text
+            or _(
+                "该账号为私密账号，需要使用登录后的 Cookie，且登录的账号需要关注该私密账号"
+            ),
+            cursor,
+            has_more,
+            params,
+            data,
+            method,
+            headers,
+            self.early_stop,
+            keep,
+            *args,
+            **kwargs,
+        ):
+            yield page
+        self.summary_works()
+
     async def run_single(
         self,
         data_key: str = "aweme_list",
@@ -152,13 +201,17 @@ class Account(API):
         self.summary_works()
 
     async def early_stop(self):
-        """如果获取数据的发布日期已经早于限制日期，就不需要再获取下一页的数据了"""
+        """如果获取数据的发布日期已经早于限制日期或上次同步的作品，就不需要再获取下一页的数据了"""
+        if self.favorite or self.finished:
+            return
         if (
-            not self.favorite
-            and self.earliest
+            self.earliest
             > datetime.fromtimestamp(max(int(self.cursor) / 1000, 0)).date()
         ):
             self.finished = True
+            self.truncated = True
+        elif self.synced and int(self.cursor) / 1000 < self.synced:
+            self.finished = True
 
     def generate_params(
         self,
@@ -252,11 +305,14 @@ class Account(API):
             if not (d := data_dict[data_key]):
                 self.log.warning(error_text)
                 self.finished = True
+                self.truncated = True
+                self.check_risk(data_dict)
             else:
                 self.cursor = data_dict[cursor]
                 self.append_response(d)
                 self.finished = not data_dict[has_more]
         except KeyError:
+            self.check_risk(data_dict)
             if data_dict.get("status_code") == 0:
                 self.log.warning(_("配置文件 cookie 参数未登录，数据获取已提前结束"))
             else:
@@ -264,6 +320,7 @@ class Account(API):
                     _("数据解析失败，请告知作者处理: {data}").format(data=data_dict)
                 )
             self.finished = True
+            self.truncated = True
 
 
 async def test():
@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING, Callable, Coroutine, Type, Union
+from typing import TYPE_CHECKING, AsyncIterator, Callable, Coroutine, Type, Union
 
 from src.interface.account import Account
 from src.interface.template import APITikTok
@@ -92,6 +92,40 @@ class AccountTikTok(
                 return self.response, self.earliest, self.latest
         raise ValueError
 
+    async def stream(
+        self,
+        referer: str = None,
+        data_key: str = "itemList",
+        error_text="",
+        cursor="cursor",
+        has_more="hasMore",
+        params: Callable = lambda: {},
+        data: Callable = lambda: {},
+        method="GET",
+        headers: dict = None,
+        keep: bool = False,
+        *args,
+        **kwargs,
+    ) -> AsyncIterator[list[dict]]:
+        """逐页返回账号作品数据，默认不保留已返回的数据"""
+        self.set_referer(referer)
+        async for page in self.iter_pages(
+            data_key,
+            error_text,
+            cursor,
+            has_more,
+            params,
+            data,
+            method,
+            headers,
+            self.early_stop,
+            keep,
+            *args,
+            **kwargs,
+        ):
+            yield page
+        self.summary_works()
+
     async def run_batch(
         self,
         data_key: str = "itemList",
@@ -1,6 +1,8 @@
+from asyncio import Semaphore, Task, create_task, gather
 from typing import TYPE_CHECKING, Callable, Coroutine, Type, Union
 
-from src.extract import Extractor
+from src.custom import REPLY_WORKERS
+from src.extract import COMMENT_SCHEMA, Extractor
 from src.interface.template import API
 from src.translation import _
 
@@ -10,6 +12,8 @@ if TYPE_CHECKING:
 
 
 class Comment(API):
+    schema = COMMENT_SCHEMA
+
     def __init__(
         self,
         params: Union["Parameter", "Params"],
@@ -37,6 +41,8 @@ class Comment(API):
         self.progress = None
         self.task_id = None
         self.reply = reply
+        self.reply_tasks: list[tuple[int, Task]] = []
+        self.reply_semaphore = Semaphore(REPLY_WORKERS)
 
     def generate_params(
         self,
@@ -118,6 +124,7 @@ class Comment(API):
                 *args,
                 **kwargs,
             )
+            self.progress.remove_task(self.task_id)
 
     async def update_progress(
         self,
@@ -150,31 +157,51 @@ class Comment(API):
             self.pages -= 1
             if callback:
                 await callback()
+        await self.merge_reply()
 
     async def run_reply(
         self,
     ):
+        """后台获取当前页面评论的回复，不阻塞下一页评论的请求"""
         if not self.reply:
             return
         reply_ids = Extractor.extract_reply_ids(self.current_page)
-        for reply_id in reply_ids:
+        if not reply_ids:
+            return
+        self.reply_tasks.append(
+            (
+                len(self.response),
+                create_task(
+                    gather(*(self.get_reply(i, self.pages) for i in reply_ids))
+                ),
+            )
+        )
+
+    async def get_reply(self, reply_id: str, pages: int) -> list[dict]:
+        async with self.reply_semaphore:
+            if self.pages <= 0:
+                return []
             reply = Reply(
                 self.params_object,
                 self.cookie,
                 self.proxy,
                 self.item_id,
                 reply_id,
-                self.pages,
+                pages,
                 cursor=0,
                 count=self.count_reply,
                 progress=self.progress,
                 task_id=self.task_id,
             )
-            self.response.extend(await reply.run())
-            if (p := reply.pages) > 1:
-                self.pages = p
-            else:
-                break
+            data = await reply.run()
+            self.pages -= pages - reply.pages
+            return data
+
+    async def merge_reply(self) -> None:
+        """按评论顺序将回复插入对应页面评论之后"""
+        for index, task in reversed(self.reply_tasks):
+            self.response[index:index] = [j for i in await task for j in i]
+        self.reply_tasks.clear()
 
     def check_response(
         self,
@@ -190,12 +217,14 @@ class Comment(API):
             if not (d := data_dict[data_key]):
                 self.log.info(error_text)
                 self.finished = True
+                self.check_risk(data_dict)
             else:
                 self.cursor = data_dict[cursor]
                 self.current_page = d
                 self.append_response(d)
                 self.finished = not data_dict[has_more]
         except KeyError:
+            self.check_risk(data_dict)
             self.log.error(
                 _("数据解析失败，请告知作者处理: {data}").format(data=data_dict)
             )
@@ -203,6 +232,8 @@ class Comment(API):
 
 
 class Reply(Comment):
+    schema = None  # 回复数据可能直接返回原始响应
+
     def __init__(
         self,
         params: Union["Parameter", "Params"],
@@ -11,6 +11,8 @@ if TYPE_CHECKING:
 
 
 class CommentTikTok(Comment, APITikTok):
+    schema = None
+
     def __init__(
         self,
         params: Union["Parameter", "Params"],
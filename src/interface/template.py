@@ -1,17 +1,28 @@
+from asyncio import CancelledError, Queue, create_task
+from contextlib import suppress
+from contextvars import ContextVar
 from time import time
-from typing import TYPE_CHECKING, Callable, Coroutine, Type, Union
+from typing import (
+    TYPE_CHECKING,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Coroutine,
+    Type,
+    Union,
+)
 from urllib.parse import quote, urlencode
 
-from httpx import AsyncClient, get, post
-from rich.progress import (
-    BarColumn,
-    Progress,
-    TextColumn,
-    TimeElapsedColumn,
+from httpx import AsyncClient
+from ..custom import PREFETCH_PAGES, USERAGENT
+from ..tools import (
+    RISK_CODES,
+    Retry,
+    DownloaderError,
+    SharedProgress,
+    capture_error_request,
+    decode_json,
 )
-
-from ..custom import PROGRESS, USERAGENT, wait
-from ..tools import Retry, DownloaderError, capture_error_request
 from ..translation import _
 
 if TYPE_CHECKING:
@@ -25,6 +36,11 @@ __all__ = [
 
 
 class API:
+    schema = None  # 响应数据结构，安装 msgspec 时仅解析提取数据所需字段
+    # 后台任务设置的进度回调，每获取一页数据传入该页数据数量
+    PROGRESS: ContextVar[Callable[[int], Awaitable] | None] = ContextVar(
+        "page_progress", default=None
+    )
     domain = "https://www.douyin.com/"
     short_domain = "https://www.iesdouyin.com/"
     referer = f"{domain}?recommend=1"
@@ -72,6 +88,7 @@ class API:
         self.log = params.logger
         self.ab = params.ab
         self.xb = params.xb
+        self.signer = params.signer
         self.console = params.console
         self.api = ""
         self.proxy = proxy
@@ -79,9 +96,12 @@ class API:
         self.timeout = params.timeout
         self.cookie = cookie
         self.client: AsyncClient = params.client
+        self.proxy_clients = params.proxy_clients
+        self.limiter = params.limiters["douyin"]
         self.pages = 99999
         self.cursor = 0
         self.response = []
+        self.streamed = 0  # 逐页返回且未保留的数据数量
         self.finished = False
         self.text = ""
         self.set_temp_cookie(cookie)
@@ -185,6 +205,91 @@ class API:
         callback: Type[Coroutine] = None,
         *args,
         **kwargs,
+    ):
+        async for page in self.iter_pages(
+            data_key,
+            error_text,
+            cursor,
+            has_more,
+            params,
+            data,
+            method,
+            headers,
+            callback,
+            True,
+            *args,
+            **kwargs,
+        ):
+            pass
+
+    async def iter_pages(
+        self,
+        data_key: str,
+        error_text="",
+        cursor="cursor",
+        has_more="has_more",
+        params: Callable = lambda: {},
+        data: Callable = lambda: {},
+        method="GET",
+        headers: dict = None,
+        callback: Type[Coroutine] = None,
+        keep: bool = True,
+        *args,
+        **kwargs,
+    ) -> AsyncIterator[list[dict]]:
+        """逐页返回数据，处理当前页面数据时，后台继续请求后续页面数据
+
+        keep 为 False 时不在 response 保留已返回的数据，内存占用仅与预先请求的页数相关
+        """
+        queue: Queue[list[dict] | None] = Queue(PREFETCH_PAGES)
+
+        async def produce():
+            try:
+                await self.__produce_pages(
+                    queue,
+                    keep,
+                    data_key,
+                    error_text,
+                    cursor,
+                    has_more,
+                    params,
+                    data,
+                    method,
+                    headers,
+                    callback,
+                    *args,
+                    **kwargs,
+                )
+            except Exception:
+                await queue.put(None)
+                raise
+            await queue.put(None)
+
+        producer = create_task(produce())
+        try:
+            while (page := await queue.get()) is not None:
+                yield page
+        finally:
+            if not producer.done():
+                producer.cancel()
+            with suppress(CancelledError):
+                await producer
+
+    async def __produce_pages(
+        self,
+        queue: Queue,
+        keep: bool,
+        data_key: str,
+        error_text="",
+        cursor="cursor",
+        has_more="has_more",
+        params: Callable = lambda: {},
+        data: Callable = lambda: {},
+        method="GET",
+        headers: dict = None,
+        callback: Type[Coroutine] = None,
+        *args,
+        **kwargs,
     ):
         with self.progress_object() as progress:
             task_id = progress.add_task(
@@ -193,6 +298,7 @@ class API:
             )
             while not self.finished and self.pages > 0:
                 progress.update(task_id)
+                start = len(self.response)
                 await self.run_single(
                     data_key,
                     error_text,
@@ -208,6 +314,15 @@ class API:
                 self.pages -= 1
                 if callback:
                     await callback()
+                page = self.response[start:]
+                if report := self.PROGRESS.get():
+                    await report(len(page))
+                if page:
+                    if not keep:
+                        del self.response[start:]
+                        self.streamed += len(page)
+                    await queue.put(page)
+            progress.remove_task(task_id)
 
     def check_response(
         self,
@@ -223,16 +338,32 @@ class API:
             if not (d := data_dict[data_key]):
                 self.log.warning(error_text)
                 self.finished = True
+                self.check_risk(data_dict)
             else:
                 self.cursor = data_dict[cursor]
                 self.append_response(d)
                 self.finished = not data_dict[has_more]
         except KeyError:
+            self.check_risk(data_dict)
             self.log.error(
                 _("数据解析失败，请告知作者处理: {data}").format(data=data_dict)
             )
             self.finished = True
 
+    def check_risk(self, data_dict: dict) -> None:
+        """响应包含风控标记时降低获取数据的请求速率"""
+        if self.risk_control(data_dict):
+            self.limiter.penalize()
+
+    @staticmethod
+    def risk_control(data_dict: dict) -> bool:
+        """响应包含风控标记时返回 True，账号无作品或私密账号返回的空列表不视为风控"""
+        return bool(
+            data_dict.get("status_code")
+            or data_dict.get("filter_list")
+            or any(v for k, v in data_dict.items() if k.startswith("verify"))
+        )
+
     def set_referer(self, url: str = None) -> None:
         self.headers["Referer"] = url or self.referer
 
@@ -248,10 +379,11 @@ class API:
         *args,
         **kwargs,
     ):
-        params = self.deal_url_params(
+        params = await self.deal_url_params(
             params,
             encryption,
         )
+        await self.limiter.acquire()
         match (method, bool(self.proxy)):
             case ("GET", False):
                 return await self.request_data_get(
@@ -335,13 +467,9 @@ class API:
             headers,
             **kwargs,
         )
-        response = get(
+        response = await self.proxy_clients.get(self.proxy).get(
             f"{url}?{params}",
             headers=headers,
-            proxy=self.proxy,
-            follow_redirects=True,
-            verify=False,
-            timeout=self.timeout,
             **kwargs,
         )
         return await self.__return_response(response)
@@ -378,14 +506,10 @@ class API:
             headers,
             **kwargs,
         )
-        response = post(
+        response = await self.proxy_clients.get(self.proxy).post(
             f"{url}?{params}",
             data=data,
             headers=headers,
-            proxy=self.proxy,
-            follow_redirects=True,
-            verify=False,
-            timeout=self.timeout,
             **kwargs,
         )
         return await self.__return_response(response)
@@ -396,12 +520,14 @@ class API:
         self.log.info(f"Response Headers: {dict(response.headers)}", False)
         # 记录请求体数据会导致日志文件体积过大，仅在必要时记录
         # self.log.info(f"Response Content: {response.content}", False)
+        if response.status_code in RISK_CODES:
+            self.limiter.penalize()
         response.raise_for_status()
-        await wait()
+        self.limiter.recover()
         # if response.status_code != 200:
         #     self.log.error(f"请求 {url} 失败，响应码 {response.status_code}")
         #     return
-        return response.json()
+        return decode_json(response.content, self.schema)
 
     def __record_request_messages(
         self,
@@ -419,7 +545,7 @@ class API:
         self.log.info(f"Headers: {desensitize}", False)
         self.log.info(f"Other: {kwargs}", False)
 
-    def deal_url_params(
+    async def deal_url_params(
         self,
         params: dict,
         method="GET",
@@ -430,7 +556,7 @@ class API:
                 params,
                 quote_via=quote,
             )
-            params += f"&a_bogus={self.ab.get_value(params, method)}"
+            params += f"&a_bogus={await self.signer.sign(params, 'a_bogus', method)}"
             return params
         return ""
 
@@ -439,25 +565,12 @@ class API:
     ) -> None:
         self.log.info(
             _("共获取到 {count} 个{text}").format(
-                count=len(self.response), text=self.text
+                count=len(self.response) + self.streamed, text=self.text
             )
         )
 
     def progress_object(self):
-        return Progress(
-            TextColumn(
-                "[progress.description]{task.description}",
-                style=PROGRESS,
-                justify="left",
-            ),
-            "•",
-            BarColumn(),
-            "•",
-            TimeElapsedColumn(),
-            console=self.console,
-            transient=True,
-            expand=True,
-        )
+        return SharedProgress.get(self.console)
 
     def append_response(
         self,
@@ -521,6 +634,7 @@ class APITikTok(API):
         self.headers = params.headers_tiktok.copy()
         self.cookie = cookie
         self.client: AsyncClient = params.client_tiktok
+        self.limiter = params.limiters["tiktok"]
         self.set_temp_cookie(cookie)
 
     async def request_data(
@@ -547,7 +661,7 @@ class APITikTok(API):
             **kwargs,
         )
 
-    def deal_url_params(
+    async def deal_url_params(
         self,
         params: dict,
         number=8,
@@ -559,8 +673,11 @@ class APITikTok(API):
                 quote_via=quote,
             )
             params += f"&X-Bogus={
-                self.xb.get_x_bogus(
-                    params, number, self.headers.get('User-Agent', USERAGENT)
+                await self.signer.sign(
+                    params,
+                    'x_bogus',
+                    number,
+                    self.headers.get('User-Agent', USERAGENT),
                 )
             }"
             return params
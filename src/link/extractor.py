@@ -1,3 +1,4 @@
+from asyncio import gather
 from re import compile
 from typing import TYPE_CHECKING, Union
 from urllib.parse import parse_qs, unquote, urlparse
@@ -6,6 +7,7 @@ from .requester import Requester
 
 if TYPE_CHECKING:
     from src.config import Parameter
+    from src.manager import Database
 
 __all__ = ["Extractor", "ExtractorTikTok"]
 
@@ -53,11 +55,15 @@ class Extractor:
         self,
         params: "Parameter",
         tiktok=False,
+        database: "Database" = None,
     ):
         self.client = params.client_tiktok if tiktok else params.client
+        self.database = database
         self.requester = Requester(
             params,
             self.client,
+            tiktok,
+            database,
         )
 
     async def run(
@@ -164,10 +170,11 @@ class ExtractorTikTok(Extractor):
 
     live_link = compile(r"\S*?https://www\.tiktok\.com/@[^\s/]+/live\S*?")  # 直播链接
 
-    def __init__(self, params: "Parameter"):
+    def __init__(self, params: "Parameter", database: "Database" = None):
         super().__init__(
             params,
             True,
+            database,
         )
 
     async def run(
@@ -208,7 +215,7 @@ class ExtractorTikTok(Extractor):
         urls: str,
     ) -> list[str]:
         link = self.extract_info(self.account_link, urls, 1)
-        link = [await self.__get_html_data(i, self.SEC_UID) for i in link]
+        link = await self.__get_html_data_batch(link, self.SEC_UID, "sec_uid")
         return [i for i in link if i]
 
     def __extract_detail(
@@ -219,13 +226,40 @@ class ExtractorTikTok(Extractor):
         link = self.extract_info(self.detail_link, urls, index)
         return link
 
+    async def __get_html_data_batch(
+        self,
+        urls: list[str],
+        pattern,
+        type_: str = None,
+    ) -> list[str]:
+        """并发请求页面并提取数据，传入 type_ 时解析结果保存至数据库"""
+        cache = (
+            await self.database.read_link_data(urls, type_)
+            if self.database and type_
+            else {}
+        )
+        pending = [i for i in dict.fromkeys(urls) if i not in cache]
+        resolved = dict(
+            zip(
+                pending,
+                await gather(*(self.__get_html_data(i, pattern) for i in pending)),
+            )
+        )
+        if self.database and type_:
+            await self.database.write_link_data(
+                {k: v for k, v in resolved.items() if v},
+                type_,
+            )
+        cache |= resolved
+        return [cache[i] for i in urls]
+
     async def __get_html_data(
         self,
         url: str,
         pattern,
         index=1,
     ) -> str:
-        html = await self.requester.request_url(
+        html = await self.requester.request_url_limited(
             url,
             "text",
         )
@@ -236,7 +270,7 @@ class ExtractorTikTok(Extractor):
         urls: str,
     ) -> [bool, list[str]]:
         detail = self.__extract_detail(urls, index=0)
-        detail = [await self.__get_html_data(i, self.MIX_ID) for i in detail]
+        detail = await self.__get_html_data_batch(detail, self.MIX_ID, "mix_id")
         detail = [i for i in detail if i]
         mix = self.extract_info(self.mix_link, urls, 2)
         title = [unquote(i) for i in self.extract_info(self.mix_link, urls, 1)]
@@ -247,5 +281,6 @@ class ExtractorTikTok(Extractor):
         urls: str,
     ) -> [bool, list[str]]:
         link = self.extract_info(self.live_link, urls, 0)
-        link = [await self.__get_html_data(i, self.ROOD_ID) for i in link]
+        # 直播 roomId 每次开播均会变化，不保存解析结果
+        link = await self.__get_html_data_batch(link, self.ROOD_ID)
         return True, [i for i in link if i]
@@ -1,28 +1,37 @@
+from asyncio import Semaphore, gather
 from re import compile
 from typing import TYPE_CHECKING
 
-from ..custom import BLANK_HEADERS
-from ..custom import wait
+from ..custom import BLANK_HEADERS, LINK_WORKERS
 from ..tools import Retry, DownloaderError, capture_error_request
 
 if TYPE_CHECKING:
-    from httpx import AsyncClient, get, head
+    from httpx import AsyncClient
 
     from ..config import Parameter
+    from ..manager import Database
 
 __all__ = ["Requester"]
 
 
 class Requester:
     URL = compile(r"(https?://[^\s\"<>\\^`{|}，。；！？、【】《》]+)")
+    # 直播分享链接重定向的直播间 room_id 仅对本场直播有效，解析结果不保存至数据库
+    LIVE = compile(r"https://webcast\.amemv\.com/douyin/webcast/reflow/")
     HEADERS = BLANK_HEADERS
 
     def __init__(
         self,
         params: "Parameter",
         client: "AsyncClient",
+        tiktok=False,
+        database: "Database" = None,
     ):
         self.client = client
+        self.database = database
+        self.semaphore = Semaphore(LINK_WORKERS)
+        self.limiter = params.limiters["tiktok" if tiktok else "douyin"]
+        self.proxy_clients = params.proxy_clients
         self.log = params.logger
         self.max_retry = params.max_retry
         self.timeout = params.timeout
@@ -32,20 +41,50 @@ class Requester:
         text: str,
         proxy: str = None,
     ) -> str:
-        urls = self.URL.finditer(text)
+        urls = [i.group() for i in self.URL.finditer(text)]
         if not urls:
             return ""
-        result = []
-        for i in urls:
-            result.append(
-                await self.request_url(
-                    u := i.group(),
-                    proxy=proxy,
-                )
-                or u
+        result = await self.resolve(urls, proxy)
+        return " ".join(result.get(i) or i for i in urls)
+
+    async def resolve(
+        self,
+        urls: list[str],
+        proxy: str = None,
+    ) -> dict[str, str]:
+        """并发解析链接，返回链接与重定向后链接的映射，解析结果保存至数据库"""
+        urls = list(dict.fromkeys(urls))
+        cache = await self.database.read_link_data(urls, "url") if self.database else {}
+        cache = {k: v for k, v in cache.items() if not self.LIVE.match(v)}
+        pending = [i for i in urls if i not in cache]
+        resolved = dict(
+            zip(
+                pending,
+                await gather(
+                    *(self.request_url_limited(i, proxy=proxy) for i in pending)
+                ),
+            )
+        )
+        resolved = {k: v for k, v in resolved.items() if v}
+        if self.database:
+            await self.database.write_link_data(
+                {k: v for k, v in resolved.items() if not self.LIVE.match(v)},
+                "url",
+            )
+        return cache | resolved
+
+    async def request_url_limited(
+        self,
+        url: str,
+        content="url",
+        proxy: str = None,
+    ):
+        async with self.semaphore:
+            return await self.request_url(
+                url,
+                content,
+                proxy,
             )
-            await wait()
-        return " ".join(i for i in result if i)
 
     @Retry.retry
     @capture_error_request
@@ -56,16 +95,17 @@ class Requester:
         proxy: str = None,
     ):
         self.log.info(f"URL: {url}", False)
+        await self.limiter.acquire()
         match (content in {"url", "headers"}, bool(proxy)):
             case True, True:
-                response = self.request_url_head_proxy(
+                response = await self.request_url_head_proxy(
                     url,
                     proxy,
                 )
             case True, False:
                 response = await self.request_url_head(url)
             case False, True:
-                response = self.request_url_get_proxy(
+                response = await self.request_url_get_proxy(
                     url,
                     proxy,
                 )
@@ -100,18 +140,14 @@ class Requester:
             url,
         )
 
-    def request_url_head_proxy(
+    async def request_url_head_proxy(
         self,
         url: str,
         proxy: str,
     ):
-        return head(
+        return await self.proxy_clients.get(proxy).head(
             url,
             headers=self.HEADERS,
-            proxy=proxy,
-            follow_redirects=True,
-            verify=False,
-            timeout=self.timeout,
         )
 
     async def request_url_get(
@@ -124,18 +160,14 @@ class Requester:
         response.raise_for_status()
         return response
 
-    def request_url_get_proxy(
+    async def request_url_get_proxy(
         self,
         url: str,
         proxy: str,
     ):
-        response = get(
+        response = await self.proxy_clients.get(proxy).get(
             url,
             headers=self.HEADERS,
-            proxy=proxy,
-            follow_redirects=True,
-            verify=False,
-            timeout=self.timeout,
         )
         response.raise_for_status()
         return response
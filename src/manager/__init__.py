@@ -1,9 +1,13 @@
 from .cache import Cache
 from .database import Database
+from .job import JobQueue
 from .recorder import DownloadRecorder
+from .response_cache import ResponseCache
 
 __all__ = [
     "Cache",
     "DownloadRecorder",
     "Database",
+    "JobQueue",
+    "ResponseCache",
 ]
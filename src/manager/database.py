@@ -1,5 +1,6 @@
 from asyncio import CancelledError
 from contextlib import suppress
+from typing import AsyncIterator
 
 from aiosqlite import Row, connect
 
@@ -10,6 +11,8 @@ __all__ = ["Database"]
 
 class Database:
     __FILE = "DouK-Downloader.db"
+    __BATCH = 500  # 单条查询语句的参数数量上限
+    __FETCH = 10000  # 分批读取数据的数量
 
     def __init__(
         self,
@@ -22,11 +25,19 @@ class Database:
         self.database = await connect(self.file)
         self.database.row_factory = Row
         self.cursor = await self.database.cursor()
+        await self.__set_pragma()
         await self.__create_table()
         await self.__write_default_config()
         await self.__write_default_option()
         await self.database.commit()
 
+    async def __set_pragma(self):
+        # WAL 模式下读写互不阻塞，NORMAL 同步级别在 WAL 模式下不会损坏数据库
+        await self.database.execute("PRAGMA journal_mode=WAL;")
+        await self.database.execute("PRAGMA synchronous=NORMAL;")
+        await self.database.execute("PRAGMA temp_store=MEMORY;")
+        await self.database.execute("PRAGMA cache_size=-16000;")
+
     async def __create_table(self):
         await self.database.execute(
             """CREATE TABLE IF NOT EXISTS config_data (
@@ -46,6 +57,51 @@ class Database:
         NAME TEXT PRIMARY KEY,
         VALUE TEXT NOT NULL
         );""")
+        await self.database.execute("""CREATE TABLE IF NOT EXISTS sync_data (
+        SEC_UID TEXT NOT NULL,
+        TAB TEXT NOT NULL,
+        CREATE_TIME INTEGER NOT NULL,
+        PRIMARY KEY (SEC_UID, TAB)
+        );""")
+        await self.database.execute("""CREATE TABLE IF NOT EXISTS schedule_data (
+        ID TEXT PRIMARY KEY,
+        NAME TEXT NOT NULL,
+        LAST_RUN REAL NOT NULL,
+        DURATION REAL NOT NULL,
+        RUNS INTEGER NOT NULL,
+        FAILURES INTEGER NOT NULL,
+        STATUS TEXT NOT NULL
+        );""")
+        await self.database.execute("""CREATE TABLE IF NOT EXISTS job_data (
+        ID TEXT PRIMARY KEY,
+        TYPE TEXT NOT NULL,
+        PARAMS TEXT NOT NULL,
+        STATUS TEXT NOT NULL,
+        MESSAGE TEXT NOT NULL DEFAULT '',
+        TOTAL INTEGER NOT NULL DEFAULT 0,
+        PAGES INTEGER NOT NULL DEFAULT 0,
+        ITEMS INTEGER NOT NULL DEFAULT 0,
+        CREATED REAL NOT NULL,
+        STARTED REAL,
+        FINISHED REAL
+        );""")
+        await self.database.execute("""CREATE TABLE IF NOT EXISTS job_result (
+        JOB_ID TEXT NOT NULL,
+        IND INTEGER NOT NULL,
+        DATA TEXT NOT NULL,
+        PRIMARY KEY (JOB_ID, IND)
+        );""")
+        await self.database.execute("""CREATE TABLE IF NOT EXISTS link_data (
+        URL TEXT NOT NULL,
+        TYPE TEXT NOT NULL,
+        VALUE TEXT NOT NULL,
+        PRIMARY KEY (URL, TYPE)
+        );""")
+        await self.database.execute("""CREATE TABLE IF NOT EXISTS response_cache (
+        KEY TEXT PRIMARY KEY,
+        DATA TEXT NOT NULL,
+        EXPIRE REAL NOT NULL
+        );""")
 
     async def __write_default_config(self):
         await self.database.execute("""INSERT OR IGNORE INTO config_data (NAME, VALUE)
@@ -98,13 +154,20 @@ class Database:
         )
         return await self.cursor.fetchone()
 
-    async def has_download_data(self, id_: str) -> bool:
-        await self.cursor.execute("SELECT ID FROM download_data WHERE ID=?", (id_,))
-        return bool(await self.cursor.fetchone())
+    async def read_all_download_data(self) -> AsyncIterator[list[str]]:
+        """分批读取全部下载记录"""
+        async with self.database.execute("SELECT ID FROM download_data") as cursor:
+            while rows := await cursor.fetchmany(self.__FETCH):
+                yield [row["ID"] for row in rows]
 
-    async def write_download_data(self, id_: str):
-        await self.database.execute(
-            "INSERT OR IGNORE INTO download_data (ID) VALUES (?);", (id_,)
+    async def write_download_data(self, ids: list | tuple | set | str):
+        if not ids:
+            return
+        if isinstance(ids, str):
+            ids = [ids]
+        await self.database.executemany(
+            "INSERT OR IGNORE INTO download_data (ID) VALUES (?);",
+            ((i,) for i in ids),
         )
         await self.database.commit()
 
@@ -113,16 +176,181 @@ class Database:
             return
         if isinstance(ids, str):
             ids = [ids]
-        [await self.__delete_download_data(i) for i in ids]
+        await self.database.executemany(
+            "DELETE FROM download_data WHERE ID=?",
+            ((i,) for i in ids),
+        )
         await self.database.commit()
 
-    async def __delete_download_data(self, id_: str):
-        await self.database.execute("DELETE FROM download_data WHERE ID=?", (id_,))
-
     async def delete_all_download_data(self):
         await self.database.execute("DELETE FROM download_data")
         await self.database.commit()
 
+    async def read_sync_data(self, sec_uid: str, tab: str) -> int:
+        """读取账号已完整同步的最新作品发布时间，不存在记录时返回 0"""
+        async with self.database.execute(
+            "SELECT CREATE_TIME FROM sync_data WHERE SEC_UID=? AND TAB=?",
+            (sec_uid, tab),
+        ) as cursor:
+            return row["CREATE_TIME"] if (row := await cursor.fetchone()) else 0
+
+    async def update_sync_data(self, sec_uid: str, tab: str, create_time: int):
+        await self.database.execute(
+            "REPLACE INTO sync_data (SEC_UID, TAB, CREATE_TIME) VALUES (?,?,?)",
+            (sec_uid, tab, create_time),
+        )
+        await self.database.commit()
+
+    async def delete_all_sync_data(self):
+        await self.database.execute("DELETE FROM sync_data")
+        await self.database.commit()
+
+    async def read_schedule_data(self) -> list[Row]:
+        """读取定时任务的运行状态"""
+        async with self.database.execute("SELECT * FROM schedule_data") as cursor:
+            return await cursor.fetchall()
+
+    async def update_schedule_data(
+        self,
+        id_: str,
+        name: str,
+        last_run: float,
+        duration: float,
+        runs: int,
+        failures: int,
+        status: str,
+    ):
+        await self.database.execute(
+            "REPLACE INTO schedule_data (ID, NAME, LAST_RUN, DURATION, RUNS, FAILURES, STATUS) VALUES (?,?,?,?,?,?,?)",
+            (id_, name, last_run, duration, runs, failures, status),
+        )
+        await self.database.commit()
+
+    async def create_job_data(
+        self,
+        id_: str,
+        type_: str,
+        params: str,
+        created: float,
+    ):
+        await self.database.execute(
+            "INSERT INTO job_data (ID, TYPE, PARAMS, STATUS, CREATED) VALUES (?,?,?,?,?)",
+            (id_, type_, params, "queued", created),
+        )
+        await self.database.commit()
+
+    async def read_job_data(self, id_: str) -> Row | None:
+        async with self.database.execute(
+            "SELECT * FROM job_data WHERE ID=?",
+            (id_,),
+        ) as cursor:
+            return await cursor.fetchone()
+
+    async def start_job_data(self, id_: str, started: float):
+        await self.database.execute(
+            "UPDATE job_data SET STATUS='running', STARTED=? WHERE ID=?",
+            (started, id_),
+        )
+        await self.database.commit()
+
+    async def update_job_progress(self, id_: str, pages: int, items: int):
+        await self.database.execute(
+            "UPDATE job_data SET PAGES=?, ITEMS=? WHERE ID=?",
+            (pages, items, id_),
+        )
+        await self.database.commit()
+
+    async def finish_job_data(
+        self,
+        id_: str,
+        status: str,
+        message: str,
+        total: int,
+        finished: float,
+    ):
+        await self.database.execute(
+            "UPDATE job_data SET STATUS=?, MESSAGE=?, TOTAL=?, FINISHED=? WHERE ID=?",
+            (status, message, total, finished, id_),
+        )
+        await self.database.commit()
+
+    async def interrupt_job_data(self, message: str, finished: float):
+        """将未完成的任务标记为失败，用于程序意外退出后重新启动"""
+        await self.database.execute(
+            "UPDATE job_data SET STATUS='failed', MESSAGE=?, FINISHED=? WHERE STATUS IN ('queued', 'running')",
+            (message, finished),
+        )
+        await self.database.commit()
+
+    async def delete_job_data(self, id_: str):
+        await self.database.execute("DELETE FROM job_result WHERE JOB_ID=?", (id_,))
+        await self.database.execute("DELETE FROM job_data WHERE ID=?", (id_,))
+        await self.database.commit()
+
+    async def write_job_result(self, id_: str, data: list[str]):
+        await self.database.executemany(
+            "INSERT INTO job_result (JOB_ID, IND, DATA) VALUES (?,?,?)",
+            ((id_, index, item) for index, item in enumerate(data)),
+        )
+        await self.database.commit()
+
+    async def read_job_result(self, id_: str, offset: int, limit: int) -> list[str]:
+        async with self.database.execute(
+            "SELECT DATA FROM job_result WHERE JOB_ID=? AND IND>=? ORDER BY IND LIMIT ?",
+            (id_, offset, limit),
+        ) as cursor:
+            return [row["DATA"] for row in await cursor.fetchall()]
+
+    async def read_link_data(
+        self,
+        urls: list[str] | tuple[str, ...],
+        type_: str,
+    ) -> dict[str, str]:
+        """批量查询链接解析结果，返回链接与解析结果的映射"""
+        result = {}
+        for i in range(0, len(urls), self.__BATCH):
+            batch = urls[i : i + self.__BATCH]
+            async with self.database.execute(
+                f"SELECT URL, VALUE FROM link_data WHERE TYPE=? AND URL IN ({','.join('?' * len(batch))})",
+                (type_, *batch),
+            ) as cursor:
+                result |= {row["URL"]: row["VALUE"] for row in await cursor.fetchall()}
+        return result
+
+    async def write_link_data(self, data: dict[str, str], type_: str):
+        if not data:
+            return
+        await self.database.executemany(
+            "REPLACE INTO link_data (URL, TYPE, VALUE) VALUES (?,?,?)",
+            ((k, type_, v) for k, v in data.items()),
+        )
+        await self.database.commit()
+
+    async def read_response_cache(self, key: str, now: float) -> str | None:
+        async with self.database.execute(
+            "SELECT DATA FROM response_cache WHERE KEY=? AND EXPIRE>=?",
+            (key, now),
+        ) as cursor:
+            return row["DATA"] if (row := await cursor.fetchone()) else None
+
+    async def write_response_cache(self, key: str, data: str, expire: float):
+        await self.database.execute(
+            "REPLACE INTO response_cache (KEY, DATA, EXPIRE) VALUES (?,?,?)",
+            (key, data, expire),
+        )
+        await self.database.commit()
+
+    async def delete_response_cache(self, before: float = None):
+        """删除 before 之前过期的缓存，未传入 before 时删除全部缓存"""
+        if before is None:
+            await self.database.execute("DELETE FROM response_cache")
+        else:
+            await self.database.execute(
+                "DELETE FROM response_cache WHERE EXPIRE<?",
+                (before,),
+            )
+        await self.database.commit()
+
     async def __aenter__(self):
         await self.__connect_database()
         return self
@@ -0,0 +1,95 @@
+from array import array
+from bisect import bisect_left
+from itertools import chain
+
+__all__ = ["IDIndex"]
+
+INT64_MAX = (1 << 63) - 1
+
+
+class IDIndex:
+    """作品 ID 内存索引，纯数字 ID 以 int64 有序数组保存，新增与删除的 ID 暂存于集合并定期合并"""
+
+    MERGE = 1 << 16  # 暂存集合达到该数量时合并至有序数组
+
+    def __init__(self):
+        self.ids = array("q")
+        self.added: set[int] = set()
+        self.removed: set[int] = set()
+        self.others: set[str] = set()  # 无法转换为整数的 ID
+
+    def __len__(self) -> int:
+        return len(self.ids) + len(self.added) - len(self.removed) + len(self.others)
+
+    @staticmethod
+    def __convert(id_: str) -> int | None:
+        if id_.isascii() and id_.isdigit() and not id_.startswith("0"):
+            if (value := int(id_)) <= INT64_MAX:
+                return value
+        return None
+
+    def __search(self, value: int) -> bool:
+        index = bisect_left(self.ids, value)
+        return index < len(self.ids) and self.ids[index] == value
+
+    def __contains__(self, id_: str) -> bool:
+        # 查询频率最高，内联转换与二分查找以减少函数调用
+        if not (id_.isdigit() and id_.isascii()) or id_[0] == "0":
+            return id_ in self.others
+        if (value := int(id_)) > INT64_MAX:
+            return id_ in self.others
+        if value in self.added:
+            return True
+        ids = self.ids
+        index = bisect_left(ids, value)
+        return index < len(ids) and ids[index] == value and value not in self.removed
+
+    def load(self, ids: list[str]) -> None:
+        """追加数据库读取的 ID，全部追加完成后需要调用 build 方法"""
+        for id_ in ids:
+            if (value := self.__convert(id_)) is None:
+                self.others.add(id_)
+            else:
+                self.ids.append(value)
+
+    def build(self) -> None:
+        self.ids = array("q", sorted(self.ids))
+
+    def add(self, id_: str) -> None:
+        if (value := self.__convert(id_)) is None:
+            self.others.add(id_)
+            return
+        self.removed.discard(value)
+        if not self.__search(value):
+            self.added.add(value)
+            if len(self.added) >= self.MERGE:
+                self.__merge()
+
+    def discard(self, id_: str) -> None:
+        if (value := self.__convert(id_)) is None:
+            self.others.discard(id_)
+            return
+        self.added.discard(value)
+        if self.__search(value):
+            self.removed.add(value)
+            if len(self.removed) >= self.MERGE:
+                self.__merge()
+
+    def clear(self) -> None:
+        self.ids = array("q")
+        self.added.clear()
+        self.removed.clear()
+        self.others.clear()
+
+    def __merge(self) -> None:
+        self.ids = array(
+            "q",
+            sorted(
+                chain(
+                    (i for i in self.ids if i not in self.removed),
+                    self.added,
+                )
+            ),
+        )
+        self.added.clear()
+        self.removed.clear()
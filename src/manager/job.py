@@ -0,0 +1,186 @@
+from asyncio import CancelledError, Queue, Task, create_task, current_task, gather
+from contextlib import suppress
+from json import dumps
+from time import time
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Awaitable, Callable
+from uuid import uuid4
+
+from ..custom import API_JOB_WORKERS
+from ..translation import _
+
+if TYPE_CHECKING:
+    from ..record import BaseLogger, LoggerManager
+    from .database import Database
+
+__all__ = ["JobQueue"]
+
+
+class JobQueue:
+    """Web API 后台任务队列，任务状态与结果保存至数据库
+
+    任务状态：queued、running、completed、failed、cancelled
+    """
+
+    def __init__(
+        self,
+        database: "Database",
+        logger: "BaseLogger | LoggerManager",
+        workers: int = API_JOB_WORKERS,
+    ):
+        self.database = database
+        self.logger = logger
+        self.workers = workers
+        self.queue: Queue[tuple[str, Callable[[Callable], Awaitable]]] = Queue()
+        self.consumers: list[Task] = []
+        self.running: dict[str, Task] = {}
+        self.cancelled: set[str] = set()
+
+    async def start(self):
+        await self.database.interrupt_job_data(_("程序已重新启动，任务未完成"), time())
+        self.consumers = [create_task(self.__consume()) for i in range(self.workers)]
+
+    async def close(self):
+        for task in self.consumers:
+            task.cancel()
+        with suppress(CancelledError):
+            await gather(*self.consumers)
+        self.consumers.clear()
+
+    async def submit(
+        self,
+        type_: str,
+        params: dict,
+        function: Callable[
+            [Callable[[int], Awaitable]], Awaitable[dict | list[dict] | None]
+        ],
+    ) -> str:
+        """提交后台任务并立即返回任务 ID，function 返回值为需要保存的数据
+
+        function 接收进度回调，每获取一页数据时传入该页数据数量
+        """
+        id_ = uuid4().hex
+        await self.database.create_job_data(
+            id_,
+            type_,
+            dumps(params, ensure_ascii=False),
+            time(),
+        )
+        self.queue.put_nowait((id_, function))
+        return id_
+
+    async def cancel(self, id_: str) -> bool:
+        """取消等待中或运行中的任务，任务已结束时返回 False"""
+        if task := self.running.get(id_):
+            task.cancel()
+            return True
+        # 查询数据库期间任务可能被取出，提前标记以便跳过
+        self.cancelled.add(id_)
+        row = await self.database.read_job_data(id_)
+        if task := self.running.get(id_):
+            self.cancelled.discard(id_)
+            task.cancel()
+            return True
+        if row and row["STATUS"] == "queued":
+            await self.database.finish_job_data(
+                id_,
+                "cancelled",
+                _("任务已取消"),
+                0,
+                time(),
+            )
+            return True
+        self.cancelled.discard(id_)
+        return False
+
+    async def __consume(self):
+        while True:
+            id_, function = await self.queue.get()
+            try:
+                if id_ in self.cancelled:
+                    self.cancelled.discard(id_)
+                else:
+                    await self.__run(id_, function)
+            except Exception as e:
+                self.logger.error(
+                    _("后台任务 {id} 运行失败: {error}").format(id=id_, error=repr(e))
+                )
+                with suppress(Exception):
+                    await self.database.finish_job_data(
+                        id_,
+                        "failed",
+                        repr(e),
+                        0,
+                        time(),
+                    )
+            finally:
+                self.queue.task_done()
+
+    async def __run(self, id_: str, function: Callable[[Callable], Awaitable]):
+        # 先登记运行中的任务，更新数据库期间也能取消
+        task = create_task(function(self.__reporter(id_)))
+        self.running[id_] = task
+        try:
+            await self.database.start_job_data(id_, time())
+            data = await task
+        except CancelledError:
+            if current_task().cancelling():
+                task.cancel()
+                raise
+            await self.database.finish_job_data(
+                id_,
+                "cancelled",
+                _("任务已取消"),
+                0,
+                time(),
+            )
+            return
+        except Exception as e:
+            task.cancel()
+            await self.database.finish_job_data(
+                id_,
+                "failed",
+                repr(e),
+                0,
+                time(),
+            )
+            return
+        finally:
+            self.running.pop(id_, None)
+        if not data:
+            await self.database.finish_job_data(
+                id_,
+                "failed",
+                _("获取数据失败！"),
+                0,
+                time(),
+            )
+            return
+        if isinstance(data, dict):
+            data = [data]
+        await self.database.write_job_result(
+            id_,
+            [dumps(i, ensure_ascii=False) for i in data],
+        )
+        await self.database.finish_job_data(
+            id_,
+            "completed",
+            _("获取数据成功！"),
+            len(data),
+            time(),
+        )
+
+    def __reporter(self, id_: str) -> Callable[[int], Awaitable]:
+        """返回任务进度回调，记录已获取的页数与数据数量"""
+        progress = SimpleNamespace(pages=0, items=0)
+
+        async def report(items: int):
+            progress.pages += 1
+            progress.items += items
+            await self.database.update_job_progress(
+                id_,
+                progress.pages,
+                progress.items,
+            )
+
+        return report
@@ -1,3 +1,5 @@
+from asyncio import CancelledError, Lock, Task, create_task, sleep
+from contextlib import suppress
 from pathlib import Path
 from platform import system
 from re import compile
@@ -6,8 +8,13 @@ from typing import TYPE_CHECKING
 from ..custom import (
     ERROR,
     INFO,
+    RECORD_FLUSH_INTERVAL,
+    RECORD_FLUSH_SIZE,
     WARNING,
 )
+from ..translation import _
+
+from .index import IDIndex
 
 if TYPE_CHECKING:
     from ..tools import ColorfulConsole
@@ -116,32 +123,107 @@ class __DownloadRecorder:
 
 
 class DownloadRecorder:
+    """作品下载记录，新增记录先写入缓存，达到数量阈值或间隔时间后批量写入数据库
+
+    首次查询时读取全部下载记录至内存索引，后续查询无需访问数据库
+    """
+
     detail = compile(r"\d{19}")
 
     def __init__(self, database: "Database", switch: bool, console: "ColorfulConsole"):
         self.switch = switch
         self.console = console
         self.database = database
+        self.pending: set[str] = set()
+        self.lock = Lock()
+        self.timer: Task | None = None
+        self.index = IDIndex()
+        self.loaded = False
+
+    async def __load_index(self) -> None:
+        async with self.lock:
+            if self.loaded:
+                return
+            async for ids in self.database.read_all_download_data():
+                self.index.load(ids)
+            self.index.build()
+            self.loaded = True
 
     async def has_id(self, id_: str) -> bool:
-        return (
-            await self.database.has_download_data(id_) if self.switch and id_ else False
-        )
+        if not self.switch or not id_:
+            return False
+        if not self.loaded:
+            await self.__load_index()
+        return id_ in self.index
+
+    async def has_ids(self, ids: list[str]) -> set[str]:
+        """批量检查下载记录，返回存在下载记录的作品 ID"""
+        if not self.switch:
+            return set()
+        if not self.loaded:
+            await self.__load_index()
+        return {i for i in ids if i and i in self.index}
 
     async def update_id(self, id_: str):
         if self.switch and id_:
-            await self.database.write_download_data(id_)
+            self.index.add(id_)
+            self.pending.add(id_)
+            if len(self.pending) >= RECORD_FLUSH_SIZE:
+                await self.flush()
+            elif not self.timer:
+                self.timer = create_task(self.__flush_later())
+
+    async def __flush_later(self) -> None:
+        await sleep(RECORD_FLUSH_INTERVAL)
+        self.timer = None
+        try:
+            await self.flush()
+        except Exception as e:
+            # 写入失败的记录保留在缓存中，下次写入时重试
+            self.console.print(
+                _("作品下载记录写入数据库失败: {error}").format(error=repr(e)),
+                style=ERROR,
+            )
+
+    async def flush(self) -> None:
+        async with self.lock:
+            if not self.pending:
+                return
+            # 写入完成前保留缓存，避免查询时遗漏正在写入的记录
+            ids = self.pending.copy()
+            await self.database.write_download_data(ids)
+            self.pending.difference_update(ids)
 
     async def delete_id(self, id_: str) -> None:
         if self.switch and id_:
-            await self.database.delete_download_data(id_)
+            # 与批量写入共用锁，避免删除的记录被正在进行的写入重新添加
+            async with self.lock:
+                self.index.discard(id_)
+                self.pending.discard(id_)
+                await self.database.delete_download_data(id_)
 
     async def delete_ids(self, ids: str) -> None:
-        if ids.upper() == "ALL":
-            await self.database.delete_all_download_data()
-        else:
-            ids = self.__extract_ids(ids)
-            await self.database.delete_download_data(ids)
+        async with self.lock:
+            if ids.upper() == "ALL":
+                self.index.clear()
+                self.pending.clear()
+                await self.database.delete_all_download_data()
+                # 清空下载记录后需要重新获取账号全部作品
+                await self.database.delete_all_sync_data()
+            else:
+                ids = self.__extract_ids(ids)
+                for i in ids:
+                    self.index.discard(i)
+                self.pending.difference_update(ids)
+                await self.database.delete_download_data(ids)
+
+    async def close(self) -> None:
+        if self.timer:
+            self.timer.cancel()
+            with suppress(CancelledError):
+                await self.timer
+            self.timer = None
+        await self.flush()
 
     def __extract_ids(self, ids: str) -> list[str]:
         ids = ids.split()
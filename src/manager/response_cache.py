@@ -0,0 +1,138 @@
+from asyncio import Task, create_task, shield
+from collections import OrderedDict
+from hashlib import sha256
+from json import dumps, loads
+from time import time
+from typing import TYPE_CHECKING, Any, Awaitable, Callable
+
+from ..custom import API_CACHE_DATABASE, API_CACHE_SIZE, API_CACHE_TTL
+
+if TYPE_CHECKING:
+    from .database import Database
+
+__all__ = ["ResponseCache"]
+
+
+class ResponseCache:
+    """Web API 响应缓存，内存 LRU 缓存可选搭配数据库缓存
+
+    相同请求同时到达时共用同一次数据请求；仅缓存获取成功的数据
+
+    缓存状态：HIT 命中缓存、MISS 请求数据、SHARED 共用其他请求的数据、BYPASS 未启用缓存
+    """
+
+    def __init__(
+        self,
+        database: "Database" = None,
+        ttl: int = API_CACHE_TTL,
+        size: int = API_CACHE_SIZE,
+        persistent: bool = API_CACHE_DATABASE,
+    ):
+        self.database = database if persistent else None
+        self.ttl = ttl
+        self.size = size
+        self.memory: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self.pending: dict[str, Task] = {}
+        self.hits = 0
+        self.misses = 0
+        self.shared = 0
+        self.evictions = 0
+
+    @staticmethod
+    def generate_key(endpoint: str, params: dict) -> str:
+        """参数按名称排序后计算摘要，避免 Cookie 等参数明文保存"""
+        return sha256(
+            f"{endpoint}:{dumps(params, sort_keys=True, ensure_ascii=False)}".encode()
+        ).hexdigest()
+
+    async def get(
+        self,
+        endpoint: str,
+        params: dict,
+        function: Callable[[], Awaitable[Any]],
+    ) -> tuple[Any, str]:
+        """返回数据与缓存状态"""
+        if self.ttl <= 0:
+            return await function(), "BYPASS"
+        key = self.generate_key(endpoint, params)
+        if (data := self.__read_memory(key)) is not None:
+            self.hits += 1
+            return data, "HIT"
+        if task := self.pending.get(key):
+            self.shared += 1
+            data, _ = await shield(task)
+            return data, "SHARED"
+        task = create_task(self.__fetch(key, function))
+        self.pending[key] = task
+        # 当前请求中断时不影响共用数据的其他请求
+        return await shield(task)
+
+    async def __fetch(
+        self,
+        key: str,
+        function: Callable[[], Awaitable[Any]],
+    ) -> tuple[Any, str]:
+        try:
+            if self.database and (
+                data := await self.database.read_response_cache(key, time())
+            ):
+                self.hits += 1
+                data = loads(data)
+                self.__write_memory(key, data)
+                return data, "HIT"
+            self.misses += 1
+            if data := await function():
+                self.__write_memory(key, data)
+                if self.database:
+                    await self.database.write_response_cache(
+                        key,
+                        dumps(data, ensure_ascii=False),
+                        time() + self.ttl,
+                    )
+            return data, "MISS"
+        finally:
+            self.pending.pop(key, None)
+
+    def __read_memory(self, key: str) -> Any:
+        if not (item := self.memory.get(key)):
+            return None
+        expire, data = item
+        if expire < time():
+            del self.memory[key]
+            return None
+        self.memory.move_to_end(key)
+        return data
+
+    def __write_memory(self, key: str, data: Any) -> None:
+        self.memory[key] = (time() + self.ttl, data)
+        self.memory.move_to_end(key)
+        while len(self.memory) > self.size:
+            self.memory.popitem(last=False)
+            self.evictions += 1
+
+    async def clear_expired(self) -> None:
+        now = time()
+        for key in [k for k, (expire, _) in self.memory.items() if expire < now]:
+            del self.memory[key]
+        if self.database:
+            await self.database.delete_response_cache(now)
+
+    async def clear(self) -> None:
+        self.memory.clear()
+        if self.database:
+            await self.database.delete_response_cache()
+
+    def metrics(self) -> dict:
+        total = self.hits + self.misses + self.shared
+        return {
+            "ttl": self.ttl,
+            "size": len(self.memory),
+            "max_size": self.size,
+            "database": bool(self.database),
+            "hits": self.hits,
+            "misses": self.misses,
+            "shared": self.shared,
+            "evictions": self.evictions,
+            "pending": len(self.pending),
+            "hit_rate": round((self.hits + self.shared) / total, 4) if total else 0,
+        }
@@ -1,4 +1,4 @@
-from .response import DataResponse, UrlResponse
+from .response import DataResponse, JobResponse, UrlResponse
 from .search import (
     GeneralSearch,
     VideoSearch,
@@ -7,7 +7,7 @@ from .search import (
 )
 from .settings import Settings
 from .share import ShortUrl
-from .detail import Detail, DetailTikTok
+from .detail import Detail, DetailBatch, DetailBatchTikTok, DetailTikTok
 from .account import Account, AccountTiktok
 from .comment import Comment
 from .reply import Reply
@@ -20,11 +20,14 @@ __all__ = (
     "UserSearch",
     "LiveSearch",
     "DataResponse",
+    "JobResponse",
     "Settings",
     "UrlResponse",
     "ShortUrl",
     "Detail",
     "DetailTikTok",
+    "DetailBatch",
+    "DetailBatchTikTok",
     "Account",
     "AccountTiktok",
     "Comment",
@@ -1,3 +1,5 @@
+from pydantic import Field
+
 from .base import APIModel
 
 
@@ -7,3 +9,14 @@ class Detail(APIModel):
 
 class DetailTikTok(Detail):
     pass
+
+
+class DetailBatch(APIModel):
+    detail_ids: list[str] = Field(
+        ...,
+        min_length=1,
+    )
+
+
+class DetailBatchTikTok(DetailBatch):
+    pass
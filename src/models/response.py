@@ -25,3 +25,22 @@ class UrlResponse(BaseModel):
     def time(self) -> str:
         """格式化后的时间字符串"""
         return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+
+class JobResponse(BaseModel):
+    message: str
+    job_id: str | None = None
+    status: str | None = None
+    total: int = 0
+    pages: int = 0
+    items: int = 0
+    created: str | None = None
+    started: str | None = None
+    finished: str | None = None
+    params: dict | None
+
+    @computed_field
+    @property
+    def time(self) -> str:
+        """格式化后的时间字符串"""
+        return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
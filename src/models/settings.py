@@ -65,6 +65,7 @@ class Settings(BaseModel):
     accounts_urls_tiktok: List[AccountUrl] = []
     mix_urls: List[MixUrl] = []
     mix_urls_tiktok: List[MixUrl] = []
+    live_urls: List[MixUrl] = []
     owner_url: OwnerUrl | dict[str, str] = {}
     owner_url_tiktok: None = None
     root: str | None = None
@@ -94,6 +95,11 @@ class Settings(BaseModel):
     live_qualities: str | None = None
     douyin_platform: bool | None = None
     tiktok_platform: bool | None = None
+    account_concurrency: int | None = None
+    incremental_sync: bool | None = None
+    rate_limit: dict[str, int | float] | None = None
+    download_workers: dict[str, int] | None = None
+    download_workers_tiktok: dict[str, int] | None = None
     browser_info: BrowserInfo | None = None
     browser_info_tiktok: TikTokBrowserInfo | None = None
 
@@ -1,11 +1,13 @@
 from .cookie import Cookie
 from .ffmpeg import FFMPEG
+from .live_recorder import LiveRecorder
 from .register import Register
 from .tiktok_unofficial import DetailTikTokExtractor, DetailTikTokUnofficial
 
 __all__ = [
     "Cookie",
     "FFMPEG",
+    "LiveRecorder",
     "Register",
     "DetailTikTokExtractor",
     "DetailTikTokUnofficial",
@@ -0,0 +1,359 @@
+from asyncio import (
+    AbstractEventLoop,
+    CancelledError,
+    Event,
+    Semaphore,
+    TimeoutError,
+    create_subprocess_exec,
+    create_task,
+    gather,
+    new_event_loop,
+    run_coroutine_threadsafe,
+    sleep,
+    to_thread,
+    wait_for,
+    wrap_future,
+)
+from asyncio.subprocess import DEVNULL, PIPE, Process
+from concurrent.futures import Future
+from contextlib import suppress
+from datetime import datetime
+from pathlib import Path
+from threading import Thread
+from typing import TYPE_CHECKING, Coroutine
+from uuid import uuid4
+
+from ..custom import (
+    LIVE_RECONNECT,
+    LIVE_RECONNECT_DELAY,
+    LIVE_SEGMENT_TIME,
+    LIVE_WORKERS,
+)
+from ..translation import _
+
+if TYPE_CHECKING:
+    from ..record import BaseLogger, LoggerManager
+
+__all__ = ["LiveRecorder", "LiveRecording"]
+
+
+class LiveRecording:
+    """单个直播录制任务的状态
+
+    状态：waiting、recording、reconnecting、finished、failed、stopped
+    """
+
+    def __init__(
+        self,
+        url: str,
+        file: Path,
+        title: str,
+        proxy: str | None,
+        user_agent: str,
+    ):
+        self.id = uuid4().hex[:8]
+        self.url = url
+        self.file = file
+        self.title = title
+        self.proxy = proxy
+        self.user_agent = user_agent
+        self.status = "waiting"
+        self.started = datetime.now()
+        self.size = 0  # 已结束的 ffmpeg 进程写入的文件大小
+        self.current_size = 0  # 当前 ffmpeg 进程写入的文件大小
+        self.bitrate = ""
+        self.out_time = ""
+        self.segments: list[Path] = []
+        self.reconnects = 0
+        self.error = ""
+        self.process: Process | None = None
+        self.task: Future | None = None
+        self.stopped = Event()
+
+    @property
+    def total_size(self) -> int:
+        return self.size + self.current_size
+
+    def segment_file(self, index: int) -> Path:
+        return self.file.with_name(f"{self.file.stem}_{index:03d}{self.file.suffix}")
+
+    def to_dict(self) -> dict:
+        return {
+            "id": self.id,
+            "title": self.title,
+            "status": self.status,
+            "started": self.started.strftime("%Y-%m-%d %H:%M:%S"),
+            "size": self.total_size,
+            "bitrate": self.bitrate,
+            "out_time": self.out_time,
+            "segments": [str(i) for i in self.segments],
+            "reconnects": self.reconnects,
+            "error": self.error,
+        }
+
+
+class LiveRecorder:
+    """在独立线程的事件循环中运行 ffmpeg 录制直播，不依赖图形终端
+
+    终端等待用户输入时主线程事件循环暂停运行，录制、分段与重连不受影响；
+    单个 ffmpeg 进程按时长输出分段文件，进程仅在连接中断时重新启动，
+    未写入任何数据时视为连接失败，连续失败超过上限时结束录制
+    """
+
+    def __init__(self, workers: int = LIVE_WORKERS):
+        self.semaphore = Semaphore(workers)
+        self.recordings: dict[str, LiveRecording] = {}
+        self.loop: AbstractEventLoop | None = None
+        self.thread: Thread | None = None
+
+    def __submit(self, coroutine: Coroutine) -> Future:
+        if not self.loop:
+            self.loop = new_event_loop()
+            self.thread = Thread(
+                target=self.loop.run_forever,
+                name="live-recorder",
+                daemon=True,
+            )
+            self.thread.start()
+        return run_coroutine_threadsafe(coroutine, self.loop)
+
+    def record(
+        self,
+        ffmpeg: str,
+        url: str,
+        file: Path,
+        title: str,
+        proxy: str | None,
+        user_agent: str,
+        cache: Path,
+        logger: "BaseLogger | LoggerManager",
+    ) -> LiveRecording:
+        """添加录制任务并立即返回，录制在后台线程进行"""
+        recording = LiveRecording(url, file, title, proxy, user_agent)
+        self.recordings[recording.id] = recording
+        recording.task = self.__submit(self.__record(ffmpeg, recording, cache, logger))
+        return recording
+
+    async def __record(
+        self,
+        ffmpeg: str,
+        recording: LiveRecording,
+        cache: Path,
+        logger: "BaseLogger | LoggerManager",
+    ) -> None:
+        async with self.semaphore:
+            index = 0
+            failures = 0
+            while not recording.stopped.is_set():
+                recording.status = "recording" if not failures else "reconnecting"
+                await self.__run_ffmpeg(ffmpeg, recording, index, cache)
+                if (next_index := self.__collect_segments(recording, index)) > index:
+                    index = next_index
+                    failures = 0
+                else:
+                    failures += 1
+                recording.current_size = 0
+                if recording.stopped.is_set():
+                    break
+                if failures > LIVE_RECONNECT:
+                    recording.status = "finished" if recording.segments else "failed"
+                    logger.info(
+                        _("直播 {title} 录制结束").format(title=recording.title)
+                    )
+                    return
+                if failures:
+                    recording.status = "reconnecting"
+                    recording.reconnects += 1
+                    with suppress(TimeoutError):
+                        await wait_for(recording.stopped.wait(), LIVE_RECONNECT_DELAY)
+            recording.status = "stopped"
+
+    @staticmethod
+    def __collect_segments(recording: LiveRecording, index: int) -> int:
+        """记录 ffmpeg 进程输出的分段文件，删除空文件，返回下一分段序号"""
+        start, written = index, False
+        while (file := recording.segment_file(index)).is_file():
+            if size := file.stat().st_size:
+                recording.segments.append(file)
+                recording.size += size
+                written = True
+            else:
+                file.unlink(missing_ok=True)
+            index += 1
+        return index if written else start
+
+    async def __run_ffmpeg(
+        self,
+        ffmpeg: str,
+        recording: LiveRecording,
+        index: int,
+        cache: Path,
+    ) -> None:
+        # 进度与错误信息写入文件，无需读取管道
+        progress = cache.joinpath(f"live_{recording.id}.progress")
+        log = cache.joinpath(f"live_{recording.id}.log")
+        with log.open("wb") as stderr:
+            recording.process = await create_subprocess_exec(
+                *self.generate_command(ffmpeg, recording, index, progress),
+                stdin=PIPE,
+                stdout=DEVNULL,
+                stderr=stderr,
+            )
+            watcher = create_task(self.__watch_progress(recording, progress))
+            try:
+                if not recording.stopped.is_set():
+                    await recording.process.wait()
+            finally:
+                watcher.cancel()
+                with suppress(CancelledError):
+                    await watcher
+                if recording.process.returncode is None:
+                    await self.__terminate(recording.process)
+                recording.process = None
+        if error := log.read_text(encoding="utf-8", errors="ignore").strip():
+            recording.error = error.splitlines()[-1]
+        progress.unlink(missing_ok=True)
+        log.unlink(missing_ok=True)
+
+    @staticmethod
+    async def __watch_progress(recording: LiveRecording, progress: Path) -> None:
+        """读取 ffmpeg -progress 输出的码率与文件大小"""
+        while True:
+            await sleep(1)
+            with suppress(OSError):
+                values = dict(
+                    i.split("=", 1)
+                    for i in progress.read_text(encoding="utf-8").splitlines()[-12:]
+                    if "=" in i
+                )
+                if (size := values.get("total_size", "")).isdigit():
+                    recording.current_size = int(size)
+                recording.bitrate = values.get("bitrate", recording.bitrate)
+                recording.out_time = values.get("out_time", recording.out_time)[:8]
+
+    @staticmethod
+    def generate_command(
+        ffmpeg: str,
+        recording: LiveRecording,
+        index: int,
+        progress: Path,
+    ) -> list[str]:
+        command = [
+            ffmpeg,
+            "-hide_banner",
+            "-nostats",
+            "-loglevel",
+            "error",
+            "-progress",
+            str(progress),
+            "-rw_timeout",
+            f"{30 * 1000 * 1000}",
+            "-protocol_whitelist",
+            "rtmp,crypto,file,http,https,tcp,tls,udp,rtp,httpproxy",
+            "-analyzeduration",
+            f"{10 * 1000 * 1000}",
+            "-probesize",
+            f"{10 * 1000 * 1000}",
+            "-fflags",
+            "+discardcorrupt",
+            "-user_agent",
+            recording.user_agent,
+        ]
+        if recording.proxy:
+            command.extend(("-http_proxy", recording.proxy))
+        command.extend(
+            (
+                "-i",
+                recording.url,
+                "-map",
+                "0",
+                "-c:v",
+                "copy",
+                "-c:a",
+                "copy",
+                "-sn",
+                "-dn",
+                "-max_muxing_queue_size",
+                "128",
+                "-correct_ts_overflow",
+                "1",
+            )
+        )
+        # 分片 MP4 在进程异常退出时仍可正常播放
+        if not LIVE_SEGMENT_TIME:
+            command.extend(
+                (
+                    "-movflags",
+                    "+frag_keyframe+empty_moov",
+                    "-f",
+                    "mp4",
+                    "-y",
+                    str(recording.segment_file(index)),
+                )
+            )
+            return command
+        command.extend(
+            (
+                "-f",
+                "segment",
+                "-segment_time",
+                str(LIVE_SEGMENT_TIME),
+                "-segment_start_number",
+                str(index),
+                "-reset_timestamps",
+                "1",
+                "-segment_format",
+                "mp4",
+                "-segment_format_options",
+                "movflags=+frag_keyframe+empty_moov",
+                "-y",
+                str(
+                    recording.file.with_name(
+                        f"{recording.file.stem}_%03d{recording.file.suffix}"
+                    )
+                ),
+            )
+        )
+        return command
+
+    @staticmethod
+    async def __terminate(process: Process) -> None:
+        """发送 q 让 ffmpeg 正常结束写入，超时后强制结束进程"""
+        with suppress(OSError, ValueError):
+            process.stdin.write(b"q")
+            await process.stdin.drain()
+        try:
+            await wait_for(process.wait(), 10)
+        except TimeoutError:
+            with suppress(ProcessLookupError):
+                process.kill()
+            await process.wait()
+
+    async def stop(self, id_: str) -> bool:
+        """停止录制任务，已录制的分段文件会被保留"""
+        if not (recording := self.recordings.get(id_)) or recording.task.done():
+            return False
+        await wrap_future(self.__submit(self.__stop(recording)))
+        return True
+
+    async def __stop(self, recording: LiveRecording) -> None:
+        recording.stopped.set()
+        if recording.status == "waiting":
+            recording.task.cancel()
+        elif recording.process and recording.process.returncode is None:
+            await self.__terminate(recording.process)
+        with suppress(CancelledError):
+            await wrap_future(recording.task)
+        recording.status = "stopped"
+
+    async def close(self) -> None:
+        if not self.loop:
+            return
+        await gather(*(self.stop(i) for i in list(self.recordings)))
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        await to_thread(self.thread.join)
+        self.loop.close()
+        self.loop = self.thread = None
+
+    def status(self) -> list[dict]:
+        return [i.to_dict() for i in self.recordings.values()]
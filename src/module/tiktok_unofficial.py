@@ -3,12 +3,10 @@ from types import SimpleNamespace
 from typing import TYPE_CHECKING
 from typing import Union
 
-from httpx import get
-
 from src.custom import BLANK_HEADERS
-from src.custom import wait
 from src.extract import Extractor
 from src.testers import Params
+from src.tools import RISK_CODES
 from src.tools import Retry
 from src.tools import capture_error_request
 from src.translation import _
@@ -32,8 +30,10 @@ class DetailTikTokUnofficial:
         self.console = params.console
         self.api = "https://www.tikwm.com/api/"
         self.proxy = proxy or params.proxy_tiktok
+        self.proxy_clients = params.proxy_clients
         self.max_retry = params.max_retry
         self.timeout = params.timeout
+        self.limiter = params.limiters["tiktok"]
         self.detail_id = detail_id
         self.text = _("作品")
 
@@ -49,17 +49,16 @@ class DetailTikTokUnofficial:
     async def request_data_get(
         self,
     ):
-        response = get(
+        await self.limiter.acquire()
+        response = await self.proxy_clients.get(self.proxy).get(
             self.api,
             params={"url": self.detail_id, "hd": "1"},
             headers=self.headers,
-            timeout=self.timeout,
-            follow_redirects=True,
-            verify=False,
-            proxy=self.proxy,
         )
+        if response.status_code in RISK_CODES:
+            self.limiter.penalize()
         response.raise_for_status()
-        await wait()
+        self.limiter.recover()
         return response.json()
 
     def check_response(
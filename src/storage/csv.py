@@ -54,3 +54,6 @@ class CSVLogger(BaseTextLogger):
 
     async def _save(self, data, *args, **kwargs):
         self.writer.writerow(data)
+
+    async def _save_many(self, data, *args, **kwargs):
+        self.writer.writerows(data)
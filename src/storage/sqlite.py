@@ -56,11 +56,19 @@ class SQLLogger(BaseSQLLogger):
         await self.cursor.execute(create_sql)
         await self.db.commit()
 
+    @property
+    def insert_sql(self) -> str:
+        return f"""REPLACE INTO {self.name} ({", ".join(self.title_line)}) VALUES ({
+            ", ".join(["?" for _ in self.title_line])
+        });"""
+
     async def _save(self, data, *args, **kwargs):
-        insert_sql = f"""REPLACE INTO {self.name} ({
-            ", ".join(self.title_line)
-        }) VALUES ({", ".join(["?" for _ in self.title_line])});"""
-        await self.cursor.execute(insert_sql, data)
+        await self.cursor.execute(self.insert_sql, data)
+        await self.db.commit()
+
+    async def _save_many(self, data, *args, **kwargs):
+        # 同一事务写入全部数据，仅提交一次
+        await self.cursor.executemany(self.insert_sql, data)
         await self.db.commit()
 
     async def update_sheet(self):
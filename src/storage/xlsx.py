@@ -39,9 +39,16 @@ class XLSXLogger(BaseTextLogger):
         self.field_keys = field_keys
 
     async def __aenter__(self):
-        self.book = load_workbook(self.path) if self.path.exists() else Workbook()
-        self.sheet = self.book.active
-        self.title()
+        if self.path.exists():
+            # 只写模式无法读取已有数据，追加数据时使用普通模式
+            self.book = load_workbook(self.path)
+            self.sheet = self.book.active
+            self.title()
+        else:
+            # 新建文件使用只写模式，数据逐行写入临时文件，不在内存中保留整个数据簿
+            self.book = Workbook(write_only=True)
+            self.sheet = self.book.create_sheet()
+            self.sheet.append(self.title_line)
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
@@ -0,0 +1,121 @@
+from random import randint, random
+from time import perf_counter
+from urllib.parse import quote, urlencode
+
+from gmssl import func, sm3
+
+from src.encrypt import ABogus
+from src.encrypt.aBogus import HASHLIB_SM3
+
+ITEMS = 2000
+ROUNDS = 3
+
+
+class LegacyABogus(ABogus):
+    """旧版签名流程：gmssl 计算 SM3，逐字符处理 RC4 与编码"""
+
+    @staticmethod
+    def gmssl_to_array(data: str | list) -> list[int]:
+        b = data.encode("utf-8") if isinstance(data, str) else bytes(data)
+        h = sm3.sm3_hash(func.bytes_to_list(b))
+        return [int(h[i : i + 2], 16) for i in range(0, len(h), 2)]
+
+    def generate_method_code(self, method: str = "GET") -> list[int]:
+        return self.gmssl_to_array(self.gmssl_to_array(method + "cus"))
+
+    def generate_params_code(self, params: str) -> list[int]:
+        return self.gmssl_to_array(self.gmssl_to_array(params + "cus"))
+
+    def get_value(
+        self,
+        url_params: dict | str,
+        method="GET",
+        start_time=0,
+        end_time=0,
+        random_num_1=None,
+        random_num_2=None,
+        random_num_3=None,
+    ) -> str:
+        string_1 = self.generate_string_1(
+            random_num_1,
+            random_num_2,
+            random_num_3,
+        )
+        string_2 = self.generate_string_2(
+            urlencode(
+                url_params,
+                quote_via=quote,
+            )
+            if isinstance(url_params, dict)
+            else url_params,
+            method,
+            start_time,
+            end_time,
+        )
+        return self.generate_result(string_1 + string_2, "s4")
+
+
+def generate_params(index: int) -> dict:
+    """生成结构与账号作品接口相近的请求参数"""
+    return {
+        "device_platform": "webapp",
+        "aid": "6383",
+        "channel": "channel_pc_web",
+        "sec_user_id": f"MS4wLjABAAAA{index:032d}",
+        "max_cursor": str(1700000000000 + index),
+        "count": "18",
+        "keyword": f"关键词 {index}",
+        "msToken": "".join(chr(randint(97, 122)) for _ in range(107)),
+    }
+
+
+def generate_arguments(index: int) -> tuple:
+    start_time = 1700000000000 + index * 997
+    return (
+        generate_params(index),
+        "GET" if index % 4 else "POST",
+        start_time,
+        start_time + randint(4, 8),
+        random() * 10000,
+        random() * 10000,
+        random() * 10000,
+    )
+
+
+def check(fast: ABogus, arguments: list[tuple]) -> None:
+    """确认新版签名结果与旧版完全一致"""
+    legacy = LegacyABogus()
+    legacy.browser = fast.browser
+    legacy.browser_len = fast.browser_len
+    legacy.browser_code = fast.browser_code
+    for args in arguments:
+        assert legacy.get_value(*args) == fast.get_value(*args), args
+
+
+def run(instance: ABogus, arguments: list[tuple]) -> None:
+    for args in arguments:
+        instance.get_value(*args)
+
+
+def measure(name: str, instance: ABogus, arguments: list[tuple]) -> None:
+    best = min(timer(instance, arguments) for _ in range(ROUNDS))
+    print(f"{name}: {ITEMS / best:,.0f} signatures/sec")
+
+
+def timer(instance: ABogus, arguments: list[tuple]) -> float:
+    start = perf_counter()
+    run(instance, arguments)
+    return perf_counter() - start
+
+
+def main():
+    arguments = [generate_arguments(i) for i in range(ITEMS)]
+    for platform in (None, "Win32", "MacIntel"):
+        check(ABogus(platform=platform), arguments)
+    print(f"hashlib SM3: {HASHLIB_SM3}")
+    measure("legacy", LegacyABogus(), arguments)
+    measure("current", ABogus(), arguments)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,192 @@
+from datetime import datetime
+from time import perf_counter
+from types import SimpleNamespace
+
+from src.extract import Extractor
+from src.testers.logger import Logger
+from src.tools import Cleaner
+
+# 批量提取作品时使用的主要属性链
+CHAINS = (
+    "aweme_id",
+    "desc",
+    "create_time",
+    "images",
+    "video.duration",
+    "video.play_addr.uri",
+    "video.bit_rate",
+    "video.dynamic_cover.url_list[0]",
+    "video.cover.url_list[0]",
+    "music",
+    "music.play_url.url_list[0]",
+    "statistics",
+    "video_tag",
+    "text_extra",
+    "author",
+    "author.uid",
+    "author.sec_uid",
+    "author.nickname",
+    "anchor_info",
+)
+ITEMS = 5000
+ROUNDS = 3
+
+
+def generate_item(index: int) -> dict:
+    """生成结构与抖音作品数据相近的模拟数据"""
+    urls = [f"https://v{i}.example.com/{index}.mp4" for i in range(3)]
+    return {
+        "aweme_id": str(7000000000000000000 + index),
+        "desc": f"作品描述 {index} #标签",
+        "create_time": 1700000000 + index,
+        "images": None,
+        "video": {
+            "duration": 15000,
+            "play_addr": {"uri": f"v0200f{index}", "url_list": urls},
+            "bit_rate": [
+                {
+                    "FPS": 30,
+                    "bit_rate": 1000000 * j,
+                    "gear_name": f"gear_{j}",
+                    "play_addr": {
+                        "data_size": 1024 * j,
+                        "height": 720 * j,
+                        "width": 1280 * j,
+                        "url_list": urls,
+                        "url_key": f"key_{j}",
+                    },
+                }
+                for j in range(1, 6)
+            ],
+            "dynamic_cover": {"url_list": urls},
+            "cover": {"url_list": urls},
+            "origin_cover": {"url_list": urls, "width": 720, "height": 1280},
+        },
+        "music": {
+            "author": "音乐作者",
+            "title": "音乐标题",
+            "play_url": {"url_list": urls},
+            "cover_hd": {"url_list": urls},
+            "avatar_large": {"url_list": urls},
+        },
+        "statistics": {
+            "digg_count": 1,
+            "comment_count": 2,
+            "collect_count": 3,
+            "share_count": 4,
+            "play_count": 5,
+        },
+        "video_tag": [{"tag_name": f"tag_{j}", "level": j} for j in range(3)],
+        "text_extra": [{"hashtag_name": f"hashtag_{j}"} for j in range(3)],
+        "author": {
+            "uid": "123456",
+            "sec_uid": "MS4wLjABAAAA",
+            "unique_id": "example",
+            "nickname": "账号昵称",
+            "signature": "账号简介",
+            "user_age": 18,
+            "avatar_thumb": {"url_list": urls},
+            "cover_url": [{"url_list": urls}],
+        },
+        "anchor_info": None,
+    }
+
+
+def legacy_data_object(data):
+    """旧版提取流程：深度转换为 SimpleNamespace"""
+    if isinstance(data, dict):
+        return SimpleNamespace(**{k: legacy_data_object(v) for k, v in data.items()})
+    elif isinstance(data, list):
+        return [legacy_data_object(i) for i in data]
+    return data
+
+
+def legacy_safe_extract(data, attribute_chain: str, default=""):
+    """旧版提取流程：每次调用重新解析属性链"""
+    for attribute in attribute_chain.split("."):
+        if "[" in attribute:
+            parts = attribute.split("[", 1)
+            attribute = parts[0]
+            index = parts[1].split("]", 1)[0]
+            try:
+                index = int(index)
+                data = getattr(data, attribute, None)[index]
+            except (IndexError, TypeError, ValueError):
+                return default
+        else:
+            data = getattr(data, attribute, None)
+            if not data:
+                return default
+    return data or default
+
+
+def legacy(data: list[dict]) -> None:
+    for item in data:
+        item = legacy_data_object(item)
+        for chain in CHAINS:
+            legacy_safe_extract(item, chain)
+
+
+def compiled(data: list[dict]) -> None:
+    for item in data:
+        for chain in CHAINS:
+            Extractor.safe_extract(item, chain)
+
+
+def extract(extractor: Extractor, data: list[dict]) -> list[dict]:
+    container = SimpleNamespace(
+        all_data=[],
+        template={
+            "collection_time": datetime.now().strftime(extractor.date_format),
+        },
+        cache=None,
+        name="name",
+        mark="mark",
+        same=True,
+    )
+    extractor._Extractor__platform_classify_detail(data, container, False)
+    return container.all_data
+
+
+def check(data: list[dict]) -> None:
+    """确认编译后的属性链与旧版提取结果一致"""
+    for item in data[:100]:
+        namespace = legacy_data_object(item)
+        for chain in CHAINS:
+            old = legacy_safe_extract(namespace, chain)
+            new = Extractor.safe_extract(item, chain)
+            if isinstance(old, (SimpleNamespace, list)):
+                assert legacy_data_object(new) == old, chain
+            else:
+                assert new == old, chain
+
+
+def measure(name: str, function, *args) -> None:
+    best = min(timer(function, *args) for _ in range(ROUNDS))
+    print(f"{name}: {ITEMS / best:,.0f} items/sec")
+
+
+def timer(function, *args) -> float:
+    start = perf_counter()
+    function(*args)
+    return perf_counter() - start
+
+
+def main():
+    data = [generate_item(i) for i in range(ITEMS)]
+    check(data)
+    extractor = Extractor(
+        SimpleNamespace(
+            logger=Logger(),
+            date_format="%Y-%m-%d %H:%M:%S",
+            CLEANER=Cleaner(),
+        )
+    )
+    assert len(extract(extractor, data)) == ITEMS
+    measure("SimpleNamespace + safe_extract", legacy, data)
+    measure("compiled accessor", compiled, data)
+    measure("Extractor batch extraction", extract, extractor, data)
+
+
+if __name__ == "__main__":
+    main()
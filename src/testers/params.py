@@ -9,9 +9,12 @@ from src.custom import (
 )
 from src.custom import PROJECT_ROOT
 from src.encrypt import ABogus
+from src.encrypt import Signer
 from src.encrypt import XBogus
 from src.testers.logger import Logger
 from src.tools import Cleaner
+from src.tools import ClientPool
+from src.tools import RateLimiter
 from src.tools import create_client
 
 
@@ -34,6 +37,7 @@ class Params:
         self.logger = Logger()
         self.ab = ABogus()
         self.xb = XBogus()
+        self.signer = Signer(self.ab, self.xb)
         self.console = Console()
         self.max_retry = 0
         self.timeout = 5
@@ -46,6 +50,10 @@ class Params:
             timeout=self.timeout,
             proxy="http://127.0.0.1:10809",
         )
+        self.proxy_clients = ClientPool(
+            timeout=self.timeout,
+        )
+        self.limiters = RateLimiter({})
 
     def create_ini(self):
         self.config["dy"] = {
@@ -79,6 +87,7 @@ class Params:
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         await self.client.aclose()
         await self.client_tiktok.aclose()
+        await self.proxy_clients.close()
 
 
 async def test():
@@ -0,0 +1,85 @@
+from json import dumps, loads
+
+from pytest import importorskip, mark
+
+from src.extract import ACCOUNT_SCHEMA, COMMENT_SCHEMA
+from src.tools import decode_json
+
+importorskip("msgspec")
+
+ACCOUNT = {
+    "status_code": 0,
+    "max_cursor": 1700000000000,
+    "has_more": 1,
+    "aweme_list": [
+        {
+            "aweme_id": "7300000000000000000",
+            "desc": None,
+            "create_time": 1700000000,
+            "text_extra": [],
+            "images": None,
+            "video": {
+                "duration": 15000,
+                "play_addr": {
+                    "uri": "v0200",
+                    "url_list": ["https://example.com/1.mp4"],
+                    "data_size": None,
+                    "height": None,
+                },
+                "bit_rate": [
+                    {
+                        "FPS": 30,
+                        "bit_rate": 1000,
+                        "play_addr": {"url_list": [], "data_size": 1024},
+                    },
+                ],
+                "cover": {"url_list": None},
+            },
+            "music": None,
+            "author": {"uid": "1", "nickname": "nickname", "signature": None},
+            "mix_info": None,
+        },
+    ],
+}
+
+COMMENT = {
+    "status_code": 0,
+    "cursor": 20,
+    "has_more": 0,
+    "comments": [
+        {
+            "cid": "7300000000000000001",
+            "text": "text",
+            "image_list": None,
+            "sticker": {"static_url": None},
+            "reply_to_reply_id": "0",
+            "user": {"uid": "2", "nickname": None},
+        },
+    ],
+}
+
+
+@mark.parametrize(
+    "x, schema",
+    [
+        (ACCOUNT, ACCOUNT_SCHEMA),
+        ({"status_code": 0, "aweme_list": None, "has_more": 0}, ACCOUNT_SCHEMA),
+        ({"status_code": 0, "has_more": 0}, ACCOUNT_SCHEMA),
+        (
+            {"status_code": 0, "aweme_list": [], "filter_list": [{"reason": 1}]},
+            ACCOUNT_SCHEMA,
+        ),
+        (
+            {"status_code": 2154, "aweme_list": [], "verify_ticket": "ticket"},
+            ACCOUNT_SCHEMA,
+        ),
+        (COMMENT, COMMENT_SCHEMA),
+        (
+            {"status_code": 0, "comments": None, "filter_list": []},
+            COMMENT_SCHEMA,
+        ),
+    ],
+)
+def test_decode_json_schema(x, schema):
+    raw = dumps(x).encode()
+    assert decode_json(raw, schema) == loads(raw)
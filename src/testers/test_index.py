@@ -0,0 +1,72 @@
+from asyncio import run
+from random import Random
+
+from src.manager import DownloadRecorder
+from src.manager.index import IDIndex
+
+
+class Database:
+    def __init__(self):
+        self.ids: set[str] = set()
+
+    async def read_all_download_data(self):
+        yield list(self.ids)
+
+    async def write_download_data(self, ids):
+        self.ids.update(ids)
+
+    async def delete_download_data(self, ids):
+        self.ids.difference_update([ids] if isinstance(ids, str) else ids)
+
+    async def delete_all_download_data(self):
+        self.ids.clear()
+
+    async def delete_all_sync_data(self):
+        pass
+
+
+def test_id_index_matches_set():
+    random = Random(0)
+    index, expected = IDIndex(), set()
+    index.MERGE = 8
+    pool = [str(random.randrange(10**18, 10**19)) for _ in range(64)]
+    pool += ["0123", "abc", str(1 << 64)]
+    index.load(pool[:16])
+    index.build()
+    expected.update(pool[:16])
+    for _ in range(2000):
+        id_ = random.choice(pool)
+        if random.random() < 0.5:
+            index.add(id_)
+            expected.add(id_)
+        else:
+            index.discard(id_)
+            expected.discard(id_)
+        assert all((i in index) == (i in expected) for i in pool)
+        assert len(index) == len(expected)
+
+
+def test_recorder_index_matches_database():
+    async def main():
+        database = Database()
+        database.ids.update({"7300000000000000001", "7300000000000000002"})
+        recorder = DownloadRecorder(database, True, None)
+        assert await recorder.has_ids(
+            ["7300000000000000001", "7300000000000000003"]
+        ) == {"7300000000000000001"}
+        await recorder.update_id("7300000000000000003")
+        await recorder.update_id("7300000000000000004")
+        await recorder.delete_id("7300000000000000004")
+        await recorder.delete_ids("https://www.douyin.com/video/7300000000000000002")
+        await recorder.close()
+        assert database.ids == {"7300000000000000001", "7300000000000000003"}
+        reload = DownloadRecorder(database, True, None)
+        for i in ("1", "2", "3", "4"):
+            id_ = f"730000000000000000{i}"
+            assert await recorder.has_id(id_) == await reload.has_id(id_)
+            assert await reload.has_id(id_) == (id_ in database.ids)
+        await recorder.delete_ids("ALL")
+        assert not database.ids
+        assert not await recorder.has_id("7300000000000000001")
+
+    run(main())
@@ -4,8 +4,10 @@ from .capture import capture_error_request
 from .choose import choose
 from .cleaner import Cleaner
 from .console import ColorfulConsole
+from .decoder import JSON_BACKEND, decode_json
 from .error import CacheError
 from .error import DownloaderError
+from .error import MirrorError
 from .file_folder import file_switch
 from .file_folder import remove_empty_directories
 from .format import (
@@ -15,11 +17,17 @@ from .format import (
     cookie_str_to_str,
     format_size,
 )
+from .limiter import RISK_CODES, RateLimiter, TokenBucket
 from .list_pop import safe_pop
+from .mirror import MirrorSelector
+from .pool import WORKER_TYPES, ResizableSemaphore, WorkerPools
+from .progress import SharedProgress
 from .retry import Retry
 from .session import (
     request_params,
     create_client,
+    ClientPool,
+    close_params_clients,
 )
 from .temporary import random_string
 from .temporary import timestamp
@@ -0,0 +1,52 @@
+from functools import lru_cache
+from json import JSONDecodeError, loads
+from typing import Any
+
+try:
+    from orjson import loads as orjson_loads
+except ImportError:
+    orjson_loads = None
+
+try:
+    from msgspec import DecodeError, ValidationError, to_builtins
+    from msgspec.json import Decoder
+except ImportError:
+    Decoder = None
+
+__all__ = ["decode_json", "JSON_BACKEND"]
+
+# 当前使用的 JSON 解析库，orjson 与 msgspec 均为可选依赖，未安装时使用标准库
+JSON_BACKEND = "orjson" if orjson_loads else "msgspec" if Decoder else "json"
+
+# 风控响应包含 verify 开头的字段，schema 无法声明全部字段名，检测到时回退为完整解析
+RISK_MARKER = b'"verify'
+
+
+@lru_cache(maxsize=None)
+def get_decoder(schema: type = None) -> "Decoder":
+    return Decoder(schema) if schema else Decoder()
+
+
+def decode_json(content: bytes | str, schema: type = None) -> Any:
+    """解析响应内容，解析失败时抛出 JSONDecodeError
+
+    传入 schema 且已安装 msgspec 时，仅解析 schema 声明的字段并转换为 dict；
+    数据结构与 schema 不符或者包含风控字段时回退为完整解析
+    """
+    if Decoder:
+        marker = RISK_MARKER if isinstance(content, bytes) else RISK_MARKER.decode()
+        if schema and marker not in content:
+            try:
+                return to_builtins(get_decoder(schema).decode(content))
+            except ValidationError:
+                pass
+            except DecodeError as e:
+                raise JSONDecodeError(str(e), "", 0) from e
+        if not orjson_loads:
+            try:
+                return get_decoder().decode(content)
+            except DecodeError as e:
+                raise JSONDecodeError(str(e), "", 0) from e
+    if orjson_loads:
+        return orjson_loads(content)
+    return loads(content)
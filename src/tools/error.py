@@ -13,6 +13,15 @@ class DownloaderError(Exception):
         return f"DownloaderError: {self.message}"
 
 
+class MirrorError(Exception):
+    def __init__(self, message: str):
+        super().__init__(message)
+        self.message = message
+
+    def __str__(self):
+        return self.message
+
+
 class CacheError(Exception):
     def __init__(self, message: str):
         super().__init__(message)
@@ -0,0 +1,94 @@
+from asyncio import Lock, sleep
+from time import monotonic
+
+from ..custom import (
+    RATE_LIMIT_BACKOFF,
+    RATE_LIMIT_BACKOFF_MAX,
+    RATE_LIMIT_CAPACITY,
+    RATE_LIMIT_FLOOR,
+)
+
+__all__ = ["TokenBucket", "RateLimiter", "RISK_CODES"]
+
+# 视为触发风控的响应码
+RISK_CODES = {403, 429}
+
+
+class TokenBucket:
+    """令牌桶限速器，rate 为每秒生成的令牌数量，设置为 0 代表不限速
+
+    服务器返回风控响应时调用 penalize 降低速率并暂停请求，请求成功后调用 recover 逐步恢复
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: int = 1,
+    ):
+        self.limit = rate
+        self.rate = rate
+        self.capacity = max(capacity, 1)
+        self.tokens = float(self.capacity)
+        self.updated = monotonic()
+        self.backoff = 0.0
+        self.resume = 0.0
+        self.lock = Lock()
+
+    def __refill(self) -> None:
+        now = monotonic()
+        self.tokens = min(
+            self.capacity,
+            self.tokens + (now - self.updated) * self.rate,
+        )
+        self.updated = now
+
+    async def acquire(self, tokens: int = 1) -> None:
+        if self.limit <= 0 and not self.backoff:
+            return
+        async with self.lock:
+            if (delay := self.resume - monotonic()) > 0:
+                await sleep(delay)
+            if self.limit <= 0:
+                return
+            while True:
+                self.__refill()
+                if self.tokens >= tokens:
+                    self.tokens -= tokens
+                    return
+                await sleep((tokens - self.tokens) / self.rate)
+
+    def penalize(self) -> None:
+        """速率减半并按指数退避暂停请求"""
+        self.backoff = min(
+            self.backoff * 2 or RATE_LIMIT_BACKOFF,
+            RATE_LIMIT_BACKOFF_MAX,
+        )
+        self.resume = monotonic() + self.backoff
+        if self.limit > 0:
+            self.rate = max(self.rate / 2, self.limit * RATE_LIMIT_FLOOR)
+            self.tokens = 0.0
+
+    def recover(self) -> None:
+        """请求成功后逐步恢复至设置的速率"""
+        self.backoff = 0.0
+        if self.rate < self.limit:
+            self.__refill()
+            self.rate = min(self.rate + self.limit * RATE_LIMIT_FLOOR, self.limit)
+
+
+class RateLimiter:
+    """按平台管理令牌桶，未设置的平台不限速
+
+    douyin 与 tiktok 限制获取数据的请求，cdn 限制下载文件的请求
+    """
+
+    def __init__(self, rate_limit: dict[str, int | float]):
+        self.buckets = {
+            key: TokenBucket(value, RATE_LIMIT_CAPACITY)
+            for key, value in rate_limit.items()
+        }
+
+    def __getitem__(self, key: str) -> TokenBucket:
+        if not (bucket := self.buckets.get(key)):
+            bucket = self.buckets[key] = TokenBucket(0)
+        return bucket
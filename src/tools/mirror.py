@@ -0,0 +1,44 @@
+from urllib.parse import urlparse
+
+from ..custom import MIRROR_FAILURE_PENALTY
+
+__all__ = ["MirrorSelector"]
+
+
+class MirrorSelector:
+    """记录 CDN 主机的响应耗时，按耗时由短到长排列镜像地址，未记录的主机优先尝试"""
+
+    ALPHA = 0.3  # 指数移动平均的权重
+
+    def __init__(self):
+        self.latency: dict[str, float] = {}
+
+    @staticmethod
+    def host(url: str) -> str:
+        return urlparse(url).netloc
+
+    def sort(self, urls: list[str]) -> list[str]:
+        return sorted(urls, key=lambda i: self.latency.get(self.host(i), 0))
+
+    def record(self, url: str, seconds: float) -> None:
+        host = self.host(url)
+        if (latency := self.latency.get(host)) is None:
+            self.latency[host] = seconds
+        else:
+            self.latency[host] = latency + self.ALPHA * (seconds - latency)
+
+    def has_faster(self, url: str, urls: list[str]) -> bool:
+        """是否存在未尝试或者响应更快的其他镜像地址"""
+        latency = self.latency.get(host := self.host(url), 0)
+        return any(
+            (other := self.host(i)) != host
+            and (other not in self.latency or self.latency[other] < latency)
+            for i in urls
+        )
+
+    def fail(self, url: str) -> None:
+        host = self.host(url)
+        self.latency[host] = max(
+            self.latency.get(host, 0) * 2,
+            MIRROR_FAILURE_PENALTY,
+        )
@@ -0,0 +1,47 @@
+from asyncio import Condition
+
+__all__ = ["ResizableSemaphore", "WorkerPools", "WORKER_TYPES"]
+
+# 下载文件的类型，每种类型使用独立的并发池
+WORKER_TYPES = ("image", "video", "music", "cover", "live")
+
+
+class ResizableSemaphore:
+    """支持运行时调整上限的信号量，调小上限时不会中断正在运行的任务"""
+
+    def __init__(self, value: int):
+        self.value = value
+        self.active = 0
+        self.condition = Condition()
+
+    async def __aenter__(self):
+        async with self.condition:
+            await self.condition.wait_for(lambda: self.active < self.value)
+            self.active += 1
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        async with self.condition:
+            self.active -= 1
+            self.condition.notify()
+
+    async def resize(self, value: int) -> None:
+        async with self.condition:
+            self.value = value
+            self.condition.notify_all()
+
+
+class WorkerPools:
+    """按文件类型划分的下载并发池"""
+
+    def __init__(self, workers: dict[str, int]):
+        self.pools = {key: ResizableSemaphore(value) for key, value in workers.items()}
+
+    def __getitem__(self, key: str) -> ResizableSemaphore:
+        return self.pools[key]
+
+    async def resize(self, workers: dict[str, int]) -> None:
+        for key, value in workers.items():
+            if pool := self.pools.get(key):
+                await pool.resize(value)
+            else:
+                self.pools[key] = ResizableSemaphore(value)
@@ -0,0 +1,97 @@
+from typing import TYPE_CHECKING
+from weakref import WeakKeyDictionary
+
+from rich.progress import (
+    BarColumn,
+    DownloadColumn,
+    Progress,
+    ProgressColumn,
+    SpinnerColumn,
+    TextColumn,
+    TimeElapsedColumn,
+    TimeRemainingColumn,
+)
+from rich.text import Text
+
+from ..custom import PROGRESS
+
+if TYPE_CHECKING:
+    from rich.console import Console
+    from rich.progress import Task
+
+__all__ = ["SharedProgress"]
+
+
+class TotalSwitchColumn(ProgressColumn):
+    """根据任务总量是否已知选择显示的列"""
+
+    def __init__(
+        self,
+        known: ProgressColumn,
+        unknown: ProgressColumn = None,
+    ):
+        super().__init__()
+        self.known = known
+        self.unknown = unknown
+
+    def render(self, task: "Task"):
+        if task.total is not None:
+            return self.known.render(task)
+        return self.unknown.render(task) if self.unknown else Text("")
+
+
+class SharedProgress:
+    """同一个终端的并发任务共用一个进度条，避免同时启用多个实时显示"""
+
+    __instances: WeakKeyDictionary["Console", "SharedProgress"] = WeakKeyDictionary()
+
+    def __init__(self, console: "Console"):
+        self.progress = Progress(
+            TextColumn(
+                "[progress.description]{task.description}",
+                style=PROGRESS,
+                justify="left",
+            ),
+            SpinnerColumn(),
+            BarColumn(bar_width=20),
+            TotalSwitchColumn(
+                TextColumn("[progress.percentage]{task.percentage:>3.1f}%"),
+            ),
+            "•",
+            TotalSwitchColumn(
+                DownloadColumn(binary_units=True),
+                TimeElapsedColumn(),
+            ),
+            TotalSwitchColumn(
+                TextColumn("•"),
+            ),
+            TotalSwitchColumn(
+                TimeRemainingColumn(),
+            ),
+            console=console,
+            transient=True,
+            expand=True,
+        )
+        self.count = 0
+
+    @classmethod
+    def get(cls, console: "Console") -> "SharedProgress":
+        if not (instance := cls.__instances.get(console)):
+            instance = cls.__instances[console] = cls(console)
+        return instance
+
+    def __enter__(self) -> Progress:
+        if not self.count:
+            self.progress.start()
+        self.count += 1
+        return self.progress
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.count -= 1
+        if not self.count:
+            self.progress.stop()
+            for task_id in self.progress.task_ids:
+                self.progress.remove_task(task_id)
+
+    def __getattr__(self, name: str):
+        return getattr(self.progress, name)
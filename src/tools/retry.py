@@ -1,3 +1,5 @@
+from contextvars import ContextVar
+
 from ..custom import RETRY, wait
 from ..translation import _
 
@@ -7,9 +9,19 @@ __all__ = ["Retry"]
 class Retry:
     """重试器，仅适用于本项目！"""
 
-    @staticmethod
-    def retry(function):
-        """发生错误时尝试重新执行，装饰的函数需要返回布尔值"""
+    FINAL = ContextVar("final_attempt", default=False)
+
+    @classmethod
+    def final_attempt(cls) -> bool:
+        """当前是否为 retry 装饰的函数的最后一次执行"""
+        return cls.FINAL.get()
+
+    @classmethod
+    def retry(cls, function):
+        """发生错误时尝试重新执行，装饰的函数需要返回布尔值，重试前从实例的 limiter 获取令牌
+
+        limiter 未限速时 acquire 立即返回，此时按 wait 设置的间隔时间等待后重试
+        """
 
         async def inner(self, *args, **kwargs):
             finished = kwargs.pop("finished", False)
@@ -17,8 +29,15 @@ class Retry:
                 if result := await function(self, *args, **kwargs):
                     return result
                 self.log.warning(_("正在进行第 {index} 次重试").format(index=i + 1))
-                await wait()
-            if not (result := await function(self, *args, **kwargs)) and finished:
+                await self.limiter.acquire()
+                if self.limiter.limit <= 0:
+                    await wait()
+            token = cls.FINAL.set(True)
+            try:
+                result = await function(self, *args, **kwargs)
+            finally:
+                cls.FINAL.reset(token)
+            if not result and finished:
                 self.finished = True
             return result
 
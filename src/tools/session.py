@@ -1,6 +1,10 @@
+from asyncio import AbstractEventLoop, get_running_loop, to_thread
+from http.cookiejar import CookieJar, DefaultCookiePolicy
+from importlib.util import find_spec
 from typing import TYPE_CHECKING, Union
+from weakref import WeakKeyDictionary
 
-from httpx import AsyncClient, AsyncHTTPTransport, Client, HTTPTransport
+from httpx import AsyncClient, AsyncHTTPTransport, Client, Cookies, HTTPTransport
 
 from ..custom import TIMEOUT, USERAGENT
 from ..tools import DownloaderError
@@ -8,10 +12,20 @@ from .capture import capture_error_params
 from .retry import Retry
 
 if TYPE_CHECKING:
+    from httpx import Response
+
     from ..record import BaseLogger, LoggerManager
     from ..testers import Logger
 
-__all__ = ["request_params", "create_client"]
+__all__ = [
+    "request_params",
+    "create_client",
+    "ClientPool",
+    "close_params_clients",
+]
+
+# 安装 h2 库后启用 HTTP/2
+HTTP2 = find_spec("h2") is not None
 
 
 def create_client(
@@ -19,6 +33,7 @@ def create_client(
     timeout=TIMEOUT,
     headers: dict = None,
     proxy: str = None,
+    http2=False,
     *args,
     **kwargs,
 ) -> AsyncClient:
@@ -31,14 +46,67 @@ def create_client(
         follow_redirects=True,
         verify=False,
         mounts={
-            "http://": AsyncHTTPTransport(proxy=proxy),
-            "https://": AsyncHTTPTransport(proxy=proxy),
+            "http://": AsyncHTTPTransport(proxy=proxy, http2=http2),
+            "https://": AsyncHTTPTransport(proxy=proxy, http2=http2),
         },
         *args,
         **kwargs,
     )
 
 
+class ClientPool:
+    """按代理地址和 User-Agent 复用长连接客户端，客户端在首次使用时创建"""
+
+    def __init__(
+        self,
+        timeout=TIMEOUT,
+        **kwargs,
+    ):
+        self.timeout = timeout
+        self.kwargs = kwargs
+        self.clients: dict[tuple[str, str], AsyncClient] = {}
+
+    def get(
+        self,
+        proxy: str,
+        user_agent=USERAGENT,
+    ) -> AsyncClient:
+        key = (proxy, user_agent)
+        if not (client := self.clients.get(key)) or client.is_closed:
+            client = self.clients[key] = create_client(
+                user_agent=user_agent,
+                timeout=self.timeout,
+                proxy=proxy,
+                **self.kwargs,
+            )
+        return client
+
+    async def close(self) -> None:
+        for client in self.clients.values():
+            await client.aclose()
+        self.clients.clear()
+
+
+# 客户端连接绑定事件循环，每个事件循环使用独立的客户端池
+_PARAMS_POOLS: WeakKeyDictionary[AbstractEventLoop, ClientPool] = WeakKeyDictionary()
+
+
+def params_client_pool() -> ClientPool:
+    loop = get_running_loop()
+    if not (pool := _PARAMS_POOLS.get(loop)):
+        pool = _PARAMS_POOLS[loop] = ClientPool(
+            http2=HTTP2,
+            # 参数请求依赖响应的 Set-Cookie，客户端不保存 Cookie，避免请求之间互相影响
+            cookies=Cookies(CookieJar(DefaultCookiePolicy(allowed_domains=()))),
+        )
+    return pool
+
+
+async def close_params_clients() -> None:
+    if pool := _PARAMS_POOLS.pop(get_running_loop(), None):
+        await pool.close()
+
+
 async def request_params(
     logger: Union[
         "BaseLogger",
@@ -54,33 +122,40 @@ async def request_params(
     headers: dict = None,
     resp="headers",
     proxy: str = None,
+    sync=False,
     **kwargs,
 ):
-    with Client(
-        headers=headers
-        or {
-            "User-Agent": useragent,
-            "Content-Type": "application/json; charset=utf-8",
-            # "Referer": "https://www.douyin.com/"
-        },
-        follow_redirects=True,
-        timeout=timeout,
-        verify=False,
-        mounts={
-            "http://": HTTPTransport(proxy=proxy),
-            "https://": HTTPTransport(proxy=proxy),
-        },
-    ) as client:
-        return await request(
+    """sync 参数为 True 时，使用同步客户端并在工作线程中发送请求"""
+    headers = headers or {
+        "User-Agent": useragent,
+        "Content-Type": "application/json; charset=utf-8",
+        # "Referer": "https://www.douyin.com/"
+    }
+    if sync:
+        return await request_sync(
             logger,
-            client,
             method,
             url,
             resp,
+            proxy,
             params=params,
             data=data,
+            headers=headers,
+            timeout=timeout,
             **kwargs,
         )
+    return await request(
+        logger,
+        params_client_pool().get(proxy, useragent),
+        method,
+        url,
+        resp,
+        params=params,
+        data=data,
+        headers=headers,
+        timeout=timeout,
+        **kwargs,
+    )
 
 
 @Retry.retry_lite
@@ -91,13 +166,47 @@ async def request(
         "LoggerManager",
         "Logger",
     ],
-    client: Client,
+    client: AsyncClient,
+    method: str,
+    url: str,
+    resp="json",
+    **kwargs,
+):
+    response = await client.request(method, url, **kwargs)
+    return extract_response(response, resp)
+
+
+@Retry.retry_lite
+@capture_error_params
+async def request_sync(
+    logger: Union[
+        "BaseLogger",
+        "LoggerManager",
+        "Logger",
+    ],
     method: str,
     url: str,
     resp="json",
+    proxy: str = None,
+    timeout=TIMEOUT,
     **kwargs,
 ):
-    response = client.request(method, url, **kwargs)
+    def inner():
+        with Client(
+            follow_redirects=True,
+            timeout=timeout,
+            verify=False,
+            mounts={
+                "http://": HTTPTransport(proxy=proxy),
+                "https://": HTTPTransport(proxy=proxy),
+            },
+        ) as client:
+            return extract_response(client.request(method, url, **kwargs), resp)
+
+    return await to_thread(inner)
+
+
+def extract_response(response: "Response", resp: str):
     response.raise_for_status()
     match resp:
         case "headers":